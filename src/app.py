@@ -1,4 +1,31 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
+
+from src.core.search import (
+    GEO_INDEX_REFRESH_SECONDS,
+    GEO_INDEX_REBUILD_SECONDS,
+    FACET_INDEX_REBUILD_SECONDS,
+    AUTOCOMPLETE_REBUILD_SECONDS,
+)
+from src.core.ml import ML_MODEL_RELOAD_SECONDS
+from src.core.weather import (
+    OBSERVATION_STATION_RELOAD_SECONDS,
+    WEATHER_PREFETCH_OFFSET_SECONDS,
+    WEATHER_PROBE_INTERVAL_SECONDS,
+)
+from src.dependencies.geo_index import load_restaurant_geo_index, refresh_restaurant_geo_index
+from src.dependencies.facet_index import load_facet_index
+from src.dependencies.autocomplete_index import load_autocomplete_index
+from src.dependencies.observation_stations import load_observation_stations
+from src.dependencies.weather_observations import prefetch_observations, probe_weather_upstream
+from src.dependencies.scheduler import run_periodically, run_hourly, cancel_tasks
+from src.dependencies.http_client import http_client
+from src.dependencies.geocode_cache import geocode_cache
+from src.dependencies.predict import model_registry, inference_worker
 
 from src.routers.index_router import router as index_router
 from src.routers.users_router import router as users_router
@@ -12,6 +39,57 @@ from src.routers.tags_router import router as tags_router
 from src.routers.tag_categories_router import router as tag_categories_router
 from src.routers.reviews_router import router as reviews_router
 from src.routers.restaurants_router import router as restaurants_router
+from src.routers.utilities_router import router as utilities_router
+
+logger = logging.getLogger(__name__)
+
+"""
+Loads in-memory indexes on startup and keeps them fresh in the background.
+If the database is unreachable, the indexes stay empty and searches fall back to SQL.
+시작 시 메모리 인덱스를 적재하고 백그라운드에서 최신 상태로 유지합니다.
+데이터베이스에 연결할 수 없으면 인덱스는 비어 있고 검색은 SQL로 대체됩니다.
+"""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        await run_in_threadpool(load_restaurant_geo_index)
+    except Exception:
+        logger.exception("Restaurant geo index not loaded; radius search falls back to SQL")
+    try:
+        await run_in_threadpool(load_facet_index)
+    except Exception:
+        logger.exception("Facet index not loaded; tag and cuisine filters fall back to SQL")
+    try:
+        await run_in_threadpool(load_autocomplete_index)
+    except Exception:
+        logger.exception("Autocomplete index not loaded; suggestions stay empty until the next rebuild")
+    try:
+        await run_in_threadpool(model_registry.get)
+    except Exception:
+        logger.exception("Model not loaded; it is loaded on the first prediction")
+    try:
+        await run_in_threadpool(load_observation_stations)
+    except Exception:
+        logger.exception("Observation stations not loaded; they are loaded on the first weather lookup")
+
+    tasks = [
+        asyncio.create_task(run_periodically(GEO_INDEX_REFRESH_SECONDS, refresh_restaurant_geo_index)),
+        asyncio.create_task(run_periodically(GEO_INDEX_REBUILD_SECONDS, load_restaurant_geo_index)),
+        asyncio.create_task(run_periodically(FACET_INDEX_REBUILD_SECONDS, load_facet_index)),
+        asyncio.create_task(run_periodically(AUTOCOMPLETE_REBUILD_SECONDS, load_autocomplete_index)),
+        asyncio.create_task(run_periodically(OBSERVATION_STATION_RELOAD_SECONDS, load_observation_stations)),
+        asyncio.create_task(run_periodically(ML_MODEL_RELOAD_SECONDS, model_registry.refresh)),
+        # Weather for every station: once now, then every hour
+        # 모든 관측소의 날씨: 지금 한 번, 이후 매시간
+        asyncio.create_task(prefetch_observations()),
+        asyncio.create_task(run_hourly(WEATHER_PREFETCH_OFFSET_SECONDS, prefetch_observations)),
+        asyncio.create_task(run_periodically(WEATHER_PROBE_INTERVAL_SECONDS, probe_weather_upstream)),
+    ]
+    yield
+    await cancel_tasks(tasks)
+    await run_in_threadpool(http_client.close)
+    geocode_cache.close()
+    await run_in_threadpool(inference_worker.close)
 
 """
 Creates the FastAPI app instance with custom title and OpenAPI tags.
@@ -19,6 +97,7 @@ FastAPI 인스턴스를 생성하고, 제목과 OpenAPI 태그 메타데이터
 """
 app = FastAPI(
     title = "Store Management and Recommendation System API",
+    lifespan = lifespan,
     # openapi_tags = tags_metadata
 )
 
@@ -34,3 +113,4 @@ app.include_router(tags_router, prefix="/tags")
 app.include_router(tag_categories_router, prefix="/tag_categories")
 app.include_router(reviews_router, prefix="/reviews")
 app.include_router(restaurants_router, prefix="/restaurants")
+app.include_router(utilities_router, prefix="/utilities")
@@ -0,0 +1,201 @@
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime
+
+from sqlalchemy import or_, update
+from sqlalchemy.orm import Session
+
+from src.core.database import SessionLocal
+from src.core.map import (
+    GEOCODE_BACKFILL_CONCURRENCY,
+    GEOCODE_BACKFILL_RATE_PER_SECOND,
+    GEOCODE_BACKFILL_BATCH_SIZE,
+    GEOCODE_BACKFILL_CHECKPOINT_PATH,
+)
+from src.dependencies import map as map_api
+# restaurant_model must be imported first to resolve the models' circular imports
+# 모델 간 순환 import를 풀기 위해 restaurant_model을 먼저 import합니다
+from src.models import restaurant_model
+
+"""
+Geocodes the address of every restaurant without coordinates through VWorld and stores the result.
+Requests run concurrently under a rate limit; each batch is written with one bulk UPDATE and the
+last processed ID is saved to a checkpoint file, so an interrupted run resumes where it stopped.
+The checkpoint stays below the first restaurant whose request failed, so the next run retries it:
+
+    PYTHONPATH=. python -m src.commands.backfill_restaurant_coordinates
+
+좌표가 없는 모든 식당의 주소를 VWorld로 지오코딩하여 저장합니다.
+요청은 속도 제한 아래에서 동시에 실행되며, 배치마다 한 번의 일괄 UPDATE로 기록하고
+마지막으로 처리한 ID를 체크포인트 파일에 저장하므로, 중단된 실행은 멈춘 지점부터 재개됩니다.
+체크포인트는 요청이 실패한 첫 식당보다 앞에 머무르므로, 다음 실행에서 다시 시도합니다.
+"""
+
+logger = logging.getLogger(__name__)
+
+
+class _TokenBucket:
+    """
+    Async token bucket allowing rate acquisitions per second, with bursts of up to burst.
+    초당 rate번의 획득을 허용하고 최대 burst번까지 몰아서 허용하는 비동기 토큰 버킷입니다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+# Last restaurant ID processed by a previous run (0 when starting over)
+# 이전 실행에서 마지막으로 처리한 식당 ID (처음부터 시작하면 0)
+def _read_checkpoint(path: str | None):
+    if not path or not os.path.exists(path):
+        return 0
+    with open(path) as f:
+        return int(f.read().strip() or 0)
+
+
+# Write the checkpoint atomically so a crash never leaves a partial file
+# 중단되더라도 불완전한 파일이 남지 않도록 체크포인트를 원자적으로 기록합니다
+def _write_checkpoint(path: str | None, last_id: int):
+    if not path:
+        return
+    temporary = path + ".tmp"
+    with open(temporary, "w") as f:
+        f.write(str(last_id))
+    os.replace(temporary, path)
+
+
+# Outcomes of geocoding one address: resolved, not found by VWorld, or failed (timeouts, 5xx, 429,
+# error or malformed responses) and worth retrying
+# 주소 하나의 지오코딩 결과: 변환 성공, VWorld에서 찾지 못함, 또는 재시도할 가치가 있는 실패
+# (제한 시간 초과, 5xx, 429, 오류 응답 또는 잘못된 형식의 응답)
+FOUND = "found"
+NOT_FOUND = "not_found"
+FAILED = "failed"
+
+
+# (status, (latitude, longitude)) from a VWorld getcoord response; the point is None unless found
+# VWorld getcoord 응답의 (상태, (위도, 경도))를 반환하며, 찾은 경우에만 좌표가 채워집니다
+def _parse_point(data):
+    try:
+        status = data["response"]["status"]
+        if status == "NOT_FOUND":
+            return NOT_FOUND, None
+        if status != "OK":
+            return FAILED, None
+        point = data["response"]["result"]["point"]
+        return FOUND, (float(point["y"]), float(point["x"]))
+    except (KeyError, TypeError, ValueError):
+        return FAILED, None
+
+
+# Geocode one address under the concurrency and rate limits; failures are logged and reported as FAILED
+# 동시성 및 속도 제한 아래에서 주소 하나를 지오코딩합니다. 실패하면 로그를 남기고 FAILED를 반환합니다
+async def _geocode(address: str, semaphore: asyncio.Semaphore, bucket: _TokenBucket):
+    async with semaphore:
+        await bucket.acquire()
+        try:
+            data = await map_api.get_coordinate_by_address(address)
+        except Exception as e:
+            logger.warning("Geocoding failed for %r: %s", address, e)
+            return FAILED, None
+        status, point = _parse_point(data)
+        if status == FAILED:
+            logger.warning("Geocoding failed for %r: %s", address, data)
+        return status, point
+
+
+# Fill in missing coordinates of restaurants after the checkpoint, batch by batch in ID order
+# The checkpoint never moves past a restaurant whose geocoding failed, so the next run retries it
+# (restaurants resolved in the meantime already have coordinates and are not fetched again).
+# Returns counts of processed, updated, unresolved (not found) and failed restaurants.
+# 체크포인트 이후 좌표가 없는 식당을 ID 순서대로 배치 단위로 채웁니다
+# 체크포인트는 지오코딩에 실패한 식당을 넘어 전진하지 않으므로 다음 실행에서 다시 시도합니다
+# (그 사이에 변환된 식당은 이미 좌표가 있으므로 다시 조회하지 않습니다)
+# 처리한 식당, 갱신한 식당, 찾지 못한 식당, 실패한 식당의 수를 반환합니다
+async def backfill_restaurant_coordinates(
+    db: Session,
+    checkpoint_path: str | None = GEOCODE_BACKFILL_CHECKPOINT_PATH,
+    concurrency: int = GEOCODE_BACKFILL_CONCURRENCY,
+    rate: float = GEOCODE_BACKFILL_RATE_PER_SECOND,
+    batch_size: int = GEOCODE_BACKFILL_BATCH_SIZE,
+):
+    Restaurant = restaurant_model.Restaurant
+    semaphore = asyncio.Semaphore(concurrency)
+    bucket = _TokenBucket(rate, burst=concurrency)
+    last_id = _read_checkpoint(checkpoint_path)
+    first_failed_id = None
+    result = {"processed": 0, "updated": 0, "unresolved": 0, "failed": 0}
+
+    while True:
+        rows = db.query(Restaurant.id, Restaurant.address)\
+            .filter(Restaurant.id > last_id, or_(Restaurant.latitude.is_(None), Restaurant.longitude.is_(None)))\
+            .order_by(Restaurant.id)\
+            .limit(batch_size)\
+            .all()
+        if not rows:
+            break
+
+        outcomes = await asyncio.gather(*(_geocode(r.address, semaphore, bucket) for r in rows))
+
+        # updated_at is bumped so the geo index refresh picks the new coordinates up
+        # 위치 인덱스 갱신이 새 좌표를 반영하도록 updated_at도 함께 갱신합니다
+        now = datetime.now()
+        values = [
+            {"id": r.id, "latitude": point[0], "longitude": point[1], "updated_at": now}
+            for r, (status, point) in zip(rows, outcomes) if status == FOUND
+        ]
+        if values:
+            db.execute(update(Restaurant), values)
+            db.commit()
+
+        failed_ids = [r.id for r, (status, _) in zip(rows, outcomes) if status == FAILED]
+        if failed_ids and first_failed_id is None:
+            first_failed_id = failed_ids[0]
+
+        last_id = rows[-1].id
+        _write_checkpoint(checkpoint_path, last_id if first_failed_id is None else first_failed_id - 1)
+
+        result["processed"] += len(rows)
+        result["updated"] += len(values)
+        result["failed"] += len(failed_ids)
+        result["unresolved"] += len(rows) - len(values) - len(failed_ids)
+        logger.info("Backfilled up to restaurant %d: %s", last_id, result)
+
+    if first_failed_id is not None:
+        logger.warning("Geocoding of %d restaurants failed; the next run resumes after restaurant %d",
+                       result["failed"], first_failed_id - 1)
+    return result
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        result = asyncio.run(backfill_restaurant_coordinates(db))
+    finally:
+        db.close()
+        map_api.http_client.close()
+    logger.info("Backfilled restaurant coordinates in %.2fs: %s", time.perf_counter() - started, result)
+
+
+if __name__ == "__main__":
+    main()
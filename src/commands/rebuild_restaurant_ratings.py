@@ -0,0 +1,66 @@
+import logging
+import time
+from datetime import datetime
+
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from src.core.database import SessionLocal, engine
+# restaurant_model must be imported first to resolve the models' circular imports
+# 모델 간 순환 import를 풀기 위해 restaurant_model을 먼저 import합니다
+from src.models import restaurant_model
+from src.models import review_model, restaurant_rating_model
+
+"""
+Recomputes every restaurant's rating summary from the reviews table in one transaction.
+Run after importing reviews in bulk or whenever the summary may have drifted:
+
+    PYTHONPATH=. python -m src.commands.rebuild_restaurant_ratings
+
+reviews 테이블로부터 모든 식당의 평점 요약을 하나의 트랜잭션에서 다시 계산합니다.
+리뷰를 대량으로 적재한 뒤나 요약이 어긋났을 수 있을 때 실행합니다.
+"""
+
+logger = logging.getLogger(__name__)
+
+
+# Replace the summary rows with aggregates of the reviews table; returns the number of restaurants
+# 평점 요약 행을 reviews 테이블 집계 결과로 교체하고, 식당 수를 반환합니다
+def rebuild_restaurant_ratings(db: Session):
+    Review = review_model.Review
+    RestaurantRating = restaurant_rating_model.RestaurantRating
+
+    aggregates = select(
+        Review.restaurant_id,
+        func.count(Review.id),
+        func.count(Review.rating),
+        func.coalesce(func.sum(Review.rating), 0),
+        func.avg(Review.rating),
+        func.max(Review.created_at),
+        literal(datetime.now()),
+    ).where(Review.restaurant_id.is_not(None)).group_by(Review.restaurant_id)
+
+    db.execute(delete(RestaurantRating))
+    db.execute(insert(RestaurantRating).from_select(
+        ["restaurant_id", "review_count", "rating_count", "rating_sum", "avg_rating", "last_reviewed_at", "updated_at"],
+        aggregates,
+    ))
+    db.commit()
+    return db.query(RestaurantRating).count()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    restaurant_rating_model.RestaurantRating.__table__.create(bind=engine, checkfirst=True)
+
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        count = rebuild_restaurant_ratings(db)
+    finally:
+        db.close()
+    logger.info("Rebuilt rating summaries for %d restaurants in %.2fs", count, time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime
+
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+import xgboost
+from sklearn.compose import ColumnTransformer
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+from xgboost import XGBClassifier
+
+from src.core.ml import (
+    ML_MODEL_DIR,
+    ML_MODEL_FILE,
+    ML_PREPROCESSOR_FILE,
+    ML_TRAIN_DATA_PATH,
+    ML_TRAIN_CHUNK_ROWS,
+    ML_TRAIN_NTHREAD,
+)
+from src.dependencies.model_registry import LabeledClassifier, ModelRegistry
+from src.dependencies.predict import FEATURE_COLUMNS, FastPredictor, top_k
+
+"""
+Trains the cuisine type model from the weather CSV and writes a new version directory under
+ML_MODEL_DIR (model.pkl, preprocessor.pkl and report.json), loadable by the model registry.
+The CSV is streamed in chunks with compact dtypes, the split and the booster are seeded, and
+report.json records the parameters, training time, artifact sizes, inference latency and accuracy:
+
+    PYTHONPATH=. python -m src.commands.train_cuisine_model --version v2 --nthread 4 [--activate]
+
+날씨 CSV로 음식 유형 모델을 학습하여 ML_MODEL_DIR 아래에 모델 레지스트리가 로드할 수 있는
+새 버전 디렉터리(model.pkl, preprocessor.pkl, report.json)를 만듭니다.
+CSV는 작은 dtype으로 청크 단위로 읽고, 데이터 분할과 부스터는 시드를 고정하며,
+report.json에 파라미터, 학습 시간, 아티팩트 크기, 추론 지연 시간과 정확도를 기록합니다.
+"""
+
+logger = logging.getLogger(__name__)
+
+LABEL_COLUMN = 'Category'
+
+# Features fit in float32 (XGBoost trains in float32 anyway); labels are read as strings
+# 특성은 float32로 충분하며 (XGBoost는 어차피 float32로 학습합니다), 레이블은 문자열로 읽습니다
+DTYPES = {**{column: np.float32 for column in FEATURE_COLUMNS}, LABEL_COLUMN: str}
+
+
+# Read the training CSV chunk by chunk, dropping incomplete rows as they stream in
+# 학습 CSV를 청크 단위로 읽으며, 불완전한 행은 읽는 즉시 제외합니다
+def read_training_data(path: str, chunk_rows: int = ML_TRAIN_CHUNK_ROWS):
+    chunks = [
+        chunk.dropna()
+        for chunk in pd.read_csv(path, usecols=list(DTYPES), dtype=DTYPES, chunksize=chunk_rows)
+    ]
+    frame = pd.concat(chunks, ignore_index=True)
+    frame[LABEL_COLUMN] = frame[LABEL_COLUMN].astype("category")
+    return frame
+
+
+# Single-row latency percentiles (ms) and batch throughput of the serving path
+# 서비스 경로의 단일 행 지연 시간 백분위수(ms)와 배치 처리량
+def _benchmark(predict_proba, features, rounds: int, batch_rows: int):
+    latencies = []
+    for i in range(rounds):
+        row = features[i % len(features)][None, :]
+        started = time.perf_counter()
+        predict_proba(row)
+        latencies.append(time.perf_counter() - started)
+    latencies = np.array(latencies) * 1000
+
+    batch = np.resize(features, (batch_rows, features.shape[1]))
+    started = time.perf_counter()
+    predict_proba(batch)
+    seconds = time.perf_counter() - started
+
+    return {
+        "single_row_ms": {
+            "p50": float(np.percentile(latencies, 50)),
+            "p99": float(np.percentile(latencies, 99)),
+            "mean": float(latencies.mean()),
+        },
+        "batch": {
+            "rows": batch_rows,
+            "seconds": seconds,
+            "rows_per_second": batch_rows / seconds if seconds else None,
+        },
+    }
+
+
+def _sha256(path: str):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# Train a model version and return its report
+# The version directory is assembled in a hidden temporary directory and renamed into place, so
+# the registry never sees a partial version.
+# 모델 버전을 학습하고 보고서를 반환합니다
+# 버전 디렉터리는 숨김 임시 디렉터리에서 만든 뒤 이름을 바꿔 배치하므로, 레지스트리는 미완성 버전을 보지 않습니다
+def train_cuisine_model(
+    data_path: str = ML_TRAIN_DATA_PATH,
+    model_dir: str = ML_MODEL_DIR,
+    version: str | None = None,
+    nthread: int = ML_TRAIN_NTHREAD,
+    chunk_rows: int = ML_TRAIN_CHUNK_ROWS,
+    n_estimators: int = 200,
+    max_depth: int = 4,
+    learning_rate: float = 0.1,
+    test_size: float = 0.2,
+    seed: int = 42,
+    benchmark_rounds: int = 1000,
+    benchmark_batch_rows: int = 10000,
+    activate: bool = False,
+):
+    version = version or datetime.now().strftime("v%Y%m%d%H%M%S")
+    target = os.path.join(model_dir, version)
+    if os.path.exists(target):
+        raise FileExistsError(f"Model version already exists: {target}")
+
+    started = time.perf_counter()
+    frame = read_training_data(data_path, chunk_rows)
+    read_seconds = time.perf_counter() - started
+
+    encoder = LabelEncoder()
+    labels = encoder.fit_transform(frame[LABEL_COLUMN])
+    train, test, y_train, y_test = train_test_split(
+        frame[FEATURE_COLUMNS], labels, test_size=test_size, random_state=seed, stratify=labels
+    )
+
+    started = time.perf_counter()
+    preprocessor = ColumnTransformer([("num", StandardScaler(), FEATURE_COLUMNS)])
+    booster = XGBClassifier(
+        n_estimators=n_estimators,
+        max_depth=max_depth,
+        learning_rate=learning_rate,
+        tree_method="hist",
+        nthread=nthread or os.cpu_count(),
+        random_state=seed,
+    )
+    booster.fit(preprocessor.fit_transform(train), y_train)
+    train_seconds = time.perf_counter() - started
+    model = LabeledClassifier(booster, encoder.classes_)
+
+    # Evaluate and benchmark through the same path the API serves with
+    # API가 사용하는 것과 같은 경로로 평가하고 벤치마크합니다
+    predictor = FastPredictor.from_artifacts(model, preprocessor)
+    features = test.to_numpy(dtype=np.float64)
+    if predictor is not None:
+        predict_proba = predictor.predict_proba
+    else:
+        predict_proba = lambda rows: model.predict_proba(
+            preprocessor.transform(pd.DataFrame(rows, columns=FEATURE_COLUMNS))
+        )
+    top = top_k(predict_proba(features), 2)
+
+    os.makedirs(model_dir, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix=f".{version}.", dir=model_dir)
+    try:
+        joblib.dump(model, os.path.join(staging, ML_MODEL_FILE))
+        joblib.dump(preprocessor, os.path.join(staging, ML_PREPROCESSOR_FILE))
+
+        report = {
+            "version": version,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "data": {
+                "path": data_path,
+                "sha256": _sha256(data_path),
+                "rows": len(frame),
+                "train_rows": len(train),
+                "test_rows": len(test),
+                "read_seconds": read_seconds,
+            },
+            "params": {
+                "n_estimators": n_estimators,
+                "max_depth": max_depth,
+                "learning_rate": learning_rate,
+                "nthread": booster.get_params()["nthread"],
+                "test_size": test_size,
+                "seed": seed,
+            },
+            "libraries": {"xgboost": xgboost.__version__, "scikit-learn": sklearn.__version__},
+            "classes": encoder.classes_.tolist(),
+            "train_seconds": train_seconds,
+            "model_bytes": os.path.getsize(os.path.join(staging, ML_MODEL_FILE)),
+            "preprocessor_bytes": os.path.getsize(os.path.join(staging, ML_PREPROCESSOR_FILE)),
+            "fast_path": predictor is not None,
+            "accuracy": {
+                "top1": float(np.mean(top[:, 0] == y_test)),
+                "top2": float(np.mean((top == y_test[:, None]).any(axis=1))),
+            },
+            **_benchmark(predict_proba, features, benchmark_rounds, benchmark_batch_rows),
+        }
+        with open(os.path.join(staging, "report.json"), "w") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+        os.chmod(staging, 0o755)
+        os.rename(staging, target)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    # Point ML_MODEL_CURRENT_FILE at the new version; running workers switch on their next check
+    # ML_MODEL_CURRENT_FILE이 새 버전을 가리키게 하며, 실행 중인 워커는 다음 확인 시 전환합니다
+    if activate:
+        ModelRegistry(model_dir).write_current_version(version)
+
+    return report
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Train the cuisine type model")
+    parser.add_argument("--data", default=ML_TRAIN_DATA_PATH)
+    parser.add_argument("--model-dir", default=ML_MODEL_DIR)
+    parser.add_argument("--version")
+    parser.add_argument("--nthread", type=int, default=ML_TRAIN_NTHREAD)
+    parser.add_argument("--chunk-rows", type=int, default=ML_TRAIN_CHUNK_ROWS)
+    parser.add_argument("--n-estimators", type=int, default=200)
+    parser.add_argument("--max-depth", type=int, default=4)
+    parser.add_argument("--learning-rate", type=float, default=0.1)
+    parser.add_argument("--test-size", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--activate", action="store_true")
+    args = parser.parse_args()
+
+    report = train_cuisine_model(
+        data_path=args.data,
+        model_dir=args.model_dir,
+        version=args.version,
+        nthread=args.nthread,
+        chunk_rows=args.chunk_rows,
+        n_estimators=args.n_estimators,
+        max_depth=args.max_depth,
+        learning_rate=args.learning_rate,
+        test_size=args.test_size,
+        seed=args.seed,
+        activate=args.activate,
+    )
+    logger.info("Trained model version %s:\n%s", report["version"], json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
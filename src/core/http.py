@@ -0,0 +1,20 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv(verbose=True)
+
+# Timeouts (seconds) for connecting to and reading from external APIs
+# 외부 API 연결 및 응답 읽기 제한 시간 (초)
+HTTP_CONNECT_TIMEOUT_SECONDS = float(os.getenv('HTTP_CONNECT_TIMEOUT_SECONDS', 3))
+HTTP_READ_TIMEOUT_SECONDS = float(os.getenv('HTTP_READ_TIMEOUT_SECONDS', 10))
+
+# Connection pool size and concurrent request limit per upstream
+# 외부 서비스별 연결 풀 크기와 동시 요청 수 제한
+HTTP_MAX_CONNECTIONS = int(os.getenv('HTTP_MAX_CONNECTIONS', 20))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv('HTTP_MAX_KEEPALIVE_CONNECTIONS', 10))
+HTTP_MAX_CONCURRENCY = int(os.getenv('HTTP_MAX_CONCURRENCY', 10))
+
+# Retries after a timeout, connection error, 429 or 5xx, with jittered exponential backoff (seconds)
+# 시간 초과, 연결 오류, 429, 5xx 이후 재시도 횟수와 지터가 적용된 지수 백오프 기준 시간 (초)
+HTTP_RETRIES = int(os.getenv('HTTP_RETRIES', 2))
+HTTP_RETRY_BACKOFF_SECONDS = float(os.getenv('HTTP_RETRY_BACKOFF_SECONDS', 0.2))
@@ -5,3 +5,20 @@ load_dotenv(verbose=True)
 
 VWORLD_API_URL = os.getenv('VWORLD_API_URL')
 VWORLD_API_KEY = os.getenv('VWORLD_API_KEY')
+
+# SQLite file holding cached VWorld geocoding results, and how long entries stay valid (seconds, default 30 days)
+# VWorld 지오코딩 결과를 캐시하는 SQLite 파일과 항목 유효 기간 (초, 기본 30일)
+GEOCODE_CACHE_PATH = os.getenv('GEOCODE_CACHE_PATH', 'geocode_cache.sqlite3')
+GEOCODE_CACHE_TTL_SECONDS = int(os.getenv('GEOCODE_CACHE_TTL_SECONDS', 30 * 24 * 3600))
+
+# Decimal places kept from coordinates in reverse geocoding keys (4 ≈ 10 m)
+# 역지오코딩 캐시 키에 사용할 좌표의 소수점 자릿수 (4 ≈ 10 m)
+GEOCODE_CACHE_COORDINATE_DECIMALS = int(os.getenv('GEOCODE_CACHE_COORDINATE_DECIMALS', 4))
+
+# Coordinate backfill command: concurrent VWorld requests, requests per second,
+# restaurants per bulk UPDATE, and the checkpoint file used to resume
+# 좌표 보정 명령: 동시 VWorld 요청 수, 초당 요청 수, 일괄 UPDATE당 식당 수, 재개에 사용하는 체크포인트 파일
+GEOCODE_BACKFILL_CONCURRENCY = int(os.getenv('GEOCODE_BACKFILL_CONCURRENCY', 8))
+GEOCODE_BACKFILL_RATE_PER_SECOND = float(os.getenv('GEOCODE_BACKFILL_RATE_PER_SECOND', 50))
+GEOCODE_BACKFILL_BATCH_SIZE = int(os.getenv('GEOCODE_BACKFILL_BATCH_SIZE', 500))
+GEOCODE_BACKFILL_CHECKPOINT_PATH = os.getenv('GEOCODE_BACKFILL_CHECKPOINT_PATH', 'geocode_backfill.checkpoint')
@@ -3,13 +3,56 @@ from dotenv import load_dotenv
 
 load_dotenv(verbose=True)
 
-ML_MODEL_DIR = os.getenv('ML_MODEL_DIR')
+ML_MODEL_DIR = os.getenv('ML_MODEL_DIR', 'models')
 ML_MODEL_VERSION = os.getenv('ML_MODEL_VERSION')
-ML_MODEL_FILE = os.getenv('ML_MODEL_FILE')
-ML_PREPROCESSOR_FILE = os.getenv('ML_PREPROCESSOR_FILE')
+ML_MODEL_FILE = os.getenv('ML_MODEL_FILE', 'model.pkl')
+ML_PREPROCESSOR_FILE = os.getenv('ML_PREPROCESSOR_FILE', 'preprocessor.pkl')
 
-def get_model_path():
-  return os.path.join(ML_MODEL_DIR, ML_MODEL_VERSION, ML_MODEL_FILE)
+# File under ML_MODEL_DIR naming the version to serve; every worker switches to it on its next check
+# ML_MODEL_DIR 아래에서 제공할 버전 이름을 담는 파일로, 모든 워커가 다음 확인 시 해당 버전으로 전환합니다
+ML_MODEL_CURRENT_FILE = os.getenv('ML_MODEL_CURRENT_FILE', 'CURRENT')
 
-def get_preprocessor_path():
-  return os.path.join(ML_MODEL_DIR, ML_MODEL_VERSION, ML_PREPROCESSOR_FILE)
+# Seconds between checks of ML_MODEL_CURRENT_FILE for a new version
+# 새 버전이 있는지 ML_MODEL_CURRENT_FILE을 확인하는 주기 (초)
+ML_MODEL_RELOAD_SECONDS = int(os.getenv('ML_MODEL_RELOAD_SECONDS', 60))
+
+# Artifact paths of a model version (default: ML_MODEL_VERSION under ML_MODEL_DIR), or None when no version is given
+# 모델 버전의 아티팩트 경로 (기본값: ML_MODEL_DIR 아래의 ML_MODEL_VERSION), 버전이 없으면 None
+def get_model_path(version: str | None = None, model_dir: str | None = None):
+  version = version or ML_MODEL_VERSION
+  if not version:
+    return None
+  return os.path.join(model_dir or ML_MODEL_DIR, version, ML_MODEL_FILE)
+
+def get_preprocessor_path(version: str | None = None, model_dir: str | None = None):
+  version = version or ML_MODEL_VERSION
+  if not version:
+    return None
+  return os.path.join(model_dir or ML_MODEL_DIR, version, ML_PREPROCESSOR_FILE)
+
+# Maximum number of weather rows accepted by POST /utilities/predict_cuisine_type_by_weather/batch
+# POST /utilities/predict_cuisine_type_by_weather/batch 에서 한 번에 받을 수 있는 최대 날씨 행 수
+ML_PREDICT_BATCH_MAX_ROWS = int(os.getenv('ML_PREDICT_BATCH_MAX_ROWS', 10000))
+
+# Cache of single-row predictions: inputs are rounded to this many decimals (sensor resolution,
+# e.g. 0.1 °C and 0.1 hPa) before the lookup, and at most this many entries are kept
+# 단일 행 예측 캐시: 조회 전에 입력을 이 소수점 자릿수(센서 분해능, 예: 0.1 °C, 0.1 hPa)로 반올림하며,
+# 최대 이 개수의 항목을 보관합니다
+ML_PREDICTION_CACHE_DECIMALS = int(os.getenv('ML_PREDICTION_CACHE_DECIMALS', 1))
+ML_PREDICTION_CACHE_MAXSIZE = int(os.getenv('ML_PREDICTION_CACHE_MAXSIZE', 4096))
+
+# Inference worker: largest batch scored in one model call, and how long the first request of a
+# batch waits for others to join (seconds)
+# 추론 워커: 한 번의 모델 호출로 예측할 최대 배치 크기와, 배치의 첫 요청이 다른 요청을 기다리는 시간 (초)
+ML_INFERENCE_BATCH_SIZE = int(os.getenv('ML_INFERENCE_BATCH_SIZE', 64))
+ML_INFERENCE_MAX_WAIT_SECONDS = float(os.getenv('ML_INFERENCE_MAX_WAIT_SECONDS', 0.002))
+
+# Training command defaults: source CSV, rows read per chunk and XGBoost threads (0 = all cores)
+# 학습 명령 기본값: 원본 CSV, 청크당 읽을 행 수, XGBoost 스레드 수 (0이면 모든 코어)
+ML_TRAIN_DATA_PATH = os.getenv('ML_TRAIN_DATA_PATH', 'src/ml_models/weather_data_updated.csv')
+ML_TRAIN_CHUNK_ROWS = int(os.getenv('ML_TRAIN_CHUNK_ROWS', 100000))
+ML_TRAIN_NTHREAD = int(os.getenv('ML_TRAIN_NTHREAD', 0))
+
+# Classes kept per station in the hourly station prediction table (and added to coordinate searches)
+# 매시간 관측소 예측 테이블에 관측소마다 보관하는 클래스 수 (좌표 검색에 추가되는 음식 유형 수)
+ML_STATION_PREDICTION_COUNT = int(os.getenv('ML_STATION_PREDICTION_COUNT', 2))
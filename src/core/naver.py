@@ -0,0 +1,15 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv(verbose=True)
+
+NAVER_SEARCH_KEYWORDS_URL = os.getenv('NAVER_SEARCH_KEYWORDS_URL', 'https://mac.search.naver.com/mobile/ac')
+
+# Cache of Naver search suggestions: entry lifetime (seconds) and maximum number of queries
+# 네이버 추천 검색어 캐시: 항목 유지 시간(초)과 최대 검색어 수
+NAVER_CACHE_TTL_SECONDS = float(os.getenv('NAVER_CACHE_TTL_SECONDS', 600))
+NAVER_CACHE_MAXSIZE = int(os.getenv('NAVER_CACHE_MAXSIZE', 4096))
+
+# Upstream requests allowed in flight at once; further distinct queries are rejected with 503
+# 동시에 진행할 수 있는 외부 요청 수이며, 이를 넘는 새로운 검색어는 503으로 거부됩니다
+NAVER_MAX_PENDING_REQUESTS = int(os.getenv('NAVER_MAX_PENDING_REQUESTS', 32))
@@ -0,0 +1,52 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv(verbose=True)
+
+# Seconds between incremental refreshes of the in-memory restaurant geo index
+# 메모리 내 식당 위치 인덱스를 증분 갱신하는 주기 (초)
+GEO_INDEX_REFRESH_SECONDS = int(os.getenv('GEO_INDEX_REFRESH_SECONDS', 60))
+
+# Seconds behind the refresh watermark that every incremental refresh reads again, so rows committed late
+# (a long transaction, or clock skew between workers) with an older updated_at are still picked up
+# 증분 갱신마다 워터마크보다 이 시간(초)만큼 앞부터 다시 읽으므로, 늦게 커밋된 행(긴 트랜잭션이나
+# 워커 간 시계 차이)의 이전 updated_at도 반영됩니다
+GEO_INDEX_REFRESH_OVERLAP_SECONDS = int(os.getenv('GEO_INDEX_REFRESH_OVERLAP_SECONDS', 60))
+
+# Seconds between full rebuilds of the geo index (picks up deleted rows)
+# 위치 인덱스를 전체 재구성하는 주기 (초, 삭제된 행 반영)
+GEO_INDEX_REBUILD_SECONDS = int(os.getenv('GEO_INDEX_REBUILD_SECONDS', 3600))
+
+# Seconds between full rebuilds of the tag / cuisine type facet index (picks up other workers' writes)
+# 태그/음식 유형 패싯 인덱스를 전체 재구성하는 주기 (초, 다른 워커의 변경 반영)
+FACET_INDEX_REBUILD_SECONDS = int(os.getenv('FACET_INDEX_REBUILD_SECONDS', 60))
+
+# Age (seconds since the last rebuild) after which searches stop using the facet index and query SQL,
+# e.g. while rebuilds keep failing
+# 마지막 재구성 이후 이 시간(초)이 지나면 검색은 패싯 인덱스 대신 SQL을 사용합니다 (예: 재구성이 계속 실패할 때)
+FACET_INDEX_MAX_AGE_SECONDS = int(os.getenv('FACET_INDEX_MAX_AGE_SECONDS', 180))
+
+# Response cache for GET /restaurants: entry lifetime (seconds) and maximum number of entries
+# GET /restaurants 응답 캐시: 항목 유지 시간(초)과 최대 항목 수
+RESTAURANT_CACHE_TTL_SECONDS = float(os.getenv('RESTAURANT_CACHE_TTL_SECONDS', 60))
+RESTAURANT_CACHE_MAXSIZE = int(os.getenv('RESTAURANT_CACHE_MAXSIZE', 1024))
+
+# Decimal places kept from coordinates in the cache key (3 ≈ 100 m)
+# 캐시 키에 사용할 좌표의 소수점 자릿수 (3 ≈ 100 m)
+RESTAURANT_CACHE_COORDINATE_DECIMALS = int(os.getenv('RESTAURANT_CACHE_COORDINATE_DECIMALS', 3))
+
+# Maximum number of IDs accepted by GET /restaurants/batch
+# GET /restaurants/batch 에서 한 번에 조회할 수 있는 최대 ID 수
+RESTAURANT_BATCH_MAX_IDS = int(os.getenv('RESTAURANT_BATCH_MAX_IDS', 500))
+
+# Seconds between full rebuilds of the autocomplete prefix index
+# 자동완성 접두사 인덱스를 전체 재구성하는 주기 (초)
+AUTOCOMPLETE_REBUILD_SECONDS = int(os.getenv('AUTOCOMPLETE_REBUILD_SECONDS', 600))
+
+# Maximum number of suggestions returned by GET /utilities/autocomplete
+# GET /utilities/autocomplete 에서 반환하는 최대 추천어 수
+AUTOCOMPLETE_MAX_LIMIT = int(os.getenv('AUTOCOMPLETE_MAX_LIMIT', 50))
+
+# Time budget per keystroke for the optional Naver suggestions (seconds)
+# 선택적인 네이버 추천어의 입력당 허용 시간 (초)
+AUTOCOMPLETE_NAVER_TIMEOUT_SECONDS = float(os.getenv('AUTOCOMPLETE_NAVER_TIMEOUT_SECONDS', 0.3))
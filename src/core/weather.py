@@ -7,3 +7,31 @@ DATA_GO_KR_API_KEY_ENCODED = os.getenv('DATA_GO_KR_API_KEY_ENCODED')
 DATA_GO_KR_API_KEY_DECODED = os.getenv('DATA_GO_KR_API_KEY_DECODED')
 DATA_GO_KR_API_URL_USN = os.getenv('DATA_GO_KR_API_URL_USN')
 DATA_GO_KR_API_URL_WDL = os.getenv('DATA_GO_KR_API_URL_WDL')
+
+# Maximum number of cached ASOS observation responses (one per station and hour)
+# 캐시할 ASOS 관측 응답의 최대 개수 (관측소, 시간별 하나)
+WEATHER_CACHE_MAXSIZE = int(os.getenv('WEATHER_CACHE_MAXSIZE', 1024))
+
+# Seconds between full reloads of the in-memory observation station index
+# 메모리 관측소 인덱스를 전체 재적재하는 주기 (초)
+OBSERVATION_STATION_RELOAD_SECONDS = int(os.getenv('OBSERVATION_STATION_RELOAD_SECONDS', 3600))
+
+# Observations of every station are prefetched this many seconds after each hour boundary,
+# with at most WEATHER_PREFETCH_CONCURRENCY requests at a time
+# 매 정각 이후 이 시간(초)이 지나면 모든 관측소의 관측 데이터를 미리 가져오며,
+# 동시에 최대 WEATHER_PREFETCH_CONCURRENCY 개의 요청을 보냅니다
+WEATHER_PREFETCH_OFFSET_SECONDS = int(os.getenv('WEATHER_PREFETCH_OFFSET_SECONDS', 60))
+WEATHER_PREFETCH_CONCURRENCY = int(os.getenv('WEATHER_PREFETCH_CONCURRENCY', 8))
+
+# Longest a restaurant search waits for an observation that is not in memory (seconds)
+# 메모리에 없는 관측값을 식당 검색에서 기다리는 최대 시간 (초)
+WEATHER_REQUEST_TIMEOUT_SECONDS = float(os.getenv('WEATHER_REQUEST_TIMEOUT_SECONDS', 3))
+
+# Consecutive failures that open the weather circuit, and seconds between background probes while open
+# 날씨 회로를 여는 연속 실패 횟수와, 열려 있는 동안 백그라운드 점검 간격 (초)
+WEATHER_BREAKER_FAILURE_THRESHOLD = int(os.getenv('WEATHER_BREAKER_FAILURE_THRESHOLD', 3))
+WEATHER_PROBE_INTERVAL_SECONDS = int(os.getenv('WEATHER_PROBE_INTERVAL_SECONDS', 30))
+
+# Cuisine types (comma-separated) used instead of the weather prediction when no observation is available
+# 관측값을 구할 수 없을 때 날씨 예측 대신 사용할 음식 유형 (쉼표로 구분)
+WEATHER_DEFAULT_CUISINE_TYPES = os.getenv('WEATHER_DEFAULT_CUISINE_TYPES', '')
@@ -0,0 +1,283 @@
+import asyncio
+import bisect
+import logging
+import threading
+import time
+import unicodedata
+
+import numpy as np
+from fastapi import Query
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from src.core.database import SessionLocal
+from src.core.search import (
+    AUTOCOMPLETE_MAX_LIMIT,
+    AUTOCOMPLETE_NAVER_TIMEOUT_SECONDS,
+)
+from src.models import (
+    restaurant_model,
+    restaurant_rating_model,
+    keyword_model,
+    restaurant_keyword_model,
+    tag_model,
+    restaurant_tag_model,
+    cuisine_type_model,
+    restaurant_cuisine_type_model
+)
+from src.dependencies.naver_serach_keywords import get_naver_search_keywords
+
+"""
+Process-local prefix index for autocomplete over keyword, tag, cuisine type and restaurant names.
+Names are decomposed into Hangul jamo, so a half-typed syllable ("국ㅂ") already matches "국밥",
+and initial-consonant queries ("ㄱㅂ") match through a second key per name. Keys live in sorted
+lists searched with bisect; matches are ranked by popularity (restaurants per keyword / tag /
+cuisine type, reviews per restaurant). Naver suggestions can be mixed in as a cached secondary source.
+
+키워드, 태그, 음식 유형, 식당 이름에 대한 프로세스 내 자동완성 접두사 인덱스입니다.
+이름을 한글 자모로 분해하므로 입력 중인 음절("국ㅂ")도 "국밥"과 일치하며, 초성 검색("ㄱㅂ")은
+이름마다 두 번째 키로 처리합니다. 키는 정렬된 리스트에 두고 bisect로 검색하며, 결과는 인기도
+(키워드/태그/음식 유형별 식당 수, 식당별 리뷰 수) 순으로 정렬합니다. 네이버 추천어는 캐시된
+보조 소스로 함께 사용할 수 있습니다.
+"""
+
+logger = logging.getLogger(__name__)
+
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+              "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+# Compound vowels and final consonants are typed as two keys, so they are split into two jamo
+# 복합 모음과 겹받침은 두 번 입력하므로 자모 두 개로 나눕니다
+_COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+
+_SYLLABLE_FIRST, _SYLLABLE_LAST = 0xAC00, 0xD7A3
+
+# Index every name from at most this many word starts ("강남 국밥" is also found by "국밥")
+# 이름마다 최대 이 개수의 단어 시작 위치부터 색인합니다 ("강남 국밥"은 "국밥"으로도 검색됩니다)
+_MAX_WORD_STARTS = 4
+
+# Sorts after every character, closing a prefix range
+# 모든 문자보다 뒤에 정렬되어 접두사 범위를 닫습니다
+_PREFIX_END = "\U0010ffff"
+
+
+def _normalize(text: str):
+    return unicodedata.normalize("NFC", text).lower()
+
+
+# str.translate tables from Hangul syllables (and compound jamo) to jamo / initial consonants
+# 한글 음절(및 복합 자모)을 자모 / 초성으로 바꾸는 str.translate 테이블
+_JAMO_TABLE = {ord(c): jamo for c, jamo in _COMPOUND_JAMO.items()}
+_CHOSEONG_TABLE = {}
+for _code in range(_SYLLABLE_LAST - _SYLLABLE_FIRST + 1):
+    _cho, _jung, _jong = _CHOSEONG[_code // 588], _JUNGSEONG[_code // 28 % 21], _JONGSEONG[_code % 28]
+    _JAMO_TABLE[_SYLLABLE_FIRST + _code] = _cho + _COMPOUND_JAMO.get(_jung, _jung) + _COMPOUND_JAMO.get(_jong, _jong)
+    _CHOSEONG_TABLE[_SYLLABLE_FIRST + _code] = _cho
+
+
+# Hangul jamo sequence of a text without whitespace ("국밥" -> "ㄱㅜㄱㅂㅏㅂ")
+# 공백을 제외한 텍스트의 한글 자모 시퀀스 ("국밥" -> "ㄱㅜㄱㅂㅏㅂ")
+def to_jamo(text: str):
+    return "".join(_normalize(text).split()).translate(_JAMO_TABLE)
+
+
+# Initial consonants of a text without whitespace; other characters are kept ("국밥 2" -> "ㄱㅂ2")
+# 공백을 제외한 텍스트의 초성이며, 한글 음절이 아닌 문자는 그대로 둡니다 ("국밥 2" -> "ㄱㅂ2")
+def to_choseong(text: str):
+    return "".join(_normalize(text).split()).translate(_CHOSEONG_TABLE)
+
+
+def _is_choseong_query(text: str):
+    return bool(text) and all(c in _CHOSEONG for c in text)
+
+
+# Suffixes of a name starting at each of its first _MAX_WORD_STARTS words
+# 이름의 앞쪽 _MAX_WORD_STARTS개 단어 각각에서 시작하는 접미사
+def _word_starts(name: str):
+    words = name.split()
+    return [" ".join(words[i:]) for i in range(min(len(words), _MAX_WORD_STARTS))] or [name]
+
+
+class AutocompleteIndex:
+    """
+    Sorted jamo and initial-consonant keys over (type, name) entries, replaced as a whole on load.
+    (유형, 이름) 항목에 대한 정렬된 자모 키와 초성 키로, 적재할 때 전체가 교체됩니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ready = False
+        # (entries, jamo keys, jamo entry positions, choseong keys, choseong entry positions)
+        # (항목, 자모 키, 자모 항목 위치, 초성 키, 초성 항목 위치)
+        self._state = ([], [], np.empty(0, dtype=np.int64), [], np.empty(0, dtype=np.int64))
+        self._loaded_at = None
+        self._load_seconds = None
+
+    @property
+    def ready(self):
+        return self._ready
+
+    # Replace the index with (type, name, popularity) rows; popularity of repeated names is summed
+    # (유형, 이름, 인기도) 행으로 인덱스를 교체합니다. 같은 이름의 인기도는 합산합니다
+    def load(self, rows):
+        started = time.perf_counter()
+
+        popularity = {}
+        for kind, name, score in rows:
+            name = " ".join((name or "").split())
+            if name:
+                popularity[(kind, name)] = popularity.get((kind, name), 0) + (score or 0)
+
+        # Entries ordered by rank (most popular first, then by name), so a smaller position ranks higher
+        # 순위 순서(인기도가 높은 순, 같으면 이름 순)의 항목으로, 위치가 작을수록 순위가 높습니다
+        entries = sorted(((kind, name, score) for (kind, name), score in popularity.items()),
+                         key=lambda e: (-e[2], e[1], e[0]))
+
+        starts = [(start, position) for position, (_, name, _) in enumerate(entries) for start in _word_starts(name)]
+
+        def build(key_of):
+            keys = [key_of(start) for start, _ in starts]
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            return [keys[i] for i in order], np.array([starts[i][1] for i in order], dtype=np.int64)
+
+        jamo_keys, jamo_positions = build(to_jamo)
+        choseong_keys, choseong_positions = build(to_choseong)
+
+        with self._lock:
+            self._state = (entries, jamo_keys, jamo_positions, choseong_keys, choseong_positions)
+            self._ready = True
+            self._loaded_at = time.time()
+            self._load_seconds = time.perf_counter() - started
+
+    # Up to limit entries whose name (or one of its words) starts with the query, most popular first
+    # 이름(또는 이름의 단어)이 검색어로 시작하는 항목을 인기도 순으로 최대 limit개 반환합니다
+    def suggest(self, query: str, limit: int = 10):
+        entries, jamo_keys, jamo_positions, choseong_keys, choseong_positions = self._state
+
+        compact = "".join(_normalize(query).split())
+        if not compact or limit <= 0:
+            return []
+        if _is_choseong_query(compact):
+            keys, positions, prefix = choseong_keys, choseong_positions, compact
+        else:
+            keys, positions, prefix = jamo_keys, jamo_positions, to_jamo(compact)
+
+        start = bisect.bisect_left(keys, prefix)
+        end = bisect.bisect_left(keys, prefix + _PREFIX_END, start)
+        matched = positions[start:end]
+
+        # An entry appears at most once per word start, so the best limit * _MAX_WORD_STARTS
+        # positions always hold the best limit distinct entries
+        # 항목은 단어 시작 위치마다 최대 한 번 나타나므로, 상위 limit * _MAX_WORD_STARTS개 위치에
+        # 항상 상위 limit개의 서로 다른 항목이 포함됩니다
+        k = limit * _MAX_WORD_STARTS
+        if len(matched) > k:
+            matched = np.partition(matched, k - 1)[:k]
+        best = np.unique(matched)[:limit]
+
+        return [{"name": entries[p][1], "type": entries[p][0], "score": entries[p][2]} for p in best.tolist()]
+
+    # Report index size and load timings
+    # 인덱스 크기와 로드 시간을 반환합니다
+    def stats(self):
+        entries, jamo_keys, _, choseong_keys, _ = self._state
+        return {
+            "ready": self._ready,
+            "entries": len(entries),
+            "keys": len(jamo_keys) + len(choseong_keys),
+            "loaded_at": self._loaded_at,
+            "load_seconds": self._load_seconds,
+        }
+
+
+# Shared autocomplete index
+# 공유 자동완성 인덱스
+autocomplete_index = AutocompleteIndex()
+
+
+# Load (type, name, popularity) rows for keywords, tags, cuisine types and restaurants
+# 키워드, 태그, 음식 유형, 식당의 (유형, 이름, 인기도) 행을 적재합니다
+def load_autocomplete_index(db: Session | None = None):
+    Keyword = keyword_model.Keyword
+    RestaurantKeyword = restaurant_keyword_model.RestaurantKeyword
+    Tag = tag_model.Tag
+    RestaurantTag = restaurant_tag_model.RestaurantTag
+    CuisineType = cuisine_type_model.CuisineType
+    RestaurantCuisineType = restaurant_cuisine_type_model.RestaurantCuisineType
+    Restaurant = restaurant_model.Restaurant
+    RestaurantRating = restaurant_rating_model.RestaurantRating
+
+    session = db or SessionLocal()
+    try:
+        rows = []
+        for kind, query in (
+            ("keyword", session.query(Keyword.name, func.count(RestaurantKeyword.restaurant_id))
+                .outerjoin(RestaurantKeyword, RestaurantKeyword.keyword_id == Keyword.id).group_by(Keyword.id)),
+            ("tag", session.query(Tag.name, func.count(RestaurantTag.restaurant_id))
+                .outerjoin(RestaurantTag, RestaurantTag.tag_id == Tag.id).group_by(Tag.id)),
+            ("cuisine_type", session.query(CuisineType.name, func.count(RestaurantCuisineType.restaurant_id))
+                .outerjoin(RestaurantCuisineType, RestaurantCuisineType.cuisine_type_id == CuisineType.id)
+                .group_by(CuisineType.id)),
+            ("restaurant", session.query(Restaurant.name, func.coalesce(RestaurantRating.review_count, 0))
+                .outerjoin(RestaurantRating, RestaurantRating.restaurant_id == Restaurant.id)),
+        ):
+            rows.extend((kind, name, count) for name, count in query.all())
+        autocomplete_index.load(rows)
+    finally:
+        if db is None:
+            session.close()
+
+    logger.info("Loaded autocomplete index: %s", autocomplete_index.stats())
+
+
+# Suggestion strings of a Naver autocomplete response ({"items": [[["국밥", ...], ...], ...]})
+# 네이버 자동완성 응답의 추천어 문자열 ({"items": [[["국밥", ...], ...], ...]})
+def _parse_naver_suggestions(data):
+    suggestions = []
+    for group in (data or {}).get("items", []) or []:
+        for item in group or []:
+            text = item[0] if isinstance(item, list) and item else item
+            if isinstance(text, str) and text:
+                suggestions.append(text)
+    return suggestions
+
+
+# Naver suggestions for a query within the per-keystroke time budget; empty on timeout or error
+# (responses are cached by get_naver_search_keywords, and a timed-out load still fills the cache)
+# 입력당 허용 시간 안에 네이버 추천어를 조회하며, 시간 초과나 오류 시 빈 목록을 반환합니다
+# (응답은 get_naver_search_keywords에서 캐시되며, 시간 초과된 로드도 캐시를 채웁니다)
+async def _get_naver_suggestions(query: str):
+    try:
+        return _parse_naver_suggestions(
+            await asyncio.wait_for(get_naver_search_keywords(query), AUTOCOMPLETE_NAVER_TIMEOUT_SECONDS)
+        )
+    except Exception as e:
+        logger.warning("Naver suggestions unavailable for %r: %r", query, e)
+        return []
+
+
+# Autocomplete suggestions from the local index, topped up with Naver suggestions when naver is set
+# 로컬 인덱스의 자동완성 추천어를 반환하며, naver가 설정되면 네이버 추천어로 부족분을 채웁니다
+async def get_autocomplete_suggestions(
+    query: str,
+    limit: int = Query(10, ge=1, le=AUTOCOMPLETE_MAX_LIMIT),
+    naver: bool = False,
+):
+    suggestions = autocomplete_index.suggest(query, limit)
+
+    if naver and len(suggestions) < limit:
+        names = {s["name"] for s in suggestions}
+        for name in await _get_naver_suggestions(query):
+            if len(suggestions) >= limit:
+                break
+            if name not in names:
+                names.add(name)
+                suggestions.append({"name": name, "type": "naver", "score": None})
+
+    return {"query": query, "suggestions": suggestions}
@@ -0,0 +1,187 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+"""
+In-process caches with per-entry expiry, bounded LRU eviction and hit/miss counters.
+항목별 만료, 크기 제한 LRU 제거, 적중/미스 카운터를 제공하는 프로세스 내 캐시입니다.
+"""
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after ttl seconds (or at an explicit time).
+    ttl 초 후(또는 지정한 시각에) 항목이 만료되는 스레드 안전 LRU 캐시입니다.
+    """
+
+    def __init__(self, name: str, maxsize: int = 1024, ttl: float | None = 60):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        # Bumped by clear(); values computed before an invalidation are not stored
+        # clear()마다 증가하며, 무효화 이전에 계산된 값은 저장하지 않습니다
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        # key -> Future of the load in progress, shared by concurrent misses
+        # key -> 진행 중인 로드의 Future로, 동시에 발생한 미스가 공유합니다
+        self._loading = {}
+        self._loads = 0
+        self._waits = 0
+
+    @property
+    def generation(self):
+        return self._generation
+
+    # Return the cached value, or default when absent or expired
+    # 캐시된 값을 반환하며, 없거나 만료된 경우 default를 반환합니다
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._lookup(key)
+            if value is _MISSING:
+                self._misses += 1
+                return default
+            self._hits += 1
+            return value
+
+    # Fresh value for key or _MISSING (caller holds the lock)
+    # key의 유효한 값 또는 _MISSING을 반환합니다 (호출자가 잠금을 보유)
+    def _lookup(self, key):
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    # Return the cached value or call loader() once, however many threads miss the same key at once
+    # Concurrent callers wait for the load in progress; loader errors are raised to all of them and not cached.
+    # Only values for which cacheable(value) is true are stored.
+    # 캐시된 값을 반환하거나, 같은 키에 동시에 미스가 나더라도 loader()를 한 번만 호출합니다
+    # 동시 호출자는 진행 중인 로드를 기다리며, loader 오류는 모두에게 전달되고 캐시되지 않습니다
+    # cacheable(value)가 참인 값만 저장합니다
+    def get_or_load(self, key, loader, expires_at: float | None = None, cacheable=None):
+        value, future, generation = self._begin_load(key)
+        if value is not _MISSING:
+            return value
+        if generation is None:
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            self._fail_load(key, future, e)
+            raise
+        self._finish_load(key, future, generation, value, expires_at, cacheable)
+        return value
+
+    # Async variant of get_or_load for coroutine loaders; waiting callers do not block the event loop
+    # The load runs as its own task, so a cancelled caller (e.g. on timeout) does not abort it for the others.
+    # 코루틴 loader를 위한 get_or_load의 비동기 버전으로, 대기 중인 호출자는 이벤트 루프를 막지 않습니다
+    # 로드는 별도 작업으로 실행되므로, 호출자가 (예: 시간 초과로) 취소되어도 다른 호출자의 로드는 계속됩니다
+    async def get_or_load_async(self, key, loader, expires_at: float | None = None, cacheable=None):
+        value, future, generation = self._begin_load(key)
+        if value is not _MISSING:
+            return value
+
+        if generation is not None:
+            def done(task):
+                if task.cancelled():
+                    with self._lock:
+                        self._loading.pop(key, None)
+                    future.cancel()
+                elif task.exception() is not None:
+                    self._fail_load(key, future, task.exception())
+                else:
+                    self._finish_load(key, future, generation, task.result(), expires_at, cacheable)
+
+            asyncio.ensure_future(loader()).add_done_callback(done)
+
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    # Return (value, None, None) on a hit; otherwise the shared Future and, for the caller that
+    # must run the loader, the current generation (None for callers that only wait)
+    # 적중하면 (value, None, None)을 반환하고, 아니면 공유 Future와 함께
+    # loader를 실행할 호출자에게는 현재 generation을 반환합니다 (대기만 하는 호출자는 None)
+    def _begin_load(self, key):
+        with self._lock:
+            value = self._lookup(key)
+            if value is not _MISSING:
+                self._hits += 1
+                return value, None, None
+            self._misses += 1
+
+            future = self._loading.get(key)
+            if future is not None:
+                self._waits += 1
+                return _MISSING, future, None
+
+            future = self._loading[key] = Future()
+            self._loads += 1
+            return _MISSING, future, self._generation
+
+    def _finish_load(self, key, future, generation, value, expires_at, cacheable):
+        if cacheable is None or cacheable(value):
+            self.set(key, value, expires_at=expires_at, generation=generation)
+        with self._lock:
+            self._loading.pop(key, None)
+        future.set_result(value)
+
+    def _fail_load(self, key, future, error):
+        with self._lock:
+            self._loading.pop(key, None)
+        future.set_exception(error)
+
+    # Store a value; expires_at overrides the default ttl, generation guards against stale writes
+    # 값을 저장합니다. expires_at은 기본 ttl보다 우선하며, generation은 오래된 값의 저장을 막습니다
+    def set(self, key, value, expires_at: float | None = None, generation: int | None = None):
+        if expires_at is None and self.ttl is not None:
+            expires_at = time.time() + self.ttl
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    # Drop every entry
+    # 모든 항목을 삭제합니다
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._invalidations += 1
+
+    # Report size and hit/miss counters
+    # 크기와 적중/미스 카운터를 반환합니다
+    def stats(self):
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "name": self.name,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "loads": self._loads,
+                "waits": self._waits,
+                "loading": len(self._loading),
+            }
@@ -0,0 +1,70 @@
+import threading
+import time
+
+"""
+Circuit breaker for an unreliable upstream.
+After failure_threshold consecutive failures the circuit opens and callers stop
+calling the upstream (they use their fallback immediately) until a success,
+typically from a background probe, closes it again.
+
+불안정한 외부 서비스를 위한 서킷 브레이커입니다.
+연속 실패가 failure_threshold 회에 이르면 회로가 열리고, 호출자는 외부 서비스를
+호출하지 않고 즉시 대체 값을 사용합니다. 이후 (주로 백그라운드 점검의) 성공으로 다시 닫힙니다.
+"""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe closed/open state with failure counters.
+    실패 카운터를 가진 스레드 안전한 닫힘/열림 상태입니다.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 3):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._short_circuits = 0
+        self._failures = 0
+        self._last_error = None
+
+    @property
+    def is_open(self):
+        return self._opened_at is not None
+
+    # Whether a caller may call the upstream now (counts the calls that were refused)
+    # 호출자가 지금 외부 서비스를 호출해도 되는지 여부 (거부된 호출 수를 기록합니다)
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            self._short_circuits += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._consecutive_failures = 0
+            self._opened_at = None
+
+    def record_failure(self, error: BaseException | None = None):
+        with self._lock:
+            self._failures += 1
+            self._consecutive_failures += 1
+            self._last_error = repr(error) if error is not None else None
+            if self._opened_at is None and self._consecutive_failures >= self.failure_threshold:
+                self._opened_at = time.time()
+
+    # Report the state and counters
+    # 상태와 카운터를 반환합니다
+    def stats(self):
+        with self._lock:
+            return {
+                "name": self.name,
+                "state": "open" if self._opened_at is not None else "closed",
+                "opened_at": self._opened_at,
+                "consecutive_failures": self._consecutive_failures,
+                "failures": self._failures,
+                "short_circuits": self._short_circuits,
+                "last_error": self._last_error,
+            }
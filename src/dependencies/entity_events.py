@@ -0,0 +1,96 @@
+from collections import namedtuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+"""
+Commit-time change notifications for ORM entities.
+In-process caches and indexes subscribe to a set of models and receive the
+rows that were inserted, updated or deleted once the transaction commits.
+
+ORM 엔티티의 커밋 시점 변경 알림을 제공합니다.
+프로세스 내 캐시와 인덱스는 모델을 구독하고, 트랜잭션이 커밋되면
+삽입/수정/삭제된 행 정보를 전달받습니다.
+"""
+
+# A single committed change: operation ("insert" | "update" | "delete"), model class, column values
+# and, for updates, the column values before the change
+# 커밋된 단일 변경 정보: 작업 종류, 모델 클래스, 컬럼 값, 그리고 수정인 경우 변경 전 컬럼 값
+EntityChange = namedtuple("EntityChange", ["op", "model", "values", "previous"], defaults=[None])
+
+_PENDING_KEY = "entity_events.pending"
+
+_subscribers = []
+
+
+# Register a callback receiving the committed changes of the given models
+# 지정한 모델들의 커밋된 변경 사항을 전달받을 콜백을 등록합니다
+def subscribe(models, callback):
+    _subscribers.append((tuple(models), callback))
+
+
+# Snapshot column values while the object is still loaded (after commit it is expired)
+# 커밋 후에는 만료되므로 플러시 시점에 컬럼 값을 미리 복사합니다
+def _snapshot(obj):
+    mapper = inspect(obj).mapper
+    return {attr.key: getattr(obj, attr.key) for attr in mapper.column_attrs}
+
+
+# Column values before the pending changes (attribute history is still intact in after_flush)
+# 대기 중인 변경 이전의 컬럼 값 (after_flush 시점에는 속성 이력이 남아 있습니다)
+def _previous(obj):
+    state = inspect(obj)
+    previous = {}
+    for attr in state.mapper.column_attrs:
+        history = state.attrs[attr.key].history
+        previous[attr.key] = history.deleted[0] if history.deleted else getattr(obj, attr.key)
+    return previous
+
+
+# Queue a change made outside the ORM unit of work (e.g. a Core upsert), dispatched with the
+# session's other changes when it commits and discarded when it rolls back
+# values only holds the columns the statement knows about.
+# ORM 작업 단위 밖에서 일어난 변경(예: Core upsert)을 등록하며, 세션의 다른 변경과 함께
+# 커밋 시 전달되고 롤백 시 버려집니다. values에는 구문이 아는 컬럼만 담깁니다
+def publish(session, change: EntityChange):
+    if _subscribers:
+        session.info.setdefault(_PENDING_KEY, []).append(change)
+
+
+def _is_watched(obj):
+    return any(isinstance(obj, models) for models, _ in _subscribers)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session, flush_context):
+    if not _subscribers:
+        return
+
+    pending = session.info.setdefault(_PENDING_KEY, [])
+
+    for obj in session.new:
+        if _is_watched(obj):
+            pending.append(EntityChange("insert", type(obj), _snapshot(obj)))
+    for obj in session.dirty:
+        if _is_watched(obj) and session.is_modified(obj, include_collections=False):
+            pending.append(EntityChange("update", type(obj), _snapshot(obj), _previous(obj)))
+    for obj in session.deleted:
+        if _is_watched(obj):
+            pending.append(EntityChange("delete", type(obj), _snapshot(obj)))
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_changes(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+
+    for models, callback in _subscribers:
+        changes = [c for c in pending if issubclass(c.model, models)]
+        if changes:
+            callback(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session):
+    session.info.pop(_PENDING_KEY, None)
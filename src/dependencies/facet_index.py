@@ -0,0 +1,430 @@
+import logging
+import threading
+import time
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from src.core.database import SessionLocal
+from src.core.search import FACET_INDEX_MAX_AGE_SECONDS
+from src.models import (
+    restaurant_model,
+    tag_model,
+    restaurant_tag_model,
+    cuisine_type_model,
+    restaurant_cuisine_type_model
+)
+from src.dependencies import entity_events
+
+"""
+Process-local inverted index from tags, cuisine types and cuisine type categories
+to sorted NumPy arrays of restaurant IDs, plus the restaurant sort keys needed to
+cut a result page without asking the database for every matching ID.
+
+태그, 음식 유형, 음식 유형 카테고리를 정렬된 식당 ID NumPy 배열로 매핑하는 프로세스 내
+역색인입니다. 일치하는 모든 ID를 데이터베이스에서 조회하지 않고도 결과 페이지를 자를 수
+있도록 식당 정렬 키도 함께 보관합니다.
+"""
+
+logger = logging.getLogger(__name__)
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+# NULL timestamps sort first in ascending order, as in MySQL
+# MySQL과 같이 NULL 시각은 오름차순에서 가장 앞에 정렬됩니다
+_NULL_KEY = np.iinfo(np.int64).min
+
+
+def _sort_key(value):
+    return _NULL_KEY if value is None else int(np.datetime64(value, "us").astype(np.int64))
+
+
+# Group (facet_id, restaurant_id) pairs into {facet_id: sorted unique restaurant IDs}
+# (facet_id, restaurant_id) 쌍을 {facet_id: 정렬된 고유 식당 ID}로 묶습니다
+def _build_postings(pairs):
+    if not pairs:
+        return {}
+    pairs = np.unique(np.asarray(pairs, dtype=np.int64), axis=0)
+    facet_ids, starts = np.unique(pairs[:, 0], return_index=True)
+    return {int(f): ids for f, ids in zip(facet_ids, np.split(pairs[:, 1], starts[1:]))}
+
+
+def _insert_sorted(array, value):
+    position = np.searchsorted(array, value)
+    if position < len(array) and array[position] == value:
+        return array
+    return np.insert(array, position, value)
+
+
+def _remove_sorted(array, value):
+    position = np.searchsorted(array, value)
+    if position < len(array) and array[position] == value:
+        return np.delete(array, position)
+    return array
+
+
+# Positions in sorted restaurant_ids of the given sorted IDs (unknown IDs are skipped)
+# 정렬된 ID들의 restaurant_ids 내 위치 (없는 ID는 제외)
+def _positions_of(restaurant_ids, ids):
+    if not len(restaurant_ids):
+        return _EMPTY
+    positions = np.minimum(np.searchsorted(restaurant_ids, ids), len(restaurant_ids) - 1)
+    return positions[restaurant_ids[positions] == ids]
+
+
+# Copy of a dict with one key replaced (value None removes the key)
+# 키 하나를 교체한 딕셔너리 사본 (값이 None이면 키를 삭제)
+def _replace(mapping, key, value):
+    mapping = dict(mapping)
+    if value is None:
+        mapping.pop(key, None)
+    else:
+        mapping[key] = value
+    return mapping
+
+
+# Apply one association row change to a copied {facet_id: restaurant IDs} dict
+# 연결 테이블 행 하나의 변경을 복사한 {facet_id: 식당 ID} 딕셔너리에 반영합니다
+def _apply_association(postings, facet_key, change):
+    def remove(values):
+        ids = _remove_sorted(postings.get(values[facet_key], _EMPTY), values["restaurant_id"])
+        if len(ids):
+            postings[values[facet_key]] = ids
+        else:
+            postings.pop(values[facet_key], None)
+
+    if change.op == "delete":
+        remove(change.values)
+        return
+    if change.op == "update" and change.previous is not None:
+        remove(change.previous)
+    postings[change.values[facet_key]] = _insert_sorted(postings.get(change.values[facet_key], _EMPTY),
+                                                        change.values["restaurant_id"])
+
+
+# Union of sorted ID arrays
+# 정렬된 ID 배열들의 합집합
+def union(arrays):
+    arrays = [a for a in arrays if len(a)]
+    if not arrays:
+        return _EMPTY
+    return np.unique(np.concatenate(arrays))
+
+
+# Intersection of sorted ID arrays
+# 정렬된 ID 배열들의 교집합
+def intersection(arrays):
+    arrays = sorted(arrays, key=len)
+    result = arrays[0]
+    for a in arrays[1:]:
+        result = np.intersect1d(result, a, assume_unique=True)
+    return result
+
+
+class FacetIndex:
+    """
+    Copy-on-write posting lists: every change builds new arrays and dicts and swaps them in,
+    so readers never see a half-applied change or a dict changing while they iterate it.
+    쓰기 시 복사 방식의 포스팅 목록으로, 변경마다 새 배열과 딕셔너리를 만들어 교체하므로
+    읽는 쪽은 반쯤 적용된 변경이나 순회 중에 바뀌는 딕셔너리를 보지 않습니다.
+    """
+
+    # Orderings that can be paged in memory
+    # 메모리에서 페이지를 자를 수 있는 정렬 기준
+    SORT_KEYS = ("created_at", "updated_at")
+
+    def __init__(self, max_age: float | None = None):
+        # Seconds after a load during which the index may answer searches; writes of other processes
+        # only arrive with the next load, so an older index is reported as not ready
+        # 적재 후 인덱스가 검색에 응답할 수 있는 시간 (초)으로, 다른 프로세스의 변경은 다음 적재 때에만
+        # 반영되므로 이보다 오래된 인덱스는 준비되지 않은 것으로 보고합니다
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._ready = False
+        self._restaurant_ids = _EMPTY
+        self._sort_keys = {key: _EMPTY for key in self.SORT_KEYS}
+        self._tags = {}
+        self._cuisine_types = {}
+        self._categories = {}
+        self._tag_postings = {}
+        self._cuisine_type_postings = {}
+        # Cached (names, name index, restaurant position) arrays used by count()
+        # count()에서 사용하는 (이름, 이름 인덱스, 식당 위치) 배열 캐시
+        self._pairs = None
+        self._loaded_at = None
+        self._load_seconds = None
+
+    # Loaded, and recently enough to reflect other processes' writes
+    # 적재되었고, 다른 프로세스의 변경을 반영할 만큼 최근에 적재되었는지 여부
+    @property
+    def ready(self):
+        return self._ready and (self.max_age is None or time.time() - self._loaded_at <= self.max_age)
+
+    # Replace the whole index from table rows
+    # 테이블 행으로 인덱스 전체를 교체합니다
+    def load(self, restaurants, tags, cuisine_types, categories, restaurant_tags, restaurant_cuisine_types):
+        started = time.perf_counter()
+
+        restaurants = sorted(restaurants, key=lambda r: r[0])
+        restaurant_ids = np.array([r[0] for r in restaurants], dtype=np.int64)
+        sort_keys = {
+            "created_at": np.array([_sort_key(r[1]) for r in restaurants], dtype=np.int64),
+            "updated_at": np.array([_sort_key(r[2]) for r in restaurants], dtype=np.int64),
+        }
+
+        with self._lock:
+            self._restaurant_ids = restaurant_ids
+            self._sort_keys = sort_keys
+            # tag_id -> name, cuisine_type_id -> (name, category_id), category_id -> name
+            # tag_id -> 이름, cuisine_type_id -> (이름, category_id), category_id -> 이름
+            self._tags = dict(tags)
+            self._cuisine_types = {id: (name, category_id) for id, name, category_id in cuisine_types}
+            self._categories = dict(categories)
+            self._tag_postings = _build_postings(restaurant_tags)
+            self._cuisine_type_postings = _build_postings(restaurant_cuisine_types)
+            self._pairs = None
+            self._ready = True
+            self._loaded_at = time.time()
+            self._load_seconds = time.perf_counter() - started
+
+    # Restaurant IDs having any of the given tag names
+    # 주어진 태그 이름 중 하나라도 가진 식당 ID
+    def ids_by_tags(self, names):
+        names = set(names)
+        tags, postings = self._tags, self._tag_postings
+        return union([postings.get(id, _EMPTY) for id, name in tags.items() if name in names])
+
+    # Restaurant IDs having any of the given cuisine type names
+    # 주어진 음식 유형 이름 중 하나라도 가진 식당 ID
+    def ids_by_cuisine_types(self, names):
+        names = set(names)
+        cuisine_types, postings = self._cuisine_types, self._cuisine_type_postings
+        return union([postings.get(id, _EMPTY) for id, (name, _) in cuisine_types.items() if name in names])
+
+    # Restaurant IDs having a cuisine type in any of the given categories
+    # 주어진 카테고리 중 하나에 속한 음식 유형을 가진 식당 ID
+    def ids_by_cuisine_type_categories(self, names):
+        names = set(names)
+        category_ids = {id for id, name in self._categories.items() if name in names}
+        cuisine_types, postings = self._cuisine_types, self._cuisine_type_postings
+        return union([postings.get(id, _EMPTY) for id, (_, c) in cuisine_types.items() if c in category_ids])
+
+    # Sorted IDs of every indexed restaurant
+    # 인덱스에 있는 모든 식당의 정렬된 ID
+    def all_ids(self):
+        return self._restaurant_ids
+
+    # Order the given IDs (None = all restaurants) and return one page of them
+    # 주어진 ID(None이면 전체 식당)를 정렬하여 한 페이지만 반환합니다
+    def page(self, ids, order_by: str, descending: bool, skip: int, limit: int):
+        with self._lock:
+            restaurant_ids, keys = self._restaurant_ids, self._sort_keys[order_by]
+
+        if ids is None:
+            positions = np.arange(len(restaurant_ids))
+        else:
+            positions = _positions_of(restaurant_ids, ids)
+
+        order = np.lexsort((restaurant_ids[positions], keys[positions]))
+        if descending:
+            order = order[::-1]
+        return restaurant_ids[positions[order[skip:skip + limit]]].tolist()
+
+    # Count matching restaurants per tag, cuisine type and category name (ids None = all restaurants)
+    # 태그, 음식 유형, 카테고리 이름별로 일치하는 식당 수를 집계합니다 (ids가 None이면 전체 식당)
+    def count(self, ids):
+        with self._lock:
+            pairs = self._pairs
+            if pairs is None:
+                pairs = self._pairs = self._build_pairs()
+
+        lookup, facets = pairs["lookup"], pairs["facets"]
+        size = pairs["size"]
+        if ids is None:
+            total = size
+        else:
+            positions = lookup[ids[ids < len(lookup)]]
+            positions = positions[positions >= 0]
+            total = len(positions)
+            # Large result sets are cheaper to count with a mask over all rows
+            # 결과 집합이 크면 전체 행에 대한 마스크로 집계하는 편이 빠릅니다
+            matched = None
+            if total > size // 8:
+                matched = np.zeros(size, dtype=bool)
+                matched[positions] = True
+
+        result = {"total": total}
+        for facet_name, (names, name_index, rows, indptr) in facets.items():
+            if ids is None:
+                counts = np.bincount(name_index, minlength=len(names))
+            elif matched is not None:
+                counts = np.bincount(name_index, weights=matched[rows], minlength=len(names)).astype(np.int64)
+            else:
+                # Gather the name slices of the matched restaurants only (CSR rows)
+                # 일치한 식당의 이름 구간(CSR 행)만 모읍니다
+                starts = indptr[positions]
+                lengths = indptr[positions + 1] - starts
+                offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+                counts = np.bincount(name_index[np.arange(offsets.size) + offsets], minlength=len(names))
+
+            nonzero = np.flatnonzero(counts)
+            nonzero = nonzero[np.lexsort((nonzero, -counts[nonzero]))]
+            result[facet_name] = [{"name": names[i], "count": int(counts[i])} for i in nonzero]
+        return result
+
+    # Restaurant -> facet name rows in CSR form: names of restaurant position p are
+    # name_index[indptr[p]:indptr[p + 1]] (rows holds p for every entry), one entry per distinct name
+    # 식당 -> 패싯 이름 관계를 CSR 형태로 만듭니다: 위치 p 식당의 이름은
+    # name_index[indptr[p]:indptr[p + 1]]이며 (rows는 각 항목의 p), 이름마다 한 번만 포함됩니다
+    def _build_pairs(self):
+        restaurant_ids = self._restaurant_ids
+        cuisine_types = self._cuisine_types
+        size = len(restaurant_ids)
+
+        def flatten(postings, name_of):
+            named = [(name_of(f), ids) for f, ids in postings.items() if name_of(f) is not None]
+            names = sorted({name for name, _ in named})
+            lookup = {name: i for i, name in enumerate(names)}
+            if not named or not size:
+                return names, _EMPTY, _EMPTY, np.zeros(size + 1, dtype=np.int64)
+
+            name_index = np.concatenate([np.full(len(ids), lookup[name], dtype=np.int64) for name, ids in named])
+            ids = np.concatenate([ids for _, ids in named])
+            positions = np.minimum(np.searchsorted(restaurant_ids, ids), size - 1)
+            known = restaurant_ids[positions] == ids
+
+            keys = np.unique(positions[known] * len(names) + name_index[known])
+            rows = keys // len(names)
+            indptr = np.searchsorted(rows, np.arange(size + 1))
+            return names, keys % len(names), rows, indptr
+
+        # Dense restaurant ID -> position table (-1 when absent); IDs are auto-increment
+        # 식당 ID -> 위치 조회 테이블 (없으면 -1), ID는 자동 증가 값입니다
+        lookup = np.full(int(restaurant_ids[-1]) + 1 if size else 0, -1, dtype=np.int64)
+        lookup[restaurant_ids] = np.arange(size)
+
+        category_of = lambda f: self._categories.get(cuisine_types[f][1]) if f in cuisine_types else None
+        return {
+            "size": size,
+            "lookup": lookup,
+            "facets": {
+                "tags": flatten(self._tag_postings, self._tags.get),
+                "cuisine_types": flatten(self._cuisine_type_postings,
+                                         lambda f: cuisine_types[f][0] if f in cuisine_types else None),
+                "cuisine_type_categories": flatten(self._cuisine_type_postings, category_of),
+            },
+        }
+
+    # Apply committed changes of restaurants, tags, cuisine types and their associations
+    # Posting dicts are copied, changed and swapped in with one assignment, so readers iterating the
+    # previous dict are unaffected. An association update moves the posting from the old pair to the new one.
+    # 커밋된 식당, 태그, 음식 유형 및 연결 테이블 변경을 반영합니다
+    # 포스팅 딕셔너리는 복사본을 수정한 뒤 한 번의 대입으로 교체하므로, 이전 딕셔너리를 순회하는 쪽은
+    # 영향을 받지 않습니다. 연결 테이블 수정은 이전 쌍의 포스팅을 새 쌍으로 옮깁니다
+    def apply(self, changes):
+        if not self._ready:
+            return
+
+        with self._lock:
+            tag_postings = dict(self._tag_postings)
+            cuisine_type_postings = dict(self._cuisine_type_postings)
+
+            for change in changes:
+                model, values, deleted = change.model, change.values, change.op == "delete"
+
+                if model is restaurant_model.Restaurant:
+                    self._apply_restaurant(values, deleted)
+                elif model is restaurant_tag_model.RestaurantTag:
+                    _apply_association(tag_postings, "tag_id", change)
+                elif model is restaurant_cuisine_type_model.RestaurantCuisineType:
+                    _apply_association(cuisine_type_postings, "cuisine_type_id", change)
+                elif model is tag_model.Tag:
+                    self._tags = _replace(self._tags, values["id"], None if deleted else values["name"])
+                elif model is cuisine_type_model.CuisineType:
+                    self._cuisine_types = _replace(self._cuisine_types, values["id"],
+                        None if deleted else (values["name"], values["cuisine_type_category_id"]))
+                elif model is cuisine_type_model.CuisineTypeCategory:
+                    self._categories = _replace(self._categories, values["id"], None if deleted else values["name"])
+
+            self._tag_postings = tag_postings
+            self._cuisine_type_postings = cuisine_type_postings
+            self._pairs = None
+
+    def _apply_restaurant(self, values, deleted):
+        ids = self._restaurant_ids
+        position = np.searchsorted(ids, values["id"])
+        exists = position < len(ids) and ids[position] == values["id"]
+
+        if deleted:
+            if exists:
+                self._restaurant_ids = np.delete(ids, position)
+                self._sort_keys = {k: np.delete(a, position) for k, a in self._sort_keys.items()}
+            return
+
+        if exists:
+            sort_keys = {k: a.copy() for k, a in self._sort_keys.items()}
+            for k in self.SORT_KEYS:
+                sort_keys[k][position] = _sort_key(values[k])
+            self._sort_keys = sort_keys
+        else:
+            self._restaurant_ids = np.insert(ids, position, values["id"])
+            self._sort_keys = {k: np.insert(a, position, _sort_key(values[k])) for k, a in self._sort_keys.items()}
+
+    # Report index size and load timings
+    # 인덱스 크기와 로드 시간을 반환합니다
+    def stats(self):
+        return {
+            "ready": self.ready,
+            "restaurants": len(self._restaurant_ids),
+            "tags": len(self._tag_postings),
+            "cuisine_types": len(self._cuisine_type_postings),
+            "cuisine_type_categories": len(self._categories),
+            "loaded_at": self._loaded_at,
+            "load_seconds": self._load_seconds,
+            "max_age": self.max_age,
+        }
+
+
+# Shared facet index for restaurant search
+# 식당 검색용 공유 패싯 인덱스
+facet_index = FacetIndex(max_age=FACET_INDEX_MAX_AGE_SECONDS)
+
+
+# Load restaurants, facets and association tables into the index
+# 식당, 패싯 및 연결 테이블을 인덱스에 적재합니다
+def load_facet_index(db: Session | None = None):
+    Restaurant = restaurant_model.Restaurant
+    Tag = tag_model.Tag
+    CuisineType = cuisine_type_model.CuisineType
+    CuisineTypeCategory = cuisine_type_model.CuisineTypeCategory
+    RestaurantTag = restaurant_tag_model.RestaurantTag
+    RestaurantCuisineType = restaurant_cuisine_type_model.RestaurantCuisineType
+
+    session = db or SessionLocal()
+    try:
+        facet_index.load(
+            restaurants=session.query(Restaurant.id, Restaurant.created_at, Restaurant.updated_at).all(),
+            tags=session.query(Tag.id, Tag.name).all(),
+            cuisine_types=session.query(CuisineType.id, CuisineType.name, CuisineType.cuisine_type_category_id).all(),
+            categories=session.query(CuisineTypeCategory.id, CuisineTypeCategory.name).all(),
+            restaurant_tags=session.query(RestaurantTag.tag_id, RestaurantTag.restaurant_id).all(),
+            restaurant_cuisine_types=session.query(RestaurantCuisineType.cuisine_type_id, RestaurantCuisineType.restaurant_id).all(),
+        )
+    finally:
+        if db is None:
+            session.close()
+
+    logger.info("Loaded facet index: %s", facet_index.stats())
+
+
+entity_events.subscribe(
+    [
+        restaurant_model.Restaurant,
+        tag_model.Tag,
+        cuisine_type_model.CuisineType,
+        cuisine_type_model.CuisineTypeCategory,
+        restaurant_tag_model.RestaurantTag,
+        restaurant_cuisine_type_model.RestaurantCuisineType,
+    ],
+    lambda changes: facet_index.apply(changes),
+)
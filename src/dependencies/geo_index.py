@@ -0,0 +1,324 @@
+import logging
+import threading
+import time
+from datetime import timedelta
+
+import numpy as np
+from scipy.spatial import cKDTree
+from sqlalchemy.orm import Session
+
+from src.core.database import SessionLocal
+from src.core.search import GEO_INDEX_REFRESH_OVERLAP_SECONDS
+from src.models import restaurant_model
+from src.dependencies import entity_events
+
+"""
+Process-local spatial index answering radius queries over latitude/longitude points.
+Points are stored as unit vectors in a KD-tree, so a great-circle radius becomes a
+chord radius; candidates are then filtered with the exact haversine distance.
+
+위도/경도 지점에 대한 반경 검색을 처리하는 프로세스 내 공간 인덱스입니다.
+지점을 단위 벡터로 변환해 KD-트리에 저장하므로 대원 거리 반경은 현 길이 반경이 되며,
+후보는 정확한 하버사인 거리로 다시 필터링됩니다.
+"""
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0
+
+# Pending changes above this size trigger a tree rebuild instead of a linear overlay scan
+# 대기 중인 변경이 이 크기를 넘으면 선형 탐색 대신 트리를 재구성합니다
+OVERLAY_REBUILD_SIZE = 1024
+
+
+# Great-circle distance in kilometers (accepts scalars or NumPy arrays)
+# 두 지점 간 대원 거리(km)를 계산합니다 (스칼라 또는 NumPy 배열)
+def haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) * 0.5) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) * 0.5) ** 2
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+# Convert latitude/longitude (degrees) to 3D unit vectors
+# 위도/경도(도)를 3차원 단위 벡터로 변환합니다
+def _to_unit_vectors(lat, lon):
+    lat = np.radians(np.asarray(lat, dtype=np.float64))
+    lon = np.radians(np.asarray(lon, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+# Chord length on the unit sphere for a great-circle distance
+# 대원 거리에 해당하는 단위 구 위의 현 길이
+def _chord_length(distance_km):
+    return 2.0 * np.sin(min(distance_km / EARTH_RADIUS_KM, np.pi) * 0.5)
+
+
+class GeoIndex:
+    """
+    KD-tree snapshot plus a small overlay of incremental upserts/removals.
+    KD-트리 스냅샷과 증분 추가/삭제를 담는 작은 오버레이로 구성됩니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._ids = np.empty(0, dtype=np.int64)
+        self._lat = np.empty(0, dtype=np.float64)
+        self._lon = np.empty(0, dtype=np.float64)
+        self._tree = None
+        # id -> (latitude, longitude), or None when the point was removed
+        # id -> (위도, 경도), 삭제된 경우 None
+        self._overlay = {}
+        self._loaded_at = None
+        self._load_seconds = None
+
+    @property
+    def ready(self):
+        return self._tree is not None
+
+    # Replace the whole index with the given (id, latitude, longitude) rows
+    # 주어진 (id, 위도, 경도) 행으로 인덱스 전체를 교체합니다
+    def load(self, rows, overlay=None):
+        started = time.perf_counter()
+        points = [(i, lat, lon) for i, lat, lon in rows if lat is not None and lon is not None]
+        ids = np.fromiter((p[0] for p in points), dtype=np.int64, count=len(points))
+        lat = np.fromiter((p[1] for p in points), dtype=np.float64, count=len(points))
+        lon = np.fromiter((p[2] for p in points), dtype=np.float64, count=len(points))
+        # Keep points ordered by id so distances() can look them up with a binary search
+        # distances()에서 이진 탐색으로 찾을 수 있도록 지점을 id 순으로 정렬합니다
+        order = np.argsort(ids, kind="stable")
+        ids, lat, lon = ids[order], lat[order], lon[order]
+        tree = cKDTree(_to_unit_vectors(lat, lon)) if len(points) else cKDTree(np.empty((0, 3)))
+
+        with self._lock:
+            self._ids, self._lat, self._lon, self._tree = ids, lat, lon, tree
+            if overlay is None:
+                self._overlay = {}
+            else:
+                # Keep only changes that arrived while the tree was being built
+                # 트리를 만드는 동안 들어온 변경만 남깁니다
+                self._overlay = {i: p for i, p in self._overlay.items() if i not in overlay or overlay[i] is not p}
+            self._loaded_at = time.time()
+            self._load_seconds = time.perf_counter() - started
+
+    # Insert or move a single point without rebuilding the tree
+    # 트리를 재구성하지 않고 단일 지점을 추가하거나 이동합니다
+    def upsert(self, id: int, latitude: float | None, longitude: float | None):
+        if latitude is None or longitude is None:
+            self.remove(id)
+            return
+        with self._lock:
+            self._overlay[id] = (float(latitude), float(longitude))
+            rebuild = len(self._overlay) > OVERLAY_REBUILD_SIZE
+        if rebuild:
+            self.compact()
+
+    # Current (latitude, longitude) of a point, or None when it is not in the index
+    # 지점의 현재 (위도, 경도)를 반환하며, 인덱스에 없으면 None을 반환합니다
+    def position(self, id: int):
+        with self._lock:
+            ids, lat, lon, overlay = self._ids, self._lat, self._lon, self._overlay
+            if id in overlay:
+                return overlay[id]
+
+        k = int(np.searchsorted(ids, id))
+        if k < len(ids) and ids[k] == id:
+            return float(lat[k]), float(lon[k])
+        return None
+
+    # Remove a single point
+    # 단일 지점을 삭제합니다
+    def remove(self, id: int):
+        with self._lock:
+            self._overlay[id] = None
+            rebuild = len(self._overlay) > OVERLAY_REBUILD_SIZE
+        if rebuild:
+            self.compact()
+
+    # Fold the overlay into a fresh KD-tree
+    # 오버레이를 새 KD-트리에 병합합니다
+    def compact(self):
+        with self._lock:
+            overlay = dict(self._overlay)
+            ids, lat, lon = self._ids, self._lat, self._lon
+        keep = ~np.isin(ids, np.fromiter(overlay.keys(), dtype=np.int64, count=len(overlay)))
+        rows = list(zip(ids[keep].tolist(), lat[keep].tolist(), lon[keep].tolist()))
+        rows.extend((i, p[0], p[1]) for i, p in overlay.items() if p is not None)
+        self.load(rows, overlay=overlay)
+
+    # Return [(id, distance_km)] of points within distance_km, nearest first
+    # 반경 distance_km 이내 지점의 [(id, 거리km)]를 가까운 순으로 반환합니다
+    def query_radius(self, latitude: float, longitude: float, distance_km: float):
+        with self._lock:
+            ids, lat, lon, tree, overlay = self._ids, self._lat, self._lon, self._tree, dict(self._overlay)
+
+        center = _to_unit_vectors([latitude], [longitude])[0]
+        # Small tolerance so float rounding on the chord never drops a boundary point
+        # 현 길이의 부동소수점 오차로 경계 지점이 누락되지 않도록 약간의 여유를 둡니다
+        candidates = np.asarray(tree.query_ball_point(center, _chord_length(distance_km) * (1 + 1e-9)), dtype=np.int64)
+
+        result_ids = ids[candidates]
+        distances = haversine_km(latitude, longitude, lat[candidates], lon[candidates])
+
+        if overlay:
+            overlay_ids = np.fromiter(overlay.keys(), dtype=np.int64, count=len(overlay))
+            keep = ~np.isin(result_ids, overlay_ids)
+            result_ids, distances = result_ids[keep], distances[keep]
+
+            points = [(i, p) for i, p in overlay.items() if p is not None]
+            if points:
+                extra_ids = np.array([i for i, _ in points], dtype=np.int64)
+                extra_lat = np.array([p[0] for _, p in points])
+                extra_lon = np.array([p[1] for _, p in points])
+                result_ids = np.concatenate((result_ids, extra_ids))
+                distances = np.concatenate((distances, haversine_km(latitude, longitude, extra_lat, extra_lon)))
+
+        within = distances < distance_km
+        result_ids, distances = result_ids[within], distances[within]
+        order = np.argsort(distances, kind="stable")
+        return list(zip(result_ids[order].tolist(), distances[order].tolist()))
+
+    # Return (id, distance_km) of the nearest point within max_km, or None
+    # max_km 이내에서 가장 가까운 지점의 (id, 거리km)를 반환하며, 없으면 None을 반환합니다
+    def nearest(self, latitude: float, longitude: float, max_km: float):
+        with self._lock:
+            ids, lat, lon, tree, overlay = self._ids, self._lat, self._lon, self._tree, dict(self._overlay)
+
+        best = None
+        if len(ids):
+            # Ask for enough neighbours that one survives even if the closest ones were changed in the overlay
+            # 가장 가까운 지점들이 오버레이에서 변경되었더라도 하나는 남도록 충분한 이웃을 조회합니다
+            k = min(len(ids), 1 + len(overlay))
+            center = _to_unit_vectors([latitude], [longitude])[0]
+            _, positions = tree.query(center, k=k, distance_upper_bound=_chord_length(max_km) * (1 + 1e-9))
+            for position in np.atleast_1d(positions):
+                if position >= len(ids) or int(ids[position]) in overlay:
+                    continue
+                best = (int(ids[position]), float(haversine_km(latitude, longitude, lat[position], lon[position])))
+                break
+
+        for id, point in overlay.items():
+            if point is not None:
+                d = float(haversine_km(latitude, longitude, point[0], point[1]))
+                if best is None or d < best[1]:
+                    best = (id, d)
+
+        if best is None or best[1] >= max_km:
+            return None
+        return best
+
+    # Distance (km) from the given point to each of ids, aligned with ids (inf when a point is unknown)
+    # 주어진 지점에서 ids 각각까지의 거리(km)를 ids 순서대로 반환합니다 (지점이 없으면 inf)
+    def distances(self, latitude: float, longitude: float, ids):
+        with self._lock:
+            index_ids, lat, lon, overlay = self._ids, self._lat, self._lon, dict(self._overlay)
+
+        ids = np.asarray(ids, dtype=np.int64)
+        result = np.full(len(ids), np.inf)
+
+        if len(index_ids):
+            positions = np.minimum(np.searchsorted(index_ids, ids), len(index_ids) - 1)
+            found = index_ids[positions] == ids
+            positions = positions[found]
+            result[found] = haversine_km(latitude, longitude, lat[positions], lon[positions])
+
+        if overlay:
+            overlay_ids = np.fromiter(overlay.keys(), dtype=np.int64, count=len(overlay))
+            for k in np.flatnonzero(np.isin(ids, overlay_ids)):
+                point = overlay[int(ids[k])]
+                result[k] = np.inf if point is None else haversine_km(latitude, longitude, point[0], point[1])
+
+        return result
+
+    # Report index size and load timings
+    # 인덱스 크기와 로드 시간을 반환합니다
+    def stats(self):
+        return {
+            "name": self.name,
+            "ready": self.ready,
+            "size": len(self._ids),
+            "pending_changes": len(self._overlay),
+            "loaded_at": self._loaded_at,
+            "load_seconds": self._load_seconds,
+        }
+
+
+# Shared index over Restaurant.latitude / Restaurant.longitude
+# Restaurant.latitude / Restaurant.longitude에 대한 공유 인덱스
+restaurant_geo_index = GeoIndex("restaurants")
+
+# Watermark (updated_at, id) of the latest restaurant seen by the index; refreshes read from
+# GEO_INDEX_REFRESH_OVERLAP_SECONDS before it
+# 인덱스가 반영한 가장 최근 식당의 (updated_at, id) 워터마크로, 갱신은 이보다
+# GEO_INDEX_REFRESH_OVERLAP_SECONDS 앞부터 읽습니다
+_restaurant_watermark = None
+
+
+def _latest(rows):
+    return max(((r.updated_at, r.id) for r in rows if r.updated_at), default=None)
+
+
+# Load every restaurant with coordinates into the index (db defaults to a new session)
+# 좌표가 있는 모든 식당을 인덱스에 적재합니다 (db가 없으면 새 세션 사용)
+def load_restaurant_geo_index(db: Session | None = None):
+    global _restaurant_watermark
+    Restaurant = restaurant_model.Restaurant
+
+    session = db or SessionLocal()
+    try:
+        rows = session.query(Restaurant.id, Restaurant.latitude, Restaurant.longitude, Restaurant.updated_at).all()
+    finally:
+        if db is None:
+            session.close()
+
+    restaurant_geo_index.load((r.id, r.latitude, r.longitude) for r in rows)
+    _restaurant_watermark = _latest(rows)
+    logger.info("Loaded restaurant geo index: %s", restaurant_geo_index.stats())
+
+
+# Pull restaurants updated since the last load/refresh (falls back to a full load)
+# The overlap window behind the watermark is read again to catch rows committed late; only rows whose
+# position differs from the index are applied, so an idle refresh leaves the overlay unchanged.
+# 마지막 적재/갱신 이후 수정된 식당을 반영합니다 (미적재 시 전체 적재)
+# 늦게 커밋된 행을 놓치지 않도록 워터마크 앞의 겹침 구간을 다시 읽으며, 인덱스와 위치가 다른 행만
+# 반영하므로 변경이 없으면 오버레이도 그대로 유지됩니다
+def refresh_restaurant_geo_index(db: Session | None = None, overlap_seconds: float = GEO_INDEX_REFRESH_OVERLAP_SECONDS):
+    global _restaurant_watermark
+    if not restaurant_geo_index.ready or _restaurant_watermark is None:
+        load_restaurant_geo_index(db)
+        return
+
+    Restaurant = restaurant_model.Restaurant
+    since = _restaurant_watermark[0] - timedelta(seconds=overlap_seconds)
+
+    session = db or SessionLocal()
+    try:
+        rows = session.query(Restaurant.id, Restaurant.latitude, Restaurant.longitude, Restaurant.updated_at)\
+            .filter(Restaurant.updated_at >= since)\
+            .all()
+    finally:
+        if db is None:
+            session.close()
+
+    for r in rows:
+        point = None if r.latitude is None or r.longitude is None else (float(r.latitude), float(r.longitude))
+        if restaurant_geo_index.position(r.id) != point:
+            restaurant_geo_index.upsert(r.id, r.latitude, r.longitude)
+    _restaurant_watermark = max(_latest(rows) or _restaurant_watermark, _restaurant_watermark)
+
+
+# Apply restaurant writes committed by this process immediately
+# 이 프로세스에서 커밋된 식당 변경을 즉시 반영합니다
+def _on_restaurant_changes(changes):
+    if not restaurant_geo_index.ready:
+        return
+    for change in changes:
+        values = change.values
+        if change.op == "delete":
+            restaurant_geo_index.remove(values["id"])
+        else:
+            restaurant_geo_index.upsert(values["id"], values["latitude"], values["longitude"])
+
+
+entity_events.subscribe([restaurant_model.Restaurant], _on_restaurant_changes)
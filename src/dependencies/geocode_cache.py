@@ -0,0 +1,126 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+
+from src.core.map import GEOCODE_CACHE_PATH, GEOCODE_CACHE_TTL_SECONDS, GEOCODE_CACHE_COORDINATE_DECIMALS
+
+"""
+Durable cache of VWorld geocoding results in a local SQLite file.
+Forward lookups are keyed by a normalized address, reverse lookups by coordinates
+quantized to GEOCODE_CACHE_COORDINATE_DECIMALS, so repeat geocodes of the same
+restaurant cost a local read instead of an external round trip, across restarts.
+
+VWorld 지오코딩 결과를 로컬 SQLite 파일에 저장하는 영구 캐시입니다.
+정방향 조회는 정규화한 주소, 역방향 조회는 GEOCODE_CACHE_COORDINATE_DECIMALS 자리로 양자화한 좌표를
+키로 사용하므로, 같은 식당을 다시 지오코딩하면 재시작 후에도 외부 호출 대신 로컬 조회만 합니다.
+"""
+
+
+# Normalize an address for use as a cache key (Unicode NFKC, single spaces, lower case)
+# 캐시 키로 사용할 수 있도록 주소를 정규화합니다 (유니코드 NFKC, 공백 하나, 소문자)
+def normalize_address(address: str):
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFKC", address)).strip().lower()
+
+
+# Cache key of a coordinate, quantized to GEOCODE_CACHE_COORDINATE_DECIMALS
+# GEOCODE_CACHE_COORDINATE_DECIMALS 자리로 양자화한 좌표의 캐시 키
+def quantize_coordinate(longitude: float, latitude: float):
+    return "%.*f,%.*f" % (GEOCODE_CACHE_COORDINATE_DECIMALS, longitude, GEOCODE_CACHE_COORDINATE_DECIMALS, latitude)
+
+
+class GeocodeCache:
+    """
+    SQLite-backed key/value store with per-entry expiry and hit/miss counters per kind.
+    항목별 만료 시간과 종류별 적중/미스 카운터를 가진 SQLite 기반 키/값 저장소입니다.
+    """
+
+    def __init__(self, path: str, ttl: float):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._connection = None
+        self._counters = {}
+
+    # Open the database on first use
+    # 처음 사용할 때 데이터베이스를 엽니다
+    def _connect(self):
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS geocodes (
+                    kind TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    PRIMARY KEY (kind, key)
+                )
+            """)
+            self._connection = connection
+        return self._connection
+
+    def _count(self, kind: str, counter: str):
+        counters = self._counters.setdefault(kind, {"hits": 0, "misses": 0, "writes": 0})
+        counters[counter] += 1
+
+    # Return the cached value of (kind, key), or None when absent or expired
+    # (kind, key)의 캐시된 값을 반환하며, 없거나 만료된 경우 None을 반환합니다
+    def get(self, kind: str, key: str):
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value FROM geocodes WHERE kind = ? AND key = ? AND expires_at > ?",
+                (kind, key, time.time()),
+            ).fetchone()
+            self._count(kind, "hits" if row else "misses")
+        return json.loads(row[0]) if row else None
+
+    def set(self, kind: str, key: str, value):
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO geocodes (kind, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (kind, key, json.dumps(value, ensure_ascii=False), time.time() + self.ttl),
+            )
+            connection.commit()
+            self._count(kind, "writes")
+
+    # Delete expired entries; returns the number of rows removed
+    # 만료된 항목을 삭제하고, 삭제한 행 수를 반환합니다
+    def purge_expired(self):
+        with self._lock:
+            connection = self._connect()
+            deleted = connection.execute("DELETE FROM geocodes WHERE expires_at <= ?", (time.time(),)).rowcount
+            connection.commit()
+        return deleted
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    # Report entry counts and hit rates per kind
+    # 종류별 항목 수와 적중률을 반환합니다
+    def stats(self):
+        with self._lock:
+            sizes = dict(self._connect().execute("SELECT kind, COUNT(*) FROM geocodes GROUP BY kind").fetchall())
+            kinds = set(sizes) | set(self._counters)
+            result = {"path": self.path, "ttl": self.ttl}
+            for kind in sorted(kinds):
+                counters = self._counters.get(kind, {"hits": 0, "misses": 0, "writes": 0})
+                lookups = counters["hits"] + counters["misses"]
+                result[kind] = {
+                    "size": sizes.get(kind, 0),
+                    **counters,
+                    "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+                }
+            return result
+
+
+# Shared cache used by the VWorld geocoding functions
+# VWorld 지오코딩 함수에서 사용하는 공용 캐시
+geocode_cache = GeocodeCache(GEOCODE_CACHE_PATH, GEOCODE_CACHE_TTL_SECONDS)
@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import random
+import threading
+
+import httpx
+
+from src.core.http import (
+    HTTP_CONNECT_TIMEOUT_SECONDS,
+    HTTP_READ_TIMEOUT_SECONDS,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_MAX_CONCURRENCY,
+    HTTP_RETRIES,
+    HTTP_RETRY_BACKOFF_SECONDS,
+)
+
+"""
+Shared asynchronous HTTP layer for external APIs (VWorld, data.go.kr, Naver).
+Each upstream gets its own keep-alive connection pool, timeouts, concurrency limit
+and retries with jittered backoff. The clients live on one background event loop,
+so they can be used both from async routes (await http_client.get(...)) and from
+synchronous code running in worker threads (http_client.run(coroutine)).
+
+외부 API(VWorld, data.go.kr, 네이버)를 위한 공용 비동기 HTTP 계층입니다.
+외부 서비스마다 keep-alive 연결 풀, 제한 시간, 동시 요청 제한, 지터가 적용된 재시도를 가집니다.
+클라이언트는 하나의 백그라운드 이벤트 루프에서 동작하므로, 비동기 라우트
+(await http_client.get(...))와 워커 스레드의 동기 코드(http_client.run(coroutine)) 모두에서 사용할 수 있습니다.
+"""
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying (rate limited or temporary server errors)
+# 재시도할 상태 코드 (요청 제한 또는 일시적인 서버 오류)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class _Upstream:
+    """
+    Connection pool, concurrency limit and counters of a single external service.
+    단일 외부 서비스의 연결 풀, 동시 요청 제한, 카운터입니다.
+    """
+
+    def __init__(self, name: str, transport=None):
+        self.name = name
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(HTTP_READ_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS),
+            limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS,
+                                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS),
+            transport=transport,
+        )
+        self.semaphore = asyncio.Semaphore(HTTP_MAX_CONCURRENCY)
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.in_flight = 0
+
+    def stats(self):
+        return {
+            "name": self.name,
+            "requests": self.requests,
+            "retries": self.retries,
+            "failures": self.failures,
+            "in_flight": self.in_flight,
+        }
+
+
+class HttpClient:
+    """
+    Per-upstream httpx.AsyncClient instances running on a dedicated event loop thread.
+    전용 이벤트 루프 스레드에서 동작하는 외부 서비스별 httpx.AsyncClient 모음입니다.
+    """
+
+    # transport replaces the network layer of every client (e.g. httpx.MockTransport)
+    # transport는 모든 클라이언트의 네트워크 계층을 대체합니다 (예: httpx.MockTransport)
+    def __init__(self, transport=None):
+        self._transport = transport
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._upstreams = {}
+
+    # Start the background event loop on first use
+    # 처음 사용할 때 백그라운드 이벤트 루프를 시작합니다
+    def _get_loop(self):
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="http-client", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    # Send a GET request to the given upstream and return the httpx.Response
+    # 지정한 외부 서비스로 GET 요청을 보내고 httpx.Response를 반환합니다
+    async def get(self, upstream: str, url: str, params: dict | None = None, **kwargs):
+        loop = self._get_loop()
+        coroutine = self._request(upstream, "GET", url, params=params, **kwargs)
+        if asyncio.get_running_loop() is loop:
+            return await coroutine
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coroutine, loop))
+
+    # Run a coroutine (e.g. an async API function) from synchronous code and wait for its result
+    # Must not be called from a thread that is running an event loop.
+    # 동기 코드에서 코루틴(예: 비동기 API 함수)을 실행하고 결과를 기다립니다
+    # 이벤트 루프가 실행 중인 스레드에서는 호출하면 안 됩니다
+    # timeout (seconds) cancels the coroutine and raises TimeoutError.
+    # timeout(초)이 지나면 코루틴을 취소하고 TimeoutError를 발생시킵니다
+    def run(self, coroutine, timeout: float | None = None):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            future = asyncio.run_coroutine_threadsafe(coroutine, self._get_loop())
+            try:
+                return future.result(timeout)
+            except TimeoutError:
+                future.cancel()
+                raise
+        coroutine.close()
+        raise RuntimeError("http_client.run() cannot be called from a running event loop; await the coroutine instead")
+
+    # Request with bounded concurrency, retrying transient failures (runs on the background loop)
+    # 동시 요청 수를 제한하고 일시적인 실패는 재시도합니다 (백그라운드 루프에서 실행)
+    async def _request(self, upstream: str, method: str, url: str, **kwargs):
+        state = self._upstreams.get(upstream)
+        if state is None:
+            state = self._upstreams[upstream] = _Upstream(upstream, self._transport)
+
+        async with state.semaphore:
+            state.in_flight += 1
+            try:
+                for attempt in range(HTTP_RETRIES + 1):
+                    state.requests += 1
+                    try:
+                        response = await state.client.request(method, url, **kwargs)
+                        if response.status_code not in RETRY_STATUS_CODES or attempt == HTTP_RETRIES:
+                            return response
+                        logger.warning("%s %s returned %s (attempt %d)", method, upstream, response.status_code, attempt + 1)
+                    except httpx.TransportError as e:
+                        if attempt == HTTP_RETRIES:
+                            state.failures += 1
+                            raise
+                        logger.warning("%s %s failed: %r (attempt %d)", method, upstream, e, attempt + 1)
+
+                    # Full jitter keeps retries from many requests from arriving together
+                    # 전체 지터로 여러 요청의 재시도가 한꺼번에 몰리지 않도록 합니다
+                    state.retries += 1
+                    await asyncio.sleep(random.uniform(0, HTTP_RETRY_BACKOFF_SECONDS * 2 ** attempt))
+            finally:
+                state.in_flight -= 1
+
+    # Close every connection pool and stop the background loop
+    # 모든 연결 풀을 닫고 백그라운드 루프를 종료합니다
+    def close(self):
+        with self._lock:
+            loop, thread, self._loop, self._thread = self._loop, self._thread, None, None
+        if loop is None:
+            return
+
+        async def close_clients():
+            # Cancel requests still in flight before the pools are closed
+            # 연결 풀을 닫기 전에 진행 중인 요청을 취소합니다
+            pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+            for state in self._upstreams.values():
+                await state.client.aclose()
+            self._upstreams.clear()
+
+        asyncio.run_coroutine_threadsafe(close_clients(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    # Request counters per upstream
+    # 외부 서비스별 요청 카운터
+    def stats(self):
+        return [state.stats() for state in list(self._upstreams.values())]
+
+
+# Shared client used by every external API integration
+# 모든 외부 API 연동에서 사용하는 공용 클라이언트
+http_client = HttpClient()
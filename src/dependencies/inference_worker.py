@@ -0,0 +1,174 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+"""
+Micro-batching inference worker. Callers put single rows on a queue; a dedicated thread collects
+the rows that arrive within a few milliseconds (up to a batch size), scores them with one model
+call and resolves each caller's future. Request threads no longer run the model themselves.
+A caller may pin the model artifacts it read (e.g. for its cache key); rows pinned to different
+artifacts are scored in separate calls, so a result always comes from the artifacts its caller saw.
+
+마이크로 배치 추론 워커입니다. 호출자는 단일 행을 큐에 넣고, 전용 스레드가 몇 밀리초 안에 도착한
+행들을 (배치 크기까지) 모아 한 번의 모델 호출로 예측한 뒤 각 호출자의 Future를 완료합니다.
+요청 스레드는 더 이상 모델을 직접 실행하지 않습니다.
+호출자는 자신이 읽은 모델 아티팩트(예: 캐시 키에 사용한 버전)를 고정할 수 있으며, 서로 다른 아티팩트에
+고정된 행은 따로 호출하여 예측하므로, 결과는 항상 호출자가 본 아티팩트로 계산됩니다.
+"""
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+# Upper bounds of the batch size histogram buckets
+# 배치 크기 히스토그램 구간의 상한
+_HISTOGRAM_BOUNDS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class InferenceWorker:
+    """
+    Queue plus scoring thread around predict_rows(rows, counts[, artifacts=...]) -> one result per row.
+    predict_rows(rows, counts[, artifacts=...]) -> 행별 결과 하나를 감싸는 큐와 예측 스레드입니다.
+    """
+
+    def __init__(self, name: str, predict_rows, max_batch_size: int = 64, max_wait_seconds: float = 0.002):
+        self.name = name
+        self.predict_rows = predict_rows
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_seconds = max_wait_seconds
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._batches = 0
+        self._rows = 0
+        self._errors = 0
+        self._max_queue_depth = 0
+        self._histogram = {bound: 0 for bound in _HISTOGRAM_BOUNDS}
+        self._histogram_overflow = 0
+        self._wait_seconds = 0.0
+        self._predict_seconds = 0.0
+
+    # Start the scoring thread on first use
+    # 처음 사용할 때 예측 스레드를 시작합니다
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f"inference-{self.name}", daemon=True)
+                self._thread.start()
+
+    # Queue one row; the returned Future resolves to its result
+    # artifacts (if given) are passed to predict_rows for this row instead of the active ones.
+    # 행 하나를 큐에 넣으며, 반환된 Future는 해당 행의 결과로 완료됩니다
+    # artifacts를 지정하면 현재 아티팩트 대신 이 행의 predict_rows 호출에 전달합니다
+    def submit(self, row, count, artifacts=None) -> Future:
+        self._ensure_started()
+        future = Future()
+        self._queue.put((row, count, artifacts, future, time.perf_counter()))
+        depth = self._queue.qsize()
+        if depth > self._max_queue_depth:
+            self._max_queue_depth = depth
+        return future
+
+    # Queue one row and wait for its result
+    # 행 하나를 큐에 넣고 결과를 기다립니다
+    def predict(self, row, count, artifacts=None, timeout: float | None = None):
+        return self.submit(row, count, artifacts).result(timeout)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            # Collect the rows arriving until the batch is full or the first row has waited long enough
+            # 배치가 가득 차거나 첫 행이 충분히 기다릴 때까지 도착하는 행을 모읍니다
+            batch = [item]
+            deadline = item[4] + self.max_wait_seconds
+            stop = False
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._score(batch)
+            if stop:
+                return
+
+    def _score(self, batch):
+        started = time.perf_counter()
+
+        # One model call per set of pinned artifacts (normally a single group)
+        # 고정된 아티팩트별로 모델을 한 번씩 호출합니다 (보통은 한 그룹)
+        groups = {}
+        for item in batch:
+            groups.setdefault(id(item[2]), []).append(item)
+        for group in groups.values():
+            artifacts = group[0][2]
+            rows, counts = [row for row, *_ in group], [count for _, count, *_ in group]
+            try:
+                if artifacts is None:
+                    results = self.predict_rows(rows, counts)
+                else:
+                    results = self.predict_rows(rows, counts, artifacts=artifacts)
+            except BaseException as e:
+                self._errors += 1
+                logger.exception("Inference batch of %d rows failed", len(group))
+                for _, _, _, future, _ in group:
+                    future.set_exception(e)
+            else:
+                for (_, _, _, future, _), result in zip(group, results):
+                    future.set_result(result)
+
+        finished = time.perf_counter()
+        self._batches += 1
+        self._rows += len(batch)
+        self._wait_seconds += sum(started - queued_at for *_, queued_at in batch)
+        self._predict_seconds += finished - started
+        for bound in _HISTOGRAM_BOUNDS:
+            if len(batch) <= bound:
+                self._histogram[bound] += 1
+                break
+        else:
+            self._histogram_overflow += 1
+
+    # Stop the scoring thread after the rows already queued
+    # 이미 큐에 있는 행을 처리한 뒤 예측 스레드를 종료합니다
+    def close(self, timeout: float | None = 5):
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join(timeout)
+
+    # Report queue depth, batch counts and the batch size histogram
+    # 큐 길이, 배치 수, 배치 크기 히스토그램을 반환합니다
+    def stats(self):
+        batches = self._batches
+        return {
+            "name": self.name,
+            "running": self._thread is not None,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_seconds": self.max_wait_seconds,
+            "queue_depth": self._queue.qsize(),
+            "max_queue_depth": self._max_queue_depth,
+            "batches": batches,
+            "rows": self._rows,
+            "errors": self._errors,
+            "mean_batch_size": self._rows / batches if batches else 0.0,
+            "mean_wait_seconds": self._wait_seconds / self._rows if self._rows else 0.0,
+            "mean_predict_seconds": self._predict_seconds / batches if batches else 0.0,
+            "batch_size_histogram": {
+                **{f"<={bound}": count for bound, count in self._histogram.items()},
+                f">{_HISTOGRAM_BOUNDS[-1]}": self._histogram_overflow,
+            },
+        }
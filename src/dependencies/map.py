@@ -1,11 +1,44 @@
-import requests
+import asyncio
 import math
+from functools import lru_cache
+
+import numpy as np
 
 from src.core.map import VWORLD_API_URL, VWORLD_API_KEY
+from src.dependencies.http_client import http_client
+from src.dependencies import geocode_cache as geocode
+
+
+# The geocode cache is a SQLite file; its reads and writes run in a worker thread so they do not block
+# the event loop shared with the HTTP client
+# 지오코딩 캐시는 SQLite 파일이므로, HTTP 클라이언트와 공유하는 이벤트 루프를 막지 않도록
+# 읽기와 쓰기를 작업 스레드에서 실행합니다
+async def _cache_get(kind: str, key: str):
+    return await asyncio.to_thread(geocode.geocode_cache.get, kind, key)
+
+
+async def _cache_set(kind: str, key: str, value):
+    await asyncio.to_thread(geocode.geocode_cache.set, kind, key, value)
+
+
+# Whether VWorld answered with a result (only those are cached)
+# VWorld가 결과를 반환했는지 여부 (결과가 있는 응답만 캐시합니다)
+def _is_found(data):
+    try:
+        return data["response"]["status"] == "OK"
+    except (KeyError, TypeError):
+        return False
 
 # Get coordinate (longitude, latitude) from road name address using VWorld API
+# Results are cached by normalized address in the local geocode cache.
 # 도로명 주소를 위경도 좌표로 변환합니다 (VWorld API 사용)
-def get_coordinate_by_address(address: str, format: str = "json"):
+# 결과는 정규화한 주소를 키로 로컬 지오코딩 캐시에 저장됩니다
+async def get_coordinate_by_address(address: str, format: str = "json"):
+    key = "%s:%s" % (format, geocode.normalize_address(address))
+    cached = await _cache_get("address", key)
+    if cached is not None:
+        return cached
+
     params = {
         "service": "address",
         "request": "getcoord",
@@ -16,12 +49,22 @@ def get_coordinate_by_address(address: str, format: str = "json"):
         "key": VWORLD_API_KEY
     }
 
-    response = requests.get(VWORLD_API_URL, params=params)
-    return response.json()
+    response = await http_client.get("vworld", VWORLD_API_URL, params=params)
+    data = response.json()
+    if _is_found(data):
+        await _cache_set("address", key, data)
+    return data
 
 # Get road name address from coordinate (longitude, latitude) using VWorld API
+# Results are cached by coordinates quantized to about 10 m in the local geocode cache.
 # 위경도 좌표로 도로명 주소를 조회합니다 (VWorld API 사용)
-def get_address_by_coordinate(longitude: float, latitude: float, format: str = "json"):
+# 결과는 약 10 m 단위로 양자화한 좌표를 키로 로컬 지오코딩 캐시에 저장됩니다
+async def get_address_by_coordinate(longitude: float, latitude: float, format: str = "json"):
+    key = "%s:%s" % (format, geocode.quantize_coordinate(longitude, latitude))
+    cached = await _cache_get("coordinate", key)
+    if cached is not None:
+        return cached
+
     params = {
         "service": "address",
         "request": "getaddress",
@@ -32,48 +75,49 @@ def get_address_by_coordinate(longitude: float, latitude: float, format: str = "
         "key": VWORLD_API_KEY
     }
 
-    response = requests.get(VWORLD_API_URL, params=params)
-    return response.json()
+    response = await http_client.get("vworld", VWORLD_API_URL, params=params)
+    data = response.json()
+    if _is_found(data):
+        await _cache_set("coordinate", key, data)
+    return data
 
 
-# Constants for latitude/longitude to grid coordinate conversion
-# 위경도를 격자 좌표로 변환하기 위한 상수 정의
+# Constants for latitude/longitude to grid coordinate conversion (KMA Lambert conformal conic, 5 km grid)
+# 위경도를 격자 좌표로 변환하기 위한 상수 정의 (기상청 람베르트 정각원추도법, 5 km 격자)
 NX = 149
 NY = 253
 Re = 6371.00877
 grid = 5.0
-slat1 = 30.0
-slat2 = 60.0
-olon = 126.0
-olat = 38.0
 xo = 210 / grid
 yo = 675 / grid
-first = 0
-
-# Initialize projection constants
-# 격자 변환을 위한 투영 상수들을 초기화합니다
-if first == 0:
-    PI = math.asin(1.0) * 2.0
-    DEGRAD = PI / 180.0
-    RADDEG = 180.0 / PI
-
-    re = Re / grid
-    slat1 = slat1 * DEGRAD
-    slat2 = slat2 * DEGRAD
-    olon = olon * DEGRAD
-    olat = olat * DEGRAD
-
-    sn = math.tan(PI * 0.25 + slat2 * 0.5) / math.tan(PI * 0.25 + slat1 * 0.5)
-    sn = math.log(math.cos(slat1) / math.cos(slat2)) / math.log(sn)
-    sf = math.tan(PI * 0.25 + slat1 * 0.5)
-    sf = math.pow(sf, sn) * math.cos(slat1) / sn
-    ro = math.tan(PI * 0.25 + olat * 0.5)
-    ro = re * sf / math.pow(ro, sn)
-    first = 1
 
-# Convert latitude and longitude to grid coordinate (x, y)
-# 위도, 경도를 격자 좌표 x, y로 변환합니다
-def get_grid_by_coordinate(lat: float, lon: float, code=0):
+PI = math.pi
+DEGRAD = PI / 180.0
+RADDEG = 180.0 / PI
+
+# Projection constants derived from the standard parallels (30°, 60°) and origin (38°N, 126°E)
+# 표준 위도(30°, 60°)와 기준점(북위 38°, 동경 126°)으로부터 계산한 투영 상수
+re = Re / grid
+slat1 = 30.0 * DEGRAD
+slat2 = 60.0 * DEGRAD
+olon = 126.0 * DEGRAD
+olat = 38.0 * DEGRAD
+
+sn = math.tan(PI * 0.25 + slat2 * 0.5) / math.tan(PI * 0.25 + slat1 * 0.5)
+sn = math.log(math.cos(slat1) / math.cos(slat2)) / math.log(sn)
+sf = math.tan(PI * 0.25 + slat1 * 0.5)
+sf = math.pow(sf, sn) * math.cos(slat1) / sn
+ro = math.tan(PI * 0.25 + olat * 0.5)
+ro = re * sf / math.pow(ro, sn)
+
+# Decimal places of the coordinates memoized by get_grid_by_coordinate (6 ≈ 0.1 m)
+# get_grid_by_coordinate에서 메모이즈하는 좌표의 소수점 자릿수 (6 ≈ 0.1 m)
+GRID_CACHE_DECIMALS = 6
+
+
+# Exact scalar projection of latitude and longitude to grid coordinate (x, y)
+# 위도, 경도를 격자 좌표 x, y로 정확히 변환합니다 (스칼라)
+def _grid_by_coordinate(lat: float, lon: float):
     ra = math.tan(PI * 0.25 + lat * DEGRAD * 0.5)
     ra = re * sf / pow(ra, sn)
     theta = lon * DEGRAD - olon
@@ -88,6 +132,35 @@ def get_grid_by_coordinate(lat: float, lon: float, code=0):
     y = int(y + 1.5)
     return x, y
 
+
+_cached_grid_by_coordinate = lru_cache(maxsize=65536)(_grid_by_coordinate)
+
+
+# Convert latitude and longitude to grid coordinate (x, y)
+# Memoized on coordinates rounded to GRID_CACHE_DECIMALS, so repeated lookups of nearby points are free.
+# 위도, 경도를 격자 좌표 x, y로 변환합니다
+# GRID_CACHE_DECIMALS 자리로 반올림한 좌표로 메모이즈하므로, 근처 지점을 반복 조회해도 다시 계산하지 않습니다
+def get_grid_by_coordinate(lat: float, lon: float, code=0):
+    return _cached_grid_by_coordinate(round(lat, GRID_CACHE_DECIMALS), round(lon, GRID_CACHE_DECIMALS))
+
+# Convert arrays of latitudes and longitudes to arrays of grid coordinates (x, y)
+# Same formula and truncation as the scalar path, so results are identical point by point.
+# 위도, 경도 배열을 격자 좌표 x, y 배열로 변환합니다
+# 스칼라 경로와 같은 공식과 절사 방식을 사용하므로 결과가 지점마다 동일합니다
+def get_grids_by_coordinates(lat, lon):
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+
+    ra = np.tan(PI * 0.25 + lat * DEGRAD * 0.5)
+    ra = re * sf / np.power(ra, sn)
+    theta = lon * DEGRAD - olon
+    theta = np.where(theta > PI, theta - 2.0 * PI, theta)
+    theta = np.where(theta < -PI, theta + 2.0 * PI, theta)
+    theta *= sn
+    x = (ra * np.sin(theta)) + xo
+    y = (ro - ra * np.cos(theta)) + yo
+    return np.trunc(x + 1.5).astype(np.int64), np.trunc(y + 1.5).astype(np.int64)
+
 # Convert grid coordinate (x, y) back to latitude and longitude
 # 격자 좌표 x, y를 위도, 경도로 변환합니다
 def get_coordinate_by_grid(x: float, y: float, code=1):
@@ -113,3 +186,18 @@ def get_coordinate_by_grid(x: float, y: float, code=1):
     lat = alat * RADDEG
     lon = alon * RADDEG
     return lat, lon
+
+# Convert arrays of grid coordinates (x, y) back to arrays of latitudes and longitudes
+# 격자 좌표 x, y 배열을 위도, 경도 배열로 변환합니다
+def get_coordinates_by_grids(x, y):
+    xn = np.asarray(x, dtype=np.float64) - 1 - xo
+    yn = ro - (np.asarray(y, dtype=np.float64) - 1) + yo
+    ra = np.sqrt(xn * xn + yn * yn)
+    if sn < 0.0:
+        ra = -ra
+    alat = np.power((re * sf / ra), (1.0 / sn))
+    alat = 2.0 * np.arctan(alat) - PI * 0.5
+    theta = np.where(np.abs(yn) <= 0.0, np.where(xn < 0.0, -PI * 0.5, PI * 0.5), np.arctan2(xn, yn))
+    theta = np.where(np.abs(xn) <= 0.0, 0.0, theta)
+    alon = theta / sn + olon
+    return alat * RADDEG, alon * RADDEG
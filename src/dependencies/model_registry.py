@@ -0,0 +1,214 @@
+import logging
+import os
+import threading
+import time
+
+import joblib
+import numpy as np
+
+from src.core.ml import ML_MODEL_CURRENT_FILE, get_model_path, get_preprocessor_path
+
+"""
+Versioned registry of the cuisine type model artifacts (model + preprocessor).
+Artifacts are loaded on first use or by a startup hook rather than at import time, so importing
+the app needs neither the files nor the ML_MODEL_* settings. A new version directory under
+ML_MODEL_DIR is loaded next to the active one and swapped in with a single assignment, so workers
+switch versions without a restart and a request never mixes artifacts of two versions.
+
+음식 유형 모델 아티팩트(모델 + 전처리기)의 버전별 레지스트리입니다.
+아티팩트는 import 시점이 아니라 처음 사용할 때나 시작 훅에서 로드하므로, 앱을 import할 때
+파일이나 ML_MODEL_* 설정이 필요하지 않습니다. ML_MODEL_DIR 아래의 새 버전 디렉터리는 현재 버전과
+별도로 로드한 뒤 한 번의 대입으로 교체하므로, 워커는 재시작 없이 버전을 전환하고 요청은 두 버전의
+아티팩트를 섞어 쓰지 않습니다.
+"""
+
+logger = logging.getLogger(__name__)
+
+
+class LabeledClassifier:
+    """
+    Classifier trained on encoded labels (e.g. XGBoost, which needs 0..n-1) that reports the original
+    labels as classes_. Other attributes (get_booster, best_iteration, ...) come from the wrapped model.
+    인코딩된 레이블로 학습한 분류기(예: 0..n-1 레이블이 필요한 XGBoost)를 감싸 원래 레이블을
+    classes_로 제공합니다. 그 밖의 속성(get_booster, best_iteration 등)은 감싼 모델에서 가져옵니다.
+    """
+
+    def __init__(self, model, classes):
+        self.model = model
+        self.classes_ = np.asarray(classes)
+
+    def predict_proba(self, X):
+        return self.model.predict_proba(X)
+
+    def predict(self, X):
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+    def __getattr__(self, name):
+        # __dict__ is empty while unpickling, so look the model up without recursing
+        # 역직렬화 중에는 __dict__가 비어 있으므로 재귀 없이 모델을 조회합니다
+        model = self.__dict__.get("model")
+        if model is None:
+            raise AttributeError(name)
+        return getattr(model, name)
+
+
+class ModelArtifacts:
+    """
+    Immutable set of artifacts of one model version, plus state derived from them by prepare().
+    한 모델 버전의 변경되지 않는 아티팩트 묶음과, prepare()로 만든 파생 상태입니다.
+    """
+
+    def __init__(self, version: str, model, preprocessor, prepared, load_seconds: float):
+        self.version = version
+        self.model = model
+        self.preprocessor = preprocessor
+        self.prepared = prepared
+        self.loaded_at = time.time()
+        self.load_seconds = load_seconds
+
+
+class ModelRegistry:
+    """
+    Holds the active ModelArtifacts; readers take one reference and use it for the whole request.
+    현재 ModelArtifacts를 보관하며, 읽는 쪽은 참조 하나를 가져와 요청 전체에 사용합니다.
+    """
+
+    def __init__(self, model_dir: str, version: str | None = None, prepare=None):
+        self.model_dir = model_dir
+        self.version = version
+        # Builds derived state (e.g. a fast scoring path) from (model, preprocessor); errors disable it
+        # (model, preprocessor)로 파생 상태(예: 빠른 예측 경로)를 만들며, 오류 시 사용하지 않습니다
+        self.prepare = prepare
+        self._lock = threading.Lock()
+        self._active = None
+        self._loads = 0
+        self._failures = 0
+        self._last_error = None
+
+    # Version named in ML_MODEL_CURRENT_FILE, if the file exists
+    # ML_MODEL_CURRENT_FILE에 적힌 버전 (파일이 있는 경우)
+    def current_version(self):
+        path = os.path.join(self.model_dir, ML_MODEL_CURRENT_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return f.read().strip() or None
+
+    # Version directories available under the model directory (hidden ones are versions still being written)
+    # 모델 디렉터리 아래에 있는 버전 디렉터리 목록 (숨김 디렉터리는 아직 작성 중인 버전입니다)
+    def versions(self):
+        if not os.path.isdir(self.model_dir):
+            return []
+        return sorted(d for d in os.listdir(self.model_dir)
+                      if not d.startswith(".") and os.path.isdir(os.path.join(self.model_dir, d)))
+
+    # Active artifacts, loading the configured version on first use
+    # 현재 아티팩트를 반환하며, 처음 사용할 때 설정된 버전을 로드합니다
+    def get(self):
+        active = self._active
+        if active is not None:
+            return active
+
+        with self._lock:
+            if self._active is None:
+                version = self.version or self.current_version()
+                if version is None:
+                    raise RuntimeError("No model version configured (set ML_MODEL_VERSION or "
+                                       f"{os.path.join(self.model_dir, ML_MODEL_CURRENT_FILE)})")
+                self._active = self._load(version)
+            return self._active
+
+    # Load a version and make it active; on failure the active version keeps serving
+    # 버전을 로드하여 현재 버전으로 교체하며, 실패하면 기존 버전이 계속 사용됩니다
+    def reload(self, version: str | None = None):
+        version = version or self.current_version() or self.version
+        with self._lock:
+            self._active = self._load(version)
+            self.version = version
+        logger.info("Model version %s is active", version)
+        return self._active
+
+    # Load a version, name it in ML_MODEL_CURRENT_FILE and make it active, so every worker switches to
+    # it on its next refresh instead of reverting this one to the previous file contents
+    # 버전을 로드하고 ML_MODEL_CURRENT_FILE에 기록한 뒤 현재 버전으로 교체하므로, 모든 워커가 다음
+    # 확인 시 이 버전으로 전환하며 이전 파일 내용으로 되돌리지 않습니다
+    def activate(self, version: str):
+        with self._lock:
+            artifacts = self._load(version)
+            self.write_current_version(version)
+            self._active = artifacts
+            self.version = version
+        logger.info("Model version %s is active and current", version)
+        return artifacts
+
+    # Replace ML_MODEL_CURRENT_FILE atomically, so readers never see a partial version name
+    # 읽는 쪽이 불완전한 버전 이름을 보지 않도록 ML_MODEL_CURRENT_FILE을 원자적으로 교체합니다
+    def write_current_version(self, version: str):
+        path = os.path.join(self.model_dir, ML_MODEL_CURRENT_FILE)
+        with open(path + ".tmp", "w") as f:
+            f.write(version + "\n")
+        os.replace(path + ".tmp", path)
+
+    # Reload when ML_MODEL_CURRENT_FILE names a version other than the active one
+    # The file is read again under the lock, so a concurrent activate() is not undone.
+    # ML_MODEL_CURRENT_FILE에 현재와 다른 버전이 적혀 있으면 다시 로드합니다
+    # 잠금 안에서 파일을 다시 읽으므로, 동시에 실행된 activate()를 되돌리지 않습니다
+    def refresh(self):
+        version = self.current_version()
+        active = self._active
+        if version is None or (active is not None and active.version == version):
+            return
+
+        with self._lock:
+            version = self.current_version()
+            active = self._active
+            if version is None or (active is not None and active.version == version):
+                return
+            self._active = self._load(version)
+            self.version = version
+        logger.info("Model version %s is active", version)
+
+    def _load(self, version: str):
+        if not version or os.sep in version or version.startswith(".") or \
+                not os.path.isdir(os.path.join(self.model_dir, version)):
+            self._failures += 1
+            self._last_error = f"Unknown model version: {version}"
+            raise FileNotFoundError(self._last_error)
+
+        started = time.perf_counter()
+        try:
+            model = joblib.load(get_model_path(version, self.model_dir))
+            preprocessor = joblib.load(get_preprocessor_path(version, self.model_dir))
+        except Exception as e:
+            self._failures += 1
+            self._last_error = repr(e)
+            raise
+
+        prepared = None
+        if self.prepare is not None:
+            try:
+                prepared = self.prepare(model, preprocessor)
+            except Exception:
+                logger.exception("Could not prepare model version %s; using the default path", version)
+
+        self._loads += 1
+        self._last_error = None
+        return ModelArtifacts(version, model, preprocessor, prepared, time.perf_counter() - started)
+
+    # Report the active version, its load time and load counters
+    # 현재 버전, 로드 시간, 로드 카운터를 반환합니다
+    def stats(self):
+        active = self._active
+        return {
+            "model_dir": self.model_dir,
+            "active_version": active.version if active else None,
+            "configured_version": self.version,
+            "current_file_version": self.current_version(),
+            "available_versions": self.versions(),
+            "loaded_at": active.loaded_at if active else None,
+            "load_seconds": active.load_seconds if active else None,
+            "prepared": active is not None and active.prepared is not None,
+            "loads": self._loads,
+            "failures": self._failures,
+            "last_error": self._last_error,
+        }
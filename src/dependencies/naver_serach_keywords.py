@@ -1,7 +1,51 @@
-import requests
+import unicodedata
+
+from fastapi import HTTPException, status
+
+from src.core.naver import (
+    NAVER_SEARCH_KEYWORDS_URL,
+    NAVER_CACHE_TTL_SECONDS,
+    NAVER_CACHE_MAXSIZE,
+    NAVER_MAX_PENDING_REQUESTS,
+)
+from src.dependencies.cache import TTLCache
+from src.dependencies.http_client import http_client
+
+"""
+Proxy for Naver search suggestions. Responses are cached per normalized query (Naver still receives
+the query as typed), concurrent requests for the same query share one upstream call, and the number
+of distinct upstream calls in flight is capped so a burst of typing cannot exhaust connections or workers.
+
+네이버 추천 검색어 프록시입니다. 응답은 정규화한 검색어별로 캐시하고 (네이버에는 입력한 검색어를
+그대로 보냅니다), 같은 검색어에 대한 동시 요청은 외부 호출 하나를 공유하며, 진행 중인 외부 호출 수를
+제한하여 입력이 몰려도 연결이나 작업자가 고갈되지 않도록 합니다.
+"""
+
+# Responses by (normalized query, format)
+# (정규화한 검색어, 형식)별 응답
+naver_cache = TTLCache("naver_search_keywords", maxsize=NAVER_CACHE_MAXSIZE, ttl=NAVER_CACHE_TTL_SECONDS)
+
+_pending = 0
+_rejected = 0
+
+
+# Normalize a query for use as a cache key (Unicode NFC, single spaces, lower case)
+# 캐시 키로 사용할 수 있도록 검색어를 정규화합니다 (유니코드 NFC, 공백 하나, 소문자)
+def normalize_query(query: str):
+    return " ".join(unicodedata.normalize("NFC", query).lower().split())
+
+
+def _is_valid_response(data):
+    return isinstance(data, dict) and "items" in data
+
+
+async def _fetch_naver_search_keywords(query: str, format: str):
+    global _pending, _rejected
+    if _pending >= NAVER_MAX_PENDING_REQUESTS:
+        _rejected += 1
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail="Too many pending search keyword requests")
 
-def get_naver_search_keywords(query: str, format: str = "json"):
-    url = "https://mac.search.naver.com/mobile/ac"
     params ={
         "q": query,
         "con": 0,
@@ -17,6 +61,34 @@ def get_naver_search_keywords(query: str, format: str = "json"):
         "rev":4
     }
 
-    response = requests.get(url, params=params)
-    
+    _pending += 1
+    try:
+        response = await http_client.get("naver", NAVER_SEARCH_KEYWORDS_URL, params=params)
+    finally:
+        _pending -= 1
+
     return response.json()
+
+# Get Naver search suggestions for a query, from the cache when possible
+# The normalized query is only the cache key; the query is sent to Naver as typed (case and spacing
+# can change its suggestions), and the first caller of a key decides what is sent.
+# 검색어에 대한 네이버 추천 검색어를 조회하며, 가능하면 캐시에서 반환합니다
+# 정규화한 검색어는 캐시 키로만 사용하며, 네이버에는 입력한 검색어 그대로 보냅니다
+# (대소문자와 공백에 따라 추천어가 달라질 수 있습니다). 같은 키의 첫 호출자가 보낼 검색어를 정합니다
+async def get_naver_search_keywords(query: str, format: str = "json"):
+    return await naver_cache.get_or_load_async(
+        (normalize_query(query), format),
+        lambda: _fetch_naver_search_keywords(query, format),
+        cacheable=_is_valid_response,
+    )
+
+
+# Report cache counters and upstream requests in flight / rejected
+# 캐시 카운터와 진행 중인/거부된 외부 요청 수를 반환합니다
+def stats():
+    return {
+        **naver_cache.stats(),
+        "pending": _pending,
+        "max_pending": NAVER_MAX_PENDING_REQUESTS,
+        "rejected": _rejected,
+    }
@@ -0,0 +1,112 @@
+import logging
+import threading
+from collections import namedtuple
+
+from sqlalchemy.orm import Session
+
+from src.core.database import SessionLocal
+from src.models import observation_station_model
+from src.dependencies import entity_events
+from src.dependencies.geo_index import GeoIndex
+from src.dependencies.map import get_grid_by_coordinate, get_grids_by_coordinates
+
+"""
+In-process copy of the usable ASOS observation stations.
+The station list is small and rarely changes, so it is loaded once into a KD-tree
+(nearest-station lookups in O(log n)) together with each station's KMA grid (nx, ny).
+Committed station changes are applied immediately and the list is reloaded periodically.
+
+사용 가능한 ASOS 관측소의 프로세스 내 사본입니다.
+관측소 목록은 작고 거의 변하지 않으므로 KD-트리에 한 번 적재하며 (최근접 관측소 조회 O(log n)),
+각 관측소의 기상청 격자 좌표 (nx, ny)도 함께 미리 계산합니다.
+커밋된 관측소 변경은 즉시 반영되고, 목록은 주기적으로 다시 적재됩니다.
+"""
+
+logger = logging.getLogger(__name__)
+
+# Stations farther than this from the searched point are not used
+# 검색 지점에서 이 거리보다 먼 관측소는 사용하지 않습니다
+MAX_STATION_DISTANCE_KM = 25
+
+# A usable station with its precomputed KMA grid coordinates
+# 기상청 격자 좌표가 미리 계산된 사용 가능한 관측소
+Station = namedtuple("Station", ["id", "os_id", "latitude", "longitude", "nx", "ny"])
+
+station_index = GeoIndex("observation_stations")
+_stations = {}
+_lock = threading.Lock()
+
+
+def _to_station(id, os_id, latitude, longitude):
+    nx, ny = get_grid_by_coordinate(latitude, longitude)
+    return Station(id, os_id, latitude, longitude, nx, ny)
+
+
+# Load every usable station (db defaults to a new session)
+# 사용 가능한 모든 관측소를 적재합니다 (db가 없으면 새 세션 사용)
+def load_observation_stations(db: Session | None = None):
+    ObservationStation = observation_station_model.ObservationStation
+
+    session = db or SessionLocal()
+    try:
+        rows = session.query(ObservationStation.id, ObservationStation.os_id,
+                             ObservationStation.latitude, ObservationStation.longitude)\
+            .filter(ObservationStation.is_usable.is_(True))\
+            .all()
+    finally:
+        if db is None:
+            session.close()
+
+    rows = [r for r in rows if r.latitude is not None and r.longitude is not None]
+    nx, ny = get_grids_by_coordinates([r.latitude for r in rows], [r.longitude for r in rows])
+    stations = {r.id: Station(r.id, r.os_id, r.latitude, r.longitude, x, y)
+                for r, x, y in zip(rows, nx.tolist(), ny.tolist())}
+
+    global _stations
+    with _lock:
+        _stations = stations
+        station_index.load((s.id, s.latitude, s.longitude) for s in stations.values())
+    logger.info("Loaded observation stations: %s", station_index.stats())
+
+
+# Nearest usable station within MAX_STATION_DISTANCE_KM, or None (loads the stations on first use)
+# MAX_STATION_DISTANCE_KM 이내의 가장 가까운 사용 가능 관측소를 반환하며, 없으면 None (첫 사용 시 적재)
+def get_nearest_observation_station(latitude: float, longitude: float):
+    if not station_index.ready:
+        load_observation_stations()
+
+    nearest = station_index.nearest(latitude, longitude, MAX_STATION_DISTANCE_KM)
+    if nearest is None:
+        return None
+    return _stations.get(nearest[0])
+
+
+# Every loaded station
+# 적재된 모든 관측소
+def get_observation_stations():
+    return list(_stations.values())
+
+
+# Apply station writes committed by this process immediately
+# 이 프로세스에서 커밋된 관측소 변경을 즉시 반영합니다
+def _on_station_changes(changes):
+    if not station_index.ready:
+        return
+
+    global _stations
+    with _lock:
+        stations = dict(_stations)
+        for change in changes:
+            values = change.values
+            usable = change.op != "delete" and values.get("is_usable") \
+                and values.get("latitude") is not None and values.get("longitude") is not None
+            if usable:
+                stations[values["id"]] = _to_station(values["id"], values["os_id"], values["latitude"], values["longitude"])
+                station_index.upsert(values["id"], values["latitude"], values["longitude"])
+            else:
+                stations.pop(values["id"], None)
+                station_index.remove(values["id"])
+        _stations = stations
+
+
+entity_events.subscribe([observation_station_model.ObservationStation], _on_station_changes)
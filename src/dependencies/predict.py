@@ -1,62 +1,262 @@
+import time
+
 import numpy as np
 import pandas as pd
-import joblib
+from fastapi import HTTPException, status
 
-from src.core.ml import get_model_path, get_preprocessor_path
+from src.core.ml import (
+    ML_MODEL_DIR,
+    ML_MODEL_VERSION,
+    ML_PREDICTION_CACHE_DECIMALS,
+    ML_PREDICTION_CACHE_MAXSIZE,
+    ML_INFERENCE_BATCH_SIZE,
+    ML_INFERENCE_MAX_WAIT_SECONDS,
+)
+from src.dependencies.cache import TTLCache
+from src.dependencies.inference_worker import InferenceWorker
+from src.dependencies.model_registry import ModelRegistry
+from src.schemas import utility_schema
 from sklearn.compose import ColumnTransformer
-from sklearn.preprocessing import StandardScaler
+from sklearn.preprocessing import FunctionTransformer, StandardScaler
+
+# Feature columns expected by the preprocessor, in WeatherFeatures field order
+# 전처리기가 기대하는 특성 컬럼 (WeatherFeatures 필드 순서)
+FEATURE_COLUMNS = ['Temperature', 'Precipitation', 'Cloudiness', 'Snowfall', 'Pressure']
+
+
+class FastPredictor:
+    """
+    Scores weather rows with NumPy only: the fitted StandardScaler parameters are read out of the
+    preprocessor once, and XGBoost models are evaluated with the booster's in-place prediction.
+    Gives the same probabilities as preprocessor.transform(DataFrame) + model.predict_proba.
+
+    NumPy만으로 날씨 행을 예측합니다: 학습된 StandardScaler 파라미터를 전처리기에서 한 번만 읽어 두고,
+    XGBoost 모델은 부스터의 in-place 예측으로 계산합니다.
+    preprocessor.transform(DataFrame) + model.predict_proba와 같은 확률을 반환합니다.
+    """
+
+    def __init__(self, model, columns, mean, scale, order="C"):
+        self.model = model
+        self.classes = model.classes_
+        # Input column of every preprocessor output column, with its mean and scale
+        # 전처리기 출력 컬럼마다 대응하는 입력 컬럼과 평균, 스케일
+        self.columns = columns
+        self.mean = mean
+        self.scale = scale
+        # Memory layout of the preprocessor output; BLAS rounds differently for C and Fortran arrays
+        # 전처리기 출력의 메모리 배치로, BLAS는 C 배열과 Fortran 배열에서 반올림 결과가 다릅니다
+        self.order = order
+
+        self.booster = None
+        if hasattr(model, "get_booster"):
+            self.booster = model.get_booster()
+            # Same trees as predict_proba: up to the best iteration when trained with early stopping
+            # predict_proba와 같은 트리 범위: 조기 종료로 학습했다면 최적 반복까지
+            try:
+                self.iteration_range = (0, model.best_iteration + 1)
+            except AttributeError:
+                self.iteration_range = (0, 0)
+
+    # FastPredictor for the artifacts, or None when the preprocessor has steps other than
+    # StandardScaler / passthrough / drop over the known feature columns
+    # 아티팩트에 대한 FastPredictor를 반환하며, 전처리기에 알려진 특성 컬럼에 대한
+    # StandardScaler / passthrough / drop 이외의 단계가 있으면 None을 반환합니다
+    @classmethod
+    def from_artifacts(cls, model, preprocessor):
+        names = [str(n) for n in getattr(preprocessor, "feature_names_in_", FEATURE_COLUMNS)]
+        if any(n not in FEATURE_COLUMNS for n in names):
+            return None
+
+        if isinstance(preprocessor, ColumnTransformer):
+            steps = preprocessor.transformers_
+        else:
+            steps = [("all", preprocessor, list(range(len(names))))]
+
+        columns, mean, scale = [], [], []
+        for _, transformer, selected in steps:
+            if isinstance(transformer, str) and transformer == "drop":
+                continue
+            if isinstance(selected, slice) or not all(isinstance(c, (str, int, np.integer)) for c in selected):
+                return None
+            indices = [FEATURE_COLUMNS.index(c if isinstance(c, str) else names[c]) for c in selected]
+
+            # Passthrough columns (ColumnTransformer stores a remainder passthrough as an identity FunctionTransformer)
+            # 그대로 전달되는 컬럼 (ColumnTransformer는 remainder passthrough를 항등 FunctionTransformer로 저장합니다)
+            if (isinstance(transformer, str) and transformer == "passthrough") or \
+                    (type(transformer) is FunctionTransformer and transformer.func is None):
+                step_mean, step_scale = np.zeros(len(indices)), np.ones(len(indices))
+            elif type(transformer) is StandardScaler:
+                step_mean = transformer.mean_ if transformer.with_mean else np.zeros(len(indices))
+                step_scale = transformer.scale_ if transformer.with_std else np.ones(len(indices))
+            else:
+                return None
+
+            columns.extend(indices)
+            mean.extend(np.asarray(step_mean, dtype=np.float64))
+            scale.extend(np.asarray(step_scale, dtype=np.float64))
+
+        sample = preprocessor.transform(pd.DataFrame(np.zeros((2, len(names))), columns=names))
+        order = "F" if sample.flags.f_contiguous and not sample.flags.c_contiguous else "C"
+        return cls(model, np.array(columns, dtype=np.intp), np.array(mean), np.array(scale), order)
+
+    # Class probabilities of raw feature rows (columns in FEATURE_COLUMNS order)
+    # 원시 특성 행(FEATURE_COLUMNS 순서)의 클래스 확률
+    def predict_proba(self, features):
+        scaled = np.asarray(features[:, self.columns], order=self.order)
+        scaled -= self.mean
+        scaled /= self.scale
+
+        if self.booster is None:
+            return self.model.predict_proba(scaled)
+
+        probs = self.booster.inplace_predict(scaled, iteration_range=self.iteration_range, validate_features=False)
+        if probs.ndim == 1:
+            # Binary objectives return the probability of the second class only
+            # 이진 분류 목적 함수는 두 번째 클래스의 확률만 반환합니다
+            probs = np.column_stack([1.0 - probs, probs])
+        return probs
+
 
-# Load the trained classification model using its path  
-# 경로를 통해 학습된 분류 모델을 로드합니다
-loaded_model = joblib.load(get_model_path())
+# Indices of the top k classes of every row in descending order of probability (ties by class index)
+# 행마다 확률이 높은 순서의 상위 k개 클래스 인덱스 (같은 확률이면 클래스 인덱스 순)
+def top_k(probs, k: int):
+    k = min(max(k, 1), probs.shape[1])
+    if k == probs.shape[1]:
+        return np.argsort(-probs, axis=1, kind="stable")
 
-# Load the preprocessing pipeline (e.g., StandardScaler)  
-# 전처리 파이프라인을 로드합니다 (예: StandardScaler)
-preprocessor = joblib.load(get_preprocessor_path())
+    top = np.argpartition(-probs, k - 1, axis=1)[:, :k]
+    top.sort(axis=1)
+    order = np.argsort(-np.take_along_axis(probs, top, axis=1), axis=1, kind="stable")
+    top = np.take_along_axis(top, order, axis=1)
+
+    # argpartition picks arbitrary members of a tie at the k-th place; those rows are sorted in full
+    # k번째 자리의 동점 중 argpartition이 임의로 고른 행은 전체 정렬로 다시 계산합니다
+    tied = np.flatnonzero((probs >= probs[np.arange(len(probs)), top[:, -1]][:, None]).sum(axis=1) > k)
+    if len(tied):
+        top[tied] = np.argsort(-probs[tied], axis=1, kind="stable")[:, :k]
+    return top
+
+
+# Trained classification model and preprocessing pipeline (e.g., StandardScaler) by ML_MODEL_VERSION,
+# loaded on first use; each version gets a FastPredictor (None falls back to the pandas / sklearn path)
+# ML_MODEL_VERSION별 학습된 분류 모델과 전처리 파이프라인(예: StandardScaler)으로, 처음 사용할 때 로드합니다
+# 버전마다 FastPredictor를 만들며, None이면 pandas / sklearn 경로를 사용합니다
+model_registry = ModelRegistry(ML_MODEL_DIR, ML_MODEL_VERSION, prepare=FastPredictor.from_artifacts)
+
+
+# Class probabilities of raw feature rows through the original DataFrame + ColumnTransformer path
+# 원래의 DataFrame + ColumnTransformer 경로로 계산한 원시 특성 행의 클래스 확률
+def _predict_proba_with_preprocessor(artifacts, features):
+    return artifacts.model.predict_proba(
+        artifacts.preprocessor.transform(pd.DataFrame(features, columns=FEATURE_COLUMNS))
+    )
+
+
+# Score many weather rows at once: one scaling pass and one model call for the whole batch
+# Returns, for every row, the top count classes as {class: {"rank", "probability"}}; count may be a list
+# with one value per row. artifacts pins the model version (default: the active one).
+# 여러 날씨 행을 한 번에 예측합니다: 배치 전체에 대해 스케일링과 모델 호출을 한 번씩만 수행합니다
+# 행마다 상위 count개 클래스를 {클래스: {"rank", "probability"}} 형태로 반환하며, count는 행별 값의 리스트일 수 있습니다
+# artifacts는 사용할 모델 버전을 고정합니다 (기본값: 현재 버전)
+def predict_cuisine_types_by_weather_rows(rows, count: int | list[int] = 2, artifacts=None):
+    features = np.array(rows, dtype=np.float64).reshape(-1, len(FEATURE_COLUMNS))
+    if not len(features):
+        return []
+
+    artifacts = artifacts or model_registry.get()
+    if artifacts.prepared is not None:
+        probs = artifacts.prepared.predict_proba(features)
+    else:
+        probs = _predict_proba_with_preprocessor(artifacts, features)
+
+    # Plain Python labels and floats: the JSON encoder rejects NumPy scalars (e.g. XGBoost's float32)
+    # 일반 Python 레이블과 실수로 반환합니다: JSON 인코더는 NumPy 스칼라(예: XGBoost의 float32)를 처리하지 못합니다
+    classes = np.asarray(artifacts.model.classes_).tolist()
+    if isinstance(count, int):
+        return [
+            {classes[p]: {"rank": rank, "probability": float(row_probs[p])} for rank, p in enumerate(row_top, start=1)}
+            for row_top, row_probs in zip(top_k(probs, count).tolist(), probs)
+        ]
+
+    predictions = [None] * len(features)
+    for c in set(count):
+        index = [i for i, row_count in enumerate(count) if row_count == c]
+        for i, row_top in zip(index, top_k(probs[index], c).tolist()):
+            predictions[i] = {classes[p]: {"rank": rank, "probability": float(probs[i][p])}
+                              for rank, p in enumerate(row_top, start=1)}
+    return predictions
+
+# Single-row predictions by (model version, count, inputs rounded to ML_PREDICTION_CACHE_DECIMALS)
+# Searches feed hourly station observations, so an hour has only as many distinct inputs as stations.
+# (모델 버전, count, ML_PREDICTION_CACHE_DECIMALS 자리로 반올림한 입력)별 단일 행 예측 결과
+# 검색에는 매시간 관측소 관측값이 들어오므로, 한 시간 동안의 서로 다른 입력은 관측소 수만큼만 있습니다
+prediction_cache = TTLCache("predictions", maxsize=ML_PREDICTION_CACHE_MAXSIZE, ttl=None)
+
+# Inputs rounded to ML_PREDICTION_CACHE_DECIMALS (the sensor resolution)
+# ML_PREDICTION_CACHE_DECIMALS 자리(센서 분해능)로 반올림한 입력
+def quantize_features(values):
+    return tuple(round(float(v), ML_PREDICTION_CACHE_DECIMALS) for v in values)
+
+# Scores single-row predictions from concurrent requests together, off the request threads
+# 동시 요청의 단일 행 예측을 요청 스레드 밖에서 함께 모아 예측합니다
+inference_worker = InferenceWorker(
+    "cuisine_type", predict_cuisine_types_by_weather_rows,
+    max_batch_size=ML_INFERENCE_BATCH_SIZE, max_wait_seconds=ML_INFERENCE_MAX_WAIT_SECONDS,
+)
 
 # TODO : Update Naver Map API
+# Inputs are rounded to the sensor resolution, and repeated inputs are served from prediction_cache;
+# new inputs are scored by the inference worker in a batch with other concurrent requests
+# 입력은 센서 분해능으로 반올림하며, 반복된 입력은 prediction_cache에서 반환합니다
+# 새 입력은 추론 워커가 다른 동시 요청과 함께 배치로 예측합니다
 def predict_cuisine_type_by_weather(temperature: float = 0.0, 
                                     precipitation: float = 0.0, 
                                     cloudiness: float = 0.0, 
                                     snowfall: float = 0.0, 
                                     pressure: float = 0.0,
                                     count: int = 2):
-    
-    # Create a DataFrame from the input weather features  
-    # 입력된 날씨 데이터를 기반으로 DataFrame을 생성합니다
-    new_weather_data = pd.DataFrame([[temperature, precipitation, cloudiness, snowfall, pressure]],
-                                    columns=['Temperature', 'Precipitation', 'Cloudiness', 'Snowfall', 'Pressure'])
-
-    # Apply preprocessing to scale the input features  
-    # 입력 데이터를 전처리하여 스케일링합니다
-    scaled_new_data = preprocessor.transform(new_weather_data)
-
-    # Predict class probabilities for the input  
-    # 입력에 대해 각 클래스의 확률을 예측합니다
-    probs = loaded_model.predict_proba(scaled_new_data)
-
-    # Select the top two most probable classes (highest probabilities)  
-    # 확률이 가장 높은 상위 두 개의 클래스를 선택합니다
-    best = np.argsort(probs, axis=1)[:,-2:]
+    features = quantize_features((temperature, precipitation, cloudiness, snowfall, pressure))
 
-    # Map indices to actual class labels in descending order of probability  
-    # 확률이 높은 순서대로 클래스 레이블로 매핑합니다
-    cuisine_types = [loaded_model.classes_[i] for i in best[0][::-1]]
+    # One snapshot of the artifacts keys the cache entry and scores it, so a concurrent reload
+    # cannot store another version's output under this version
+    # 아티팩트를 한 번만 가져와 캐시 키와 예측에 함께 사용하므로, 동시에 다시 로드되더라도
+    # 다른 버전의 결과가 이 버전의 키로 저장되지 않습니다
+    artifacts = model_registry.get()
 
-    # Initialize the result dictionary  
-    # 결과를 담을 딕셔너리를 초기화합니다
-    result = {}
-    rank = 1
+    return prediction_cache.get_or_load(
+        (artifacts.version, count, features),
+        lambda: inference_worker.predict(features, count, artifacts),
+    )
 
-    # Sort all classes by descending probability and store top N results  
-    # 모든 클래스를 확률 기준으로 정렬하고 상위 N개만 결과에 저장합니다
-    for p in np.argsort(-probs, axis=1)[0]: 
-        result[loaded_model.classes_[p]] = {}
-        result[loaded_model.classes_[p]]['rank'] = rank
-        result[loaded_model.classes_[p]]['probability'] = probs[0][p]
+# Batch prediction for POST /utilities/predict_cuisine_type_by_weather/batch, with the measured throughput
+# POST /utilities/predict_cuisine_type_by_weather/batch 용 일괄 예측으로, 측정된 처리량을 함께 반환합니다
+def predict_cuisine_type_by_weather_batch(request: utility_schema.CuisineTypePredictionBatchRequest):
+    rows = [[r.temperature, r.precipitation, r.cloudiness, r.snowfall, r.pressure] for r in request.rows]
 
-        if rank >= count: break
+    started = time.perf_counter()
+    predictions = predict_cuisine_types_by_weather_rows(rows, request.count)
+    seconds = time.perf_counter() - started
 
-        rank = rank + 1
+    return {
+        "predictions": predictions,
+        "rows": len(rows),
+        "seconds": seconds,
+        "rows_per_second": len(rows) / seconds if seconds > 0 else 0.0,
+    }
 
-    return result
+# Switch to another model version without a restart; a given version is also written to
+# ML_MODEL_CURRENT_FILE so every worker follows it (default: reload the version named there)
+# 재시작 없이 다른 모델 버전으로 전환합니다. 지정한 버전은 ML_MODEL_CURRENT_FILE에도 기록하여
+# 모든 워커가 따르게 합니다 (기본값: 파일에 적힌 버전을 다시 로드)
+def reload_model(version: str | None = None):
+    try:
+        if version:
+            model_registry.activate(version)
+        else:
+            model_registry.reload()
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                            detail=f"Could not load model version {version}: {e!r}")
+    return model_registry.stats()
@@ -0,0 +1,46 @@
+import asyncio
+import logging
+import time
+
+from starlette.concurrency import run_in_threadpool
+
+"""
+Helpers for background jobs started from the application lifespan.
+애플리케이션 수명 주기에서 시작되는 백그라운드 작업 도우미입니다.
+"""
+
+logger = logging.getLogger(__name__)
+
+
+# Run a blocking function every interval_seconds in the threadpool; errors are logged, not raised
+# 블로킹 함수를 interval_seconds마다 스레드풀에서 실행합니다 (예외는 로그로만 남깁니다)
+async def run_periodically(interval_seconds: float, func, *args):
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await run_in_threadpool(func, *args)
+        except Exception:
+            logger.exception("Background job %s failed", getattr(func, "__name__", func))
+
+
+# Run a coroutine function at every hour boundary (plus offset_seconds); errors are logged, not raised
+# 매 정각(offset_seconds 이후)마다 코루틴 함수를 실행합니다 (예외는 로그로만 남깁니다)
+async def run_hourly(offset_seconds: float, func, *args):
+    while True:
+        now = time.time()
+        next_run = now - now % 3600 + offset_seconds
+        if next_run <= now:
+            next_run += 3600
+        await asyncio.sleep(next_run - now)
+        try:
+            await func(*args)
+        except Exception:
+            logger.exception("Background job %s failed", getattr(func, "__name__", func))
+
+
+# Cancel background tasks and wait for them to finish
+# 백그라운드 작업을 취소하고 종료될 때까지 기다립니다
+async def cancel_tasks(tasks):
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,96 @@
+import logging
+import time
+from datetime import datetime
+
+from src.core.ml import ML_STATION_PREDICTION_COUNT
+from src.dependencies import weather_observations
+from src.dependencies.observation_stations import get_nearest_observation_station
+from src.dependencies.predict import model_registry, predict_cuisine_types_by_weather_rows, quantize_features
+from src.dependencies.weather import get_observation_hour
+
+"""
+Cuisine type predictions of every station for the current observation hour, kept in memory.
+Weather inputs only change per station and hour, so right after each hourly weather prefetch the
+whole table is scored in one batch, and coordinate searches resolve their predicted cuisine types
+with a nearest-station lookup and a dictionary read. Stations missing from the table (fetched on
+demand, or from another hour or model version) fall back to the per-request prediction path.
+
+현재 관측 시간에 대한 모든 관측소의 음식 유형 예측 결과를 메모리에 보관합니다.
+날씨 입력은 관측소와 시간 단위로만 바뀌므로, 매시간 날씨 사전 조회 직후 테이블 전체를 한 번의 배치로
+예측하며, 좌표 검색은 가장 가까운 관측소 조회와 딕셔너리 읽기만으로 예측 음식 유형을 얻습니다.
+테이블에 없는 관측소(필요 시 조회한 관측소, 다른 시간이나 다른 모델 버전)는 요청별 예측 경로를 사용합니다.
+"""
+
+logger = logging.getLogger(__name__)
+
+# os_id -> ((startDt, startHh), model version, {class: {"rank", "probability"}}); replaced as a whole
+# os_id -> ((startDt, startHh), 모델 버전, {클래스: {"rank", "probability"}}); 통째로 교체됩니다
+_predictions = {}
+
+_stats = {
+    "builds": 0,
+    "last_built_at": None,
+    "last_seconds": None,
+    "hour": None,
+    "version": None,
+    "hits": 0,
+    "misses": 0,
+}
+
+
+# Score the stored observations of the current hour and replace the table
+# 현재 시간의 저장된 관측값을 예측하여 테이블을 교체합니다
+def build_station_predictions():
+    global _predictions
+
+    hour = get_observation_hour(datetime.now())
+    observations = weather_observations.get_observations(hour)
+    if not observations:
+        return
+
+    # One snapshot of the artifacts, so the table is tagged with the version that scored it
+    # 아티팩트를 한 번만 가져와, 테이블에 실제로 예측한 버전을 기록합니다
+    started = time.perf_counter()
+    artifacts = model_registry.get()
+    version = artifacts.version
+    os_ids = list(observations)
+    rows = [quantize_features(weather_observations.observation_features(observations[os_id])) for os_id in os_ids]
+    predictions = predict_cuisine_types_by_weather_rows(rows, ML_STATION_PREDICTION_COUNT, artifacts=artifacts)
+
+    _predictions = {os_id: (hour, version, prediction) for os_id, prediction in zip(os_ids, predictions)}
+    _stats.update(
+        builds=_stats["builds"] + 1,
+        last_built_at=time.time(),
+        last_seconds=time.perf_counter() - started,
+        hour="".join(hour),
+        version=version,
+    )
+    logger.info("Built cuisine type predictions of %d stations for %s", len(os_ids), _stats["hour"])
+
+
+# Predicted cuisine types ({class: {"rank", "probability"}}) at the station nearest to the coordinates,
+# or None when the table has no current entry for it
+# 좌표에서 가장 가까운 관측소의 예측 음식 유형({클래스: {"rank", "probability"}})을 반환하며,
+# 테이블에 현재 항목이 없으면 None을 반환합니다
+def get_predicted_cuisine_types(latitude: float, longitude: float):
+    predictions = _predictions
+    if not predictions:
+        return None
+
+    station = get_nearest_observation_station(latitude, longitude)
+    entry = predictions.get(station.os_id) if station is not None else None
+    if entry is None or entry[0] != get_observation_hour(datetime.now()) or entry[1] != model_registry.get().version:
+        _stats["misses"] += 1
+        return None
+
+    _stats["hits"] += 1
+    return entry[2]
+
+
+# Build timings, the hour and model version of the table, and lookup counters
+# 구축 소요 시간, 테이블의 시간과 모델 버전, 조회 카운터
+def stats():
+    return {**_stats, "stations": len(_predictions)}
+
+
+weather_observations.add_prefetch_listener(build_station_predictions)
@@ -1,21 +1,42 @@
-import requests
 from datetime import datetime, timedelta
 
-from fastapi import Depends
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
 
 from src.core.weather import (
     DATA_GO_KR_API_KEY_DECODED,
     DATA_GO_KR_API_KEY_ENCODED,
     DATA_GO_KR_API_URL_USN,
     DATA_GO_KR_API_URL_WDL,
+    WEATHER_CACHE_MAXSIZE,
 )
 from src.dependencies.map import get_grid_by_coordinate
-from src.dependencies.database import get_db
+from src.dependencies.cache import TTLCache
+from src.dependencies.http_client import http_client
+from src.dependencies.observation_stations import get_nearest_observation_station, MAX_STATION_DISTANCE_KM
 
+# ASOS hourly observations shared across requests, keyed by (stnIds, startDt, startHh, dataType)
+# Observations change once an hour, so entries expire at the next hour boundary.
+# 요청 간에 공유되는 ASOS 시간별 관측 데이터로, (stnIds, startDt, startHh, dataType)을 키로 사용합니다
+# 관측값은 한 시간에 한 번 바뀌므로 항목은 다음 정각에 만료됩니다
+observation_cache = TTLCache("weather_observations", maxsize=WEATHER_CACHE_MAXSIZE, ttl=None)
 
-def get_ultra_srt_ncst_by_coordinate(
+
+# Unix time of the next hour boundary
+# 다음 정각의 Unix 시간
+def _next_hour(now: datetime):
+    return (now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)).timestamp()
+
+
+# Whether the API answered normally (error responses are not cached)
+# API가 정상 응답했는지 여부 (오류 응답은 캐시하지 않음)
+def _is_normal_response(data):
+    try:
+        return data["response"]["header"]["resultCode"] == "00"
+    except (KeyError, TypeError):
+        return False
+
+
+async def get_ultra_srt_ncst_by_coordinate(
     longitude: float = -118.2437, latitude: float = 34.0522, format: str = "json"
 ):
     # Fetch ultra short-term forecast data from weather API
@@ -38,42 +59,23 @@ def get_ultra_srt_ncst_by_coordinate(
         "ny": grid_y,
     }
 
-    response = requests.get(apiurl, params=params)
-    print(response.url)  # For debugging purposes / 디버깅용
+    response = await http_client.get("data_go_kr", apiurl, params=params)
 
     return response.json()
 
 
-def get_wthr_data_list_by_coordinate(
-    longitude: float = -118.2437,
-    latitude: float = 34.0522,
-    format: str = "json",
-    db: Session = Depends(get_db),
-):
-    # Fetch historical weather observation data from the nearest station
-    # 가장 가까운 관측소로부터 과거 관측 데이터를 조회합니다
+# (startDt, startHh) of the hourly observation requested at the given time
+# 주어진 시각에 요청하는 시간별 관측 데이터의 (startDt, startHh)
+def get_observation_hour(now: datetime):
+    return (now - timedelta(days=1)).strftime("%Y%m%d"), (now - timedelta(hours=1)).strftime("%H")
+
 
-    query = """
-        SELECT 
-            id, 
-            os_id, 
-            ( 6371 * acos(
-                cos(radians(%s)) * cos(radians(latitude)) *
-                cos(radians(longitude) - radians(%s)) +
-                sin(radians(%s)) * sin(radians(latitude))
-            )) AS distance,
-            latitude, longitude
-        FROM observation_stations
-        WHERE is_usable = 1
-        HAVING distance < 25
-        ORDER BY distance
-        LIMIT 1;
-    """ % (latitude, longitude, latitude)
-
-    result = db.execute(text(query))
-    nearest_observation_station = [r for r in result][0]
-
-    baseDate = datetime.now() - timedelta(days=1)
+async def get_wthr_data_list_by_station(os_id, format: str = "json"):
+    # Fetch historical weather observation data of one ASOS station (shared cache, one request per hour)
+    # ASOS 관측소 하나의 과거 관측 데이터를 조회합니다 (공유 캐시, 시간당 한 번 요청)
+
+    now = datetime.now()
+    startDt, startHh = get_observation_hour(now)
 
     apiurl = DATA_GO_KR_API_URL_WDL
     params = {
@@ -83,14 +85,36 @@ def get_wthr_data_list_by_coordinate(
         "dataType": format,
         "dataCd": "ASOS",
         "dateCd": "HR",
-        "startDt": baseDate.strftime("%Y%m%d"),
-        "startHh": (datetime.now() - timedelta(hours=1)).strftime("%H"),
-        "endDt": baseDate.strftime("%Y%m%d"),
-        "endHh": datetime.now().strftime("%H"),
-        "stnIds": nearest_observation_station[1],
+        "startDt": startDt,
+        "startHh": startHh,
+        "endDt": startDt,
+        "endHh": now.strftime("%H"),
+        "stnIds": os_id,
     }
 
-    response = requests.get(apiurl, params=params)
-    print(response.url)  # For debugging / 디버깅용 출력
+    async def fetch():
+        response = await http_client.get("data_go_kr", apiurl, params=params)
+        return response.json()
 
-    return response.json()
+    # Concurrent misses for the same station and hour wait on a single request
+    # 같은 관측소, 같은 시간에 대한 동시 미스는 하나의 요청을 함께 기다립니다
+    key = (params["stnIds"], params["startDt"], params["startHh"], format)
+    return await observation_cache.get_or_load_async(key, fetch, expires_at=_next_hour(now), cacheable=_is_normal_response)
+
+
+async def get_wthr_data_list_by_coordinate(
+    longitude: float = -118.2437,
+    latitude: float = 34.0522,
+    format: str = "json",
+):
+    # Fetch historical weather observation data from the nearest station
+    # 가장 가까운 관측소로부터 과거 관측 데이터를 조회합니다
+
+    # Nearest usable station from the in-memory station index (no database round trip)
+    # 메모리 관측소 인덱스에서 가장 가까운 사용 가능 관측소를 찾습니다 (데이터베이스 조회 없음)
+    nearest_observation_station = get_nearest_observation_station(latitude, longitude)
+    if nearest_observation_station is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                            detail=f"No observation station within {MAX_STATION_DISTANCE_KM} km")
+
+    return await get_wthr_data_list_by_station(nearest_observation_station.os_id, format)
@@ -0,0 +1,207 @@
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime
+
+from src.core.weather import (
+    WEATHER_PREFETCH_CONCURRENCY,
+    WEATHER_REQUEST_TIMEOUT_SECONDS,
+    WEATHER_BREAKER_FAILURE_THRESHOLD,
+)
+from src.dependencies.circuit_breaker import CircuitBreaker
+from src.dependencies.http_client import http_client
+from src.dependencies.observation_stations import get_nearest_observation_station, get_observation_stations
+from src.dependencies.weather import get_observation_hour, get_wthr_data_list_by_station
+
+"""
+Latest parsed ASOS observation of every usable station, kept in memory.
+A background job fetches all stations once an hour, so restaurant searches read the
+weather locally; a station missing from the map (e.g. before the first prefetch)
+is fetched on demand through the shared observation cache.
+Failures open a circuit breaker: searches then use the station's last good observation
+(or none, letting the caller fall back to a default) while a background probe waits
+for the API to recover.
+
+사용 가능한 모든 관측소의 최신 ASOS 관측값을 해석해 메모리에 보관합니다.
+백그라운드 작업이 한 시간에 한 번 모든 관측소를 조회하므로 식당 검색은 날씨를 로컬에서 읽으며,
+맵에 없는 관측소(예: 첫 사전 조회 전)는 공유 관측 캐시를 통해 그때그때 조회합니다.
+실패가 이어지면 서킷 브레이커가 열리고, 검색은 관측소의 마지막 정상 관측값을 사용하며
+(없으면 None을 반환해 호출자가 기본값을 사용), 백그라운드 점검이 API 복구를 기다립니다.
+"""
+
+logger = logging.getLogger(__name__)
+
+# Observation fields used by the cuisine type prediction
+# 음식 유형 예측에 사용하는 관측 항목
+OBSERVATION_FIELDS = ("ta", "dsnw", "dc10Tca", "pa")
+
+# os_id -> ((startDt, startHh), {field: value}); the last good observation of each station
+# os_id -> ((startDt, startHh), {항목: 값}); 관측소별 마지막 정상 관측값
+_observations = {}
+_lock = threading.Lock()
+
+# Callbacks run in a worker thread after each prefetch that stored observations (e.g. the prediction table)
+# 관측값을 저장한 사전 조회가 끝날 때마다 작업 스레드에서 실행되는 콜백 (예: 예측 테이블)
+_prefetch_listeners = []
+
+weather_breaker = CircuitBreaker("data_go_kr_asos", failure_threshold=WEATHER_BREAKER_FAILURE_THRESHOLD)
+
+_prefetch_stats = {
+    "runs": 0,
+    "last_started_at": None,
+    "last_seconds": None,
+    "stations": 0,
+    "succeeded": 0,
+    "failed": 0,
+    "skipped": 0,
+    "errors": [],
+}
+
+
+# Parse the first observation item into floats (missing values become 0.0)
+# Raises ValueError for error responses and responses without items.
+# 첫 번째 관측 항목을 실수로 변환합니다 (값이 없으면 0.0)
+# 오류 응답이나 항목이 없는 응답이면 ValueError를 발생시킵니다
+def parse_observation(data: dict):
+    try:
+        items = data['response']['body']['items']['item']
+    except (KeyError, TypeError):
+        raise ValueError("Unexpected observation response: %.200r" % (data,))
+    if not items:
+        raise ValueError("Observation response without items")
+    return {field: float(items[0].get(field, 0.0) or 0.0) for field in OBSERVATION_FIELDS}
+
+
+# Model input (temperature, precipitation, cloudiness, snowfall, pressure) of an observation
+# dsnw (snow depth) also stands in for precipitation, as the model was trained that way.
+# 관측값의 모델 입력 (기온, 강수량, 운량, 적설량, 기압)
+# 모델이 그렇게 학습되었으므로 dsnw(적설)를 강수량 자리에도 사용합니다
+def observation_features(observation: dict):
+    return observation['ta'], observation['dsnw'], observation['dc10Tca'], observation['dsnw'], observation['pa']
+
+
+def _store(os_id, hour, data):
+    observation = parse_observation(data)
+    with _lock:
+        _observations[os_id] = (hour, observation)
+    return observation
+
+
+# Fetch and store the current hour's observation of every usable station with bounded parallelism
+# 사용 가능한 모든 관측소의 현재 시간 관측값을 동시 요청 수를 제한하여 조회하고 저장합니다
+async def prefetch_observations():
+    # While the circuit is open the probe checks the API instead
+    # 회로가 열려 있는 동안에는 점검 작업이 API를 확인합니다
+    if weather_breaker.is_open:
+        _prefetch_stats["skipped"] += 1
+        return
+
+    stations = get_observation_stations()
+    hour = get_observation_hour(datetime.now())
+    semaphore = asyncio.Semaphore(WEATHER_PREFETCH_CONCURRENCY)
+    started = time.perf_counter()
+    _prefetch_stats["last_started_at"] = time.time()
+
+    async def prefetch(station):
+        async with semaphore:
+            try:
+                _store(station.os_id, hour, await get_wthr_data_list_by_station(station.os_id))
+            except Exception as e:
+                weather_breaker.record_failure(e)
+                raise
+            weather_breaker.record_success()
+
+    results = await asyncio.gather(*(prefetch(s) for s in stations), return_exceptions=True)
+    errors = [(s.os_id, r) for s, r in zip(stations, results) if isinstance(r, BaseException)]
+
+    _prefetch_stats.update(
+        runs=_prefetch_stats["runs"] + 1,
+        last_seconds=time.perf_counter() - started,
+        stations=len(stations),
+        succeeded=len(stations) - len(errors),
+        failed=len(errors),
+        errors=[f"{os_id}: {e!r}" for os_id, e in errors[:10]],
+    )
+    if errors:
+        logger.warning("Weather prefetch failed for %d of %d stations", len(errors), len(stations))
+    logger.info("Prefetched weather observations: %s", _prefetch_stats)
+
+    if len(errors) < len(stations):
+        for listener in _prefetch_listeners:
+            try:
+                await asyncio.to_thread(listener)
+            except Exception:
+                logger.exception("Weather prefetch listener %r failed", listener)
+
+
+# Register a callback to run after every successful prefetch
+# 사전 조회가 성공할 때마다 실행할 콜백을 등록합니다
+def add_prefetch_listener(listener):
+    _prefetch_listeners.append(listener)
+
+
+# Stored observations of the given (startDt, startHh) hour by station
+# 주어진 (startDt, startHh) 시간의 관측소별 저장된 관측값
+def get_observations(hour):
+    with _lock:
+        return {os_id: observation for os_id, (stored_hour, observation) in _observations.items() if stored_hour == hour}
+
+
+# Current observation fields ({"ta", "dsnw", "dc10Tca", "pa"}) at the station nearest to the coordinates
+# Served from memory after the hourly prefetch; otherwise fetched (waiting at most
+# WEATHER_REQUEST_TIMEOUT_SECONDS) and stored. When the API fails or the circuit is open,
+# the station's last good observation is returned, or None if there is none (or no station nearby).
+# 좌표에서 가장 가까운 관측소의 현재 관측 항목({"ta", "dsnw", "dc10Tca", "pa"})을 반환합니다
+# 매시간 사전 조회 이후에는 메모리에서 제공하며, 그렇지 않으면 (최대 WEATHER_REQUEST_TIMEOUT_SECONDS 동안)
+# 조회하여 저장합니다. API가 실패하거나 회로가 열려 있으면 관측소의 마지막 정상 관측값을,
+# 그것도 없으면 (또는 근처에 관측소가 없으면) None을 반환합니다
+def get_observation_by_coordinate(latitude: float, longitude: float):
+    station = get_nearest_observation_station(latitude, longitude)
+    if station is None:
+        return None
+
+    hour = get_observation_hour(datetime.now())
+    stored = _observations.get(station.os_id)
+    if stored is not None and stored[0] == hour:
+        return stored[1]
+
+    if weather_breaker.allow():
+        try:
+            data = http_client.run(get_wthr_data_list_by_station(station.os_id), timeout=WEATHER_REQUEST_TIMEOUT_SECONDS)
+            observation = _store(station.os_id, hour, data)
+        except Exception as e:
+            logger.warning("Weather observation for station %s unavailable: %r", station.os_id, e)
+            weather_breaker.record_failure(e)
+        else:
+            weather_breaker.record_success()
+            return observation
+
+    return stored[1] if stored is not None else None
+
+
+# Check the API while the circuit is open; on recovery close it and refill every station
+# 회로가 열려 있는 동안 API를 점검하며, 복구되면 회로를 닫고 모든 관측소를 다시 채웁니다
+def probe_weather_upstream():
+    if not weather_breaker.is_open:
+        return
+
+    stations = get_observation_stations()
+    if not stations:
+        return
+    try:
+        data = http_client.run(get_wthr_data_list_by_station(stations[0].os_id), timeout=WEATHER_REQUEST_TIMEOUT_SECONDS)
+        _store(stations[0].os_id, get_observation_hour(datetime.now()), data)
+    except Exception as e:
+        weather_breaker.record_failure(e)
+        return
+
+    logger.info("Weather API recovered; prefetching observations")
+    weather_breaker.record_success()
+    http_client.run(prefetch_observations())
+
+
+# Prefetch timings and failures, and the number of stored observations
+# 사전 조회 소요 시간과 실패 내역, 저장된 관측값 수
+def stats():
+    return {**_prefetch_stats, "observations": len(_observations), "breaker": weather_breaker.stats()}
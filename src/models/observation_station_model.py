@@ -0,0 +1,25 @@
+from sqlalchemy import BigInteger, Boolean, Column, Float, Integer
+
+from src.core.database import Base
+
+"""
+Defines the ASOS observation stations used to look up hourly weather observations.
+Only the columns read by the application are mapped.
+시간별 기상 관측 데이터를 조회할 때 사용하는 ASOS 관측소를 정의합니다.
+애플리케이션에서 사용하는 컬럼만 매핑합니다.
+"""
+class ObservationStation(Base):
+    __tablename__ = 'observation_stations'
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+
+    # ASOS station number passed to the API as stnIds
+    # API에 stnIds로 전달하는 ASOS 관측소 번호
+    os_id = Column(Integer, nullable=False)
+
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+
+    # Whether the station currently reports observations
+    # 관측소가 현재 관측값을 제공하는지 여부
+    is_usable = Column(Boolean, nullable=False, default=True)
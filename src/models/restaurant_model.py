@@ -5,6 +5,7 @@ from src.core.database import Base
 from src.models import restaurant_tag_model
 from src.models.restaurant_cuisine_type_model import RestaurantCuisineType
 from src.models.review_model import Review
+from src.models.restaurant_rating_model import RestaurantRating
 
 
 """
@@ -39,5 +40,6 @@ class Restaurant(Base):
     cuisine_types = relationship("RestaurantCuisineType", back_populates="restaurant")
     keywords = relationship("RestaurantKeyword", back_populates="restaurant")
     reviews = relationship("Review", back_populates="restaurant")
+    rating = relationship("RestaurantRating", back_populates="restaurant", uselist=False)
     blog_reviews = relationship("BlogReview", back_populates="restaurant")
     like_users = relationship("UserLike", back_populates="restaurant")
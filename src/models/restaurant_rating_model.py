@@ -0,0 +1,37 @@
+import datetime
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer
+from sqlalchemy.orm import relationship
+
+from src.core.database import Base
+
+"""
+Defines the per-restaurant review summary, kept up to date when reviews are added
+so listings can sort and filter by rating without aggregating the reviews table.
+리뷰가 추가될 때 갱신되는 식당별 리뷰 요약을 정의합니다.
+목록 조회에서 reviews 테이블을 집계하지 않고도 평점으로 정렬/필터링할 수 있습니다.
+"""
+class RestaurantRating(Base):
+    __tablename__ = 'restaurant_ratings'
+
+    restaurant_id = Column(ForeignKey('restaurants.id'), primary_key=True)
+
+    # Number of reviews, and of reviews that have a rating
+    # 리뷰 수와 평점이 있는 리뷰 수
+    review_count = Column(Integer, nullable=False, default=0)
+    rating_count = Column(Integer, nullable=False, default=0)
+
+    # Sum and average of the ratings (average is None until the first rating)
+    # 평점 합계와 평균 (첫 평점 전까지 평균은 None)
+    rating_sum = Column(Integer, nullable=False, default=0)
+    avg_rating = Column(Float, nullable=True, index=True)
+
+    # Creation time of the latest review
+    # 가장 최근 리뷰의 작성 시간
+    last_reviewed_at = Column(DateTime, nullable=True)
+
+    updated_at = Column(DateTime, nullable=False, default=datetime.datetime.now)
+
+    # Relationship to the summarized restaurant
+    # 요약 대상 음식점과의 관계
+    restaurant = relationship("Restaurant", back_populates="rating")
@@ -18,10 +18,28 @@ router = APIRouter(tags=["Restaurants"])
 @router.get("/", 
             response_model=list[restaurant_schema.RestaurantSearchResult])
 async def read_restaurants(
-    restaurants: list[restaurant_schema.RestaurantSearchResult] = Depends(restaurant_service.get_restaurants)
+    restaurants: list[restaurant_schema.RestaurantSearchResult] = Depends(restaurant_service.get_cached_restaurants)
 ):
     return restaurants
 
+# Count search results per tag, cuisine type and cuisine type category
+# 검색 결과의 태그, 음식 유형, 음식 유형 카테고리별 식당 수 조회
+@router.get("/facets", 
+            response_model=restaurant_schema.RestaurantFacets)
+async def read_restaurant_facets(
+    facets: restaurant_schema.RestaurantFacets = Depends(restaurant_service.get_restaurant_facets)
+):
+    return facets
+
+# Retrieve several restaurants by ID in one request (e.g. ?ids=3,1,2)
+# 여러 식당을 한 번에 조회 (예: ?ids=3,1,2)
+@router.get("/batch", 
+            response_model=restaurant_schema.RestaurantBatch)
+async def read_restaurants_by_ids(
+    batch: restaurant_schema.RestaurantBatch = Depends(restaurant_service.get_restaurants_by_ids)
+):
+    return batch
+
 # Retrieve a single restaurant by ID
 # 식당 상세 조회
 @router.get("/{id}", 
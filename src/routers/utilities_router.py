@@ -1,12 +1,16 @@
-import requests
-
 from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
 
+from src.dependencies.auth import get_access_token_data
 from src.dependencies.map import get_coordinate_by_address, get_address_by_coordinate
 from src.dependencies.weather import get_ultra_srt_ncst_by_coordinate, get_wthr_data_list_by_coordinate
 from src.dependencies.naver_serach_keywords import get_naver_search_keywords
-from src.dependencies.predict import predict_cuisine_type_by_weather
+from src.dependencies.autocomplete_index import get_autocomplete_suggestions
+from src.dependencies.predict import (
+    predict_cuisine_type_by_weather,
+    predict_cuisine_type_by_weather_batch,
+    reload_model,
+)
 
 from src.schemas import utility_schema
 from src.services import utility_service  
@@ -17,14 +21,14 @@ router = APIRouter(tags=["Utilities"])
 # 주소로부터 좌표(경도, 위도)를 조회합니다
 @router.get("/get_coordinate_by_address")
 async def read_coordinate_by_address(address: str):
-    response = get_coordinate_by_address(address)
+    response = await get_coordinate_by_address(address)
     return response
 
 # Get address from given coordinate (longitude, latitude)
 # 좌표(경도, 위도)로부터 주소를 조회합니다
 @router.get("/get_address_by_coordinate")
 async def read_address__by_coordinate(longitude: float, latitude: float):
-    response = get_address_by_coordinate(longitude, latitude)
+    response = await get_address_by_coordinate(longitude, latitude)
     return response
 
 # Get real-time weather observation data based on coordinate
@@ -45,8 +49,33 @@ async def read_wthr_data_list_by_coordinate(response: dict = Depends(get_wthr_da
 async def read_naver_search_keywords(response: dict = Depends(get_naver_search_keywords)):
     return response
 
+# Autocomplete keyword, tag, cuisine type and restaurant names from the local prefix index
+# 로컬 접두사 인덱스로 키워드, 태그, 음식 유형, 식당 이름을 자동완성합니다
+@router.get("/autocomplete")
+async def read_autocomplete(response: dict = Depends(get_autocomplete_suggestions)):
+    return response
+
 # Predict preferred cuisine types based on weather input
 # 날씨 정보에 기반하여 추천 음식 종류를 예측합니다
 @router.get("/predict_cuisine_type_by_weather")
 async def read_predicted_cuisine_type_by_weather(response: dict = Depends(predict_cuisine_type_by_weather)):
     return response
+
+# Predict preferred cuisine types for many weather rows in one call
+# 여러 날씨 행에 대한 추천 음식 종류를 한 번에 예측합니다
+@router.post("/predict_cuisine_type_by_weather/batch", response_model=utility_schema.CuisineTypePredictionBatch)
+async def read_predicted_cuisine_types_by_weather_batch(response: dict = Depends(predict_cuisine_type_by_weather_batch)):
+    return response
+
+# Load another model version and make it current for every worker (requires a valid access token)
+# 다른 모델 버전을 로드하여 모든 워커가 사용하도록 전환합니다 (유효한 액세스 토큰 필요)
+@router.post("/models/reload",
+             dependencies=[Depends(get_access_token_data)])
+async def read_reloaded_model(response: dict = Depends(reload_model)):
+    return response
+
+# Report the state of in-memory indexes and caches
+# 메모리 인덱스와 캐시의 상태를 조회합니다
+@router.get("/stats")
+async def read_stats(response: dict = Depends(utility_service.get_stats)):
+    return response
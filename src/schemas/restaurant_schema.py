@@ -36,6 +36,20 @@ class RestaurantCuisineType(BaseModel):
         from_attributes = True
         populate_by_name = True
 
+"""
+Review summary of a restaurant (count, average rating and latest review time).
+레스토랑의 리뷰 요약 정보(리뷰 수, 평균 평점, 최근 리뷰 시간)를 나타냅니다.
+"""
+class RestaurantRating(BaseModel):
+    review_count: int
+    rating_count: int
+    avg_rating: float | None = None
+    last_reviewed_at: datetime | None = None
+
+    class Config:
+        from_attributes = True
+        populate_by_name = True
+
 """
 Base schema for common restaurant information.
 레스토랑의 공통 정보를 정의하는 기본 스키마입니다.
@@ -57,6 +71,7 @@ class RestaurantBase(BaseModel):
     tags: list[RestaurantTag] | None = []
     keywords: list[RestaurantKeyword] | None = []
     cuisine_types: list[RestaurantCuisineType] | None = []
+    rating: RestaurantRating | None = None
 
     class Config:
         from_attributes = True
@@ -103,3 +118,32 @@ class RestaurantSearchResult(RestaurantSearchResultSimple):
     cuisine_types: list[RestaurantCuisineType] | None = []
     updated_at: datetime
     created_at: datetime
+    # Distance (km) from the searched coordinates; only set for coordinate searches
+    # 검색 좌표로부터의 거리(km)로, 좌표 검색일 때만 설정됩니다
+    distance_km: float | None = None
+
+"""
+Restaurants returned by a batch lookup, in the requested order, with the IDs that were not found.
+일괄 조회 결과로, 요청한 순서의 식당 목록과 찾지 못한 ID 목록입니다.
+"""
+class RestaurantBatch(BaseModel):
+    restaurants: list[RestaurantSearchResult] = []
+    missing_ids: list[int] = []
+
+"""
+Number of matching restaurants for a single facet value.
+단일 패싯 값에 해당하는 검색 결과 식당 수입니다.
+"""
+class RestaurantFacetCount(BaseModel):
+    name: str
+    count: int
+
+"""
+Facet counts of a restaurant search, per tag, cuisine type and cuisine type category.
+식당 검색 결과의 태그, 음식 유형, 음식 유형 카테고리별 패싯 집계입니다.
+"""
+class RestaurantFacets(BaseModel):
+    total: int
+    tags: list[RestaurantFacetCount] = []
+    cuisine_types: list[RestaurantFacetCount] = []
+    cuisine_type_categories: list[RestaurantFacetCount] = []
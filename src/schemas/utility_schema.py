@@ -1,6 +1,8 @@
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from src.core.ml import ML_PREDICT_BATCH_MAX_ROWS
 
 '''
 class UserBase(BaseModel):
@@ -9,3 +11,32 @@ class UserBase(BaseModel):
     class Config:
         from_attributes = True
 '''
+
+"""
+Weather features of one row scored by the cuisine type model.
+음식 유형 모델로 예측할 한 행의 날씨 특성입니다.
+"""
+class WeatherFeatures(BaseModel):
+    temperature: float = 0.0
+    precipitation: float = 0.0
+    cloudiness: float = 0.0
+    snowfall: float = 0.0
+    pressure: float = 0.0
+
+"""
+Request body of the batch cuisine type prediction: weather rows and classes to keep per row.
+일괄 음식 유형 예측 요청 본문으로, 날씨 행 목록과 행마다 반환할 클래스 수를 포함합니다.
+"""
+class CuisineTypePredictionBatchRequest(BaseModel):
+    rows: list[WeatherFeatures] = Field(max_length=ML_PREDICT_BATCH_MAX_ROWS)
+    count: int = 2
+
+"""
+Top classes of each row (same shape as the single-row prediction) and the measured throughput.
+행별 상위 클래스(단일 행 예측과 같은 형태)와 측정된 처리량입니다.
+"""
+class CuisineTypePredictionBatch(BaseModel):
+    predictions: list[dict[str, dict[str, int | float]]]
+    rows: int
+    seconds: float
+    rows_per_second: float
@@ -1,32 +1,280 @@
+from collections import namedtuple
+from datetime import datetime
 from enum import Enum
+
+import numpy as np
 from fastapi import Depends, HTTPException, status
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, distinct, func, literal, null, or_, select, union_all
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy.sql import text
 
-from src.models import restaurant_model, tag_model, restaurant_tag_model, cuisine_type_model
+from src.core.search import (
+    RESTAURANT_CACHE_TTL_SECONDS,
+    RESTAURANT_CACHE_MAXSIZE,
+    RESTAURANT_CACHE_COORDINATE_DECIMALS,
+    RESTAURANT_BATCH_MAX_IDS,
+)
+from src.core.weather import WEATHER_DEFAULT_CUISINE_TYPES
+from src.models import (
+    restaurant_model,
+    tag_model,
+    restaurant_tag_model,
+    cuisine_type_model,
+    restaurant_cuisine_type_model,
+    keyword_model,
+    restaurant_keyword_model,
+    restaurant_rating_model
+)
+from src.schemas import restaurant_schema
 from src.services import tag_service  
 from src.dependencies.database import get_db
+from src.dependencies.cache import TTLCache
+from src.dependencies import entity_events
 
 from src.dependencies.predict import predict_cuisine_type_by_weather
-from src.dependencies.weather import get_wthr_data_list_by_coordinate
+from src.dependencies.weather_observations import get_observation_by_coordinate, observation_features
+from src.dependencies.station_predictions import get_predicted_cuisine_types
+from src.dependencies.geo_index import restaurant_geo_index, haversine_km
+from src.dependencies import facet_index as facet
 
+# rating / review_count read the review summary (restaurants without reviews come last);
+# distance needs longitude, latitude and distance, and always returns the nearest first
+# rating / review_count는 리뷰 요약을 사용하며 (리뷰가 없는 식당은 마지막),
+# distance 정렬은 longitude, latitude, distance가 필요하며 항상 가까운 순으로 반환합니다
 class RestaurantOrderBy(str, Enum):
     name = "name"
     created_at = "created_at"
     updated_at = "updated_at"
+    rating = "rating"
+    review_count = "review_count"
+    distance = "distance"
 
 class Sort(str, Enum):
     asc = "asc"
     desc = "desc"
 
+# How filters on different facets are combined (values within one facet are always OR-ed)
+# 서로 다른 패싯의 필터를 결합하는 방식 (한 패싯 안의 값들은 항상 OR로 결합)
+class FilterMatch(str, Enum):
+    any = "any"
+    all = "all"
+
+# Bulk-load the tags, keywords and cuisine types serialized with each restaurant
+# (one SELECT ... IN per relation, however many restaurants are returned)
+# 식당과 함께 직렬화되는 태그, 키워드, 음식 유형을 일괄 로드합니다
+# (반환되는 식당 수와 관계없이 관계마다 SELECT ... IN 한 번)
+def _with_relations(query):
+    Restaurant = restaurant_model.Restaurant
+    return query.options(
+        selectinload(Restaurant.tags)
+            .selectinload(restaurant_tag_model.RestaurantTag.tag),
+        selectinload(Restaurant.keywords)
+            .selectinload(restaurant_keyword_model.RestaurantKeyword.keyword),
+        selectinload(Restaurant.cuisine_types)
+            .selectinload(restaurant_cuisine_type_model.RestaurantCuisineType.cuisine_type),
+        selectinload(Restaurant.rating),
+    )
+
 # Get restaurant by ID
 def get_restaurant_by_id(id: int, db: Session = Depends(get_db)):
-    restaurant = db.query(restaurant_model.Restaurant).filter(restaurant_model.Restaurant.id == id).first()
+    restaurant = _with_relations(db.query(restaurant_model.Restaurant))\
+        .filter(restaurant_model.Restaurant.id == id)\
+        .first()
     if not restaurant:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
     return restaurant
 
+# Get several restaurants by comma-separated IDs, in the requested order
+# The relations are loaded in bulk, so the number of queries does not depend on how many IDs are asked for;
+# IDs that do not exist are reported in missing_ids instead of failing the request.
+# 쉼표로 구분된 ID 목록으로 여러 식당을 요청한 순서대로 조회합니다
+# 관계를 일괄 로드하므로 ID 수와 관계없이 쿼리 수가 일정하며,
+# 존재하지 않는 ID는 요청을 실패시키지 않고 missing_ids로 반환합니다
+def get_restaurants_by_ids(ids: str, db: Session = Depends(get_db)):
+    try:
+        id_list = list(dict.fromkeys(int(id) for id in _split(ids) or []))
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ids must be comma-separated integers")
+    if len(id_list) > RESTAURANT_BATCH_MAX_IDS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=f"At most {RESTAURANT_BATCH_MAX_IDS} ids can be requested at once")
+
+    restaurants = _with_relations(db.query(restaurant_model.Restaurant))\
+        .filter(restaurant_model.Restaurant.id.in_(id_list))\
+        .all() if id_list else []
+    by_id = {r.id: r for r in restaurants}
+
+    return {
+        "restaurants": [by_id[id] for id in id_list if id in by_id],
+        "missing_ids": [id for id in id_list if id not in by_id],
+    }
+
+# Great-circle distance (km) from the given point, computed by the database
+# 주어진 지점으로부터의 대원 거리(km)를 데이터베이스에서 계산하는 식
+def _distance_expression(longitude: float, latitude: float):
+    Restaurant = restaurant_model.Restaurant
+    return 6371 * func.acos(
+        func.cos(func.radians(latitude)) * func.cos(func.radians(Restaurant.latitude)) *
+        func.cos(func.radians(Restaurant.longitude) - func.radians(longitude)) +
+        func.sin(func.radians(latitude)) * func.sin(func.radians(Restaurant.latitude))
+    )
+
+# Restaurant IDs having any of the given tag names (subquery)
+# 주어진 태그 이름 중 하나라도 가진 식당 ID 서브쿼리
+def _ids_by_tags(tag_list: list[str]):
+    RestaurantTag = restaurant_tag_model.RestaurantTag
+    return select(RestaurantTag.restaurant_id)\
+        .join(tag_model.Tag, tag_model.Tag.id == RestaurantTag.tag_id)\
+        .where(tag_model.Tag.name.in_(tag_list))
+
+# Restaurant IDs having a cuisine type in any of the given categories (subquery)
+# 주어진 카테고리 중 하나에 속한 음식 유형을 가진 식당 ID 서브쿼리
+def _ids_by_cuisine_type_categories(category_list: list[str]):
+    RestaurantCuisineType = restaurant_cuisine_type_model.RestaurantCuisineType
+    CuisineType = cuisine_type_model.CuisineType
+    CuisineTypeCategory = cuisine_type_model.CuisineTypeCategory
+    return select(RestaurantCuisineType.restaurant_id)\
+        .join(CuisineType, CuisineType.id == RestaurantCuisineType.cuisine_type_id)\
+        .join(CuisineTypeCategory, CuisineTypeCategory.id == CuisineType.cuisine_type_category_id)\
+        .where(CuisineTypeCategory.name.in_(category_list))
+
+# Restaurant IDs having any of the given cuisine type names (subquery)
+# 주어진 음식 유형 이름 중 하나라도 가진 식당 ID 서브쿼리
+def _ids_by_cuisine_types(cuisine_type_list: list[str]):
+    RestaurantCuisineType = restaurant_cuisine_type_model.RestaurantCuisineType
+    CuisineType = cuisine_type_model.CuisineType
+    return select(RestaurantCuisineType.restaurant_id)\
+        .join(CuisineType, CuisineType.id == RestaurantCuisineType.cuisine_type_id)\
+        .where(CuisineType.name.in_(cuisine_type_list))
+
+# Parsed search filters shared by the restaurant listing and the facet counts
+# 식당 목록 조회와 패싯 집계가 공유하는 검색 필터
+SearchFilters = namedtuple("SearchFilters", [
+    "tag_list", "category_list", "cuisine_type_list", "area",
+    "longitude", "latitude", "distance", "ids_by_coordinate", "match", "min_rating"
+])
+
+# Split a comma-separated filter value, ignoring blanks (None when empty)
+# 쉼표로 구분된 필터 값을 나눕니다 (빈 값은 무시하며, 비어 있으면 None)
+def _split(value: str | None):
+    values = [v.strip() for v in value.split(',') if v.strip()] if value else []
+    return values or None
+
+# Parse the query parameters; a coordinate search also adds the weather-predicted cuisine types
+# 쿼리 파라미터를 해석합니다. 좌표 검색이면 날씨로 예측한 음식 유형도 추가합니다
+def _parse_filters(tags, cuisine_type_categories, cuisine_types, area,
+                   longitude, latitude, distance, match: FilterMatch, min_rating, db: Session):
+    ids_by_coordinate = None
+
+    # If location and distance are provided, search nearby restaurants and get weather info
+    # 위치 정보가 제공되면 반경 내 식당을 조회하고 날씨 데이터를 가져옵니다.
+    if longitude and latitude and distance:
+        # Answer the radius query from the in-memory index; SQL computes distances until it is loaded
+        # 메모리 인덱스로 반경 검색을 처리하고, 적재 전에는 SQL에서 거리를 계산합니다
+        if restaurant_geo_index.ready:
+            ids_by_coordinate = [id for id, _ in restaurant_geo_index.query_radius(latitude, longitude, distance)]
+
+        # Read the nearest station's row of the hourly prediction table; otherwise predict from the
+        # hourly prefetched observations (no external call once they are loaded), and without any
+        # observation use the configured default cuisine types
+        # 매시간 구축한 예측 테이블에서 가장 가까운 관측소의 항목을 읽습니다. 없으면 매시간 미리 가져온
+        # 관측값으로 예측하며 (적재 이후에는 외부 호출 없음), 관측값이 전혀 없으면 설정된 기본 음식 유형을 사용합니다
+        prediction = get_predicted_cuisine_types(latitude, longitude)
+        if prediction is None:
+            weather = get_observation_by_coordinate(latitude, longitude)
+            if weather is not None:
+                prediction = predict_cuisine_type_by_weather(*observation_features(weather))
+
+        if prediction is None:
+            predicted_types = WEATHER_DEFAULT_CUISINE_TYPES
+        else:
+            predicted_types = ",".join(prediction.keys())
+        cuisine_types = (cuisine_types + "," + predicted_types) if cuisine_types else predicted_types
+    else:
+        longitude = latitude = distance = None
+
+    return SearchFilters(
+        tag_list=_split(tags),
+        category_list=_split(cuisine_type_categories),
+        cuisine_type_list=_split(cuisine_types),
+        area=area,
+        longitude=longitude,
+        latitude=latitude,
+        distance=distance,
+        ids_by_coordinate=ids_by_coordinate,
+        match=match,
+        min_rating=min_rating,
+    )
+
+# Whether every filter can be answered by the in-memory indexes (area and rating filters need SQL)
+# 모든 필터를 메모리 인덱스로 처리할 수 있는지 여부 (지역, 평점 필터는 SQL 필요)
+def _is_indexed(filters: SearchFilters):
+    return facet.facet_index.ready and not filters.area and filters.min_rating is None \
+        and (filters.distance is None or filters.ids_by_coordinate is not None)
+
+# Matching restaurant IDs from the in-memory facet index (None = no filter, every restaurant)
+# 메모리 패싯 인덱스에서 일치하는 식당 ID를 계산합니다 (None이면 필터 없음, 전체 식당)
+def _get_ids_from_index(filters: SearchFilters):
+    index = facet.facet_index
+    id_sets = []
+
+    if filters.ids_by_coordinate is not None:
+        id_sets.append(np.unique(np.asarray(filters.ids_by_coordinate, dtype=np.int64)))
+    if filters.tag_list:
+        id_sets.append(index.ids_by_tags(filters.tag_list))
+    if filters.category_list:
+        id_sets.append(index.ids_by_cuisine_type_categories(filters.category_list))
+    if filters.cuisine_type_list:
+        id_sets.append(index.ids_by_cuisine_types(filters.cuisine_type_list))
+
+    if not id_sets:
+        return None
+    if filters.match == FilterMatch.all:
+        return facet.intersection(id_sets)
+    return facet.union(id_sets)
+
+# Filters as one SQL condition on restaurants (None = no filter)
+# 필터를 식당 테이블에 대한 하나의 SQL 조건으로 만듭니다 (None이면 필터 없음)
+def _get_sql_condition(filters: SearchFilters):
+    Restaurant = restaurant_model.Restaurant
+    conditions = []
+
+    if filters.distance is not None:
+        if filters.ids_by_coordinate is not None:
+            conditions.append(Restaurant.id.in_(filters.ids_by_coordinate))
+        else:
+            conditions.append(_distance_expression(filters.longitude, filters.latitude) < filters.distance)
+
+    # Filter by tag
+    if filters.tag_list:
+        conditions.append(Restaurant.id.in_(_ids_by_tags(filters.tag_list)))
+
+    # Filter by cuisine type category
+    if filters.category_list:
+        conditions.append(Restaurant.id.in_(_ids_by_cuisine_type_categories(filters.category_list)))
+
+    # Filter by cuisine types
+    if filters.cuisine_type_list:
+        conditions.append(Restaurant.id.in_(_ids_by_cuisine_types(filters.cuisine_type_list)))
+
+    # Filter by area string in address
+    if filters.area:
+        conditions.append(Restaurant.address.ilike(f'%{filters.area}%'))
+
+    condition = (and_ if filters.match == FilterMatch.all else or_)(*conditions) if conditions else None
+
+    # The minimum rating always narrows the result, whatever the match mode
+    # 최소 평점은 결합 방식과 관계없이 항상 결과를 좁힙니다
+    if filters.min_rating is not None:
+        RestaurantRating = restaurant_rating_model.RestaurantRating
+        by_rating = Restaurant.id.in_(
+            select(RestaurantRating.restaurant_id).where(RestaurantRating.avg_rating >= filters.min_rating)
+        )
+        condition = by_rating if condition is None else and_(condition, by_rating)
+
+    return condition
+
 # Get restaurants based on multiple filters including location and weather
 # 위치와 날씨 정보를 포함한 다양한 조건으로 식당을 조회합니다.
 def get_restaurants(tags: str | None=None, 
@@ -36,116 +284,225 @@ def get_restaurants(tags: str | None=None,
                     longitude: float | None=None, 
                     latitude: float | None=None, 
                     distance: float | None=None,
+                    match: FilterMatch = FilterMatch.any,
+                    min_rating: float | None = None,
                     skip: int = 0, 
                     limit: int = 100, 
                     order_by: RestaurantOrderBy = RestaurantOrderBy.updated_at, 
                     sort: Sort = Sort.desc, 
                     db: Session = Depends(get_db)):
 
-    include_ids_by_coordinate = []
+    Restaurant = restaurant_model.Restaurant
+    if order_by == RestaurantOrderBy.distance and not (longitude and latitude and distance):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="order_by=distance requires longitude, latitude and distance")
 
-    # If location and distance are provided, search nearby restaurants and get weather info
-    # 위치 정보가 제공되면 반경 내 식당을 조회하고 날씨 데이터를 가져옵니다.
-    if longitude and latitude and distance:
-        query = f"""
-            SELECT 
-                id,
-                ( 6371 * acos( cos( radians({latitude}) ) * cos( radians(latitude ) ) * cos( radians( longitude ) - radians({longitude}) ) + sin( radians({latitude}) ) * sin( radians( latitude ) ) ) ) AS distance,
-                latitude, longitude
-            FROM restaurants
-            HAVING distance < {distance}
-            ORDER BY distance;
-        """
-        result = db.execute(text(query))
-        include_ids_by_coordinate = [r[0] for r in result]
-        include_ids_by_coordinate = list(dict.fromkeys(include_ids_by_coordinate))
-
-        weather_info = get_wthr_data_list_by_coordinate(longitude, latitude, "json", db)
-        weather = weather_info['response']['body']['items']['item'][0]
-
-        temperature = float(weather.get('ta', 0.0) or 0.0)
-        precipitation = float(weather.get('dsnw', 0.0) or 0.0)
-        cloudiness = float(weather.get('dc10Tca', 0.0) or 0.0)
-        snowfall = float(weather.get('dsnw', 0.0) or 0.0)
-        pressure = float(weather.get('pa', 0.0) or 0.0)
-
-        prediction = predict_cuisine_type_by_weather(temperature, precipitation, cloudiness, snowfall, pressure)
-        predicted_types = ",".join(prediction.keys())
-        cuisine_types = (cuisine_types + "," + predicted_types) if cuisine_types else predicted_types
+    filters = _parse_filters(tags, cuisine_type_categories, cuisine_types, area,
+                             longitude, latitude, distance, match, min_rating, db)
 
-    include_ids_by_tags = []
+    # When every filter and the ordering are indexed, only one page of IDs is fetched from the database
+    # 모든 필터와 정렬 기준이 인덱스에 있으면 데이터베이스에서는 한 페이지 분량의 ID만 조회합니다
+    if _is_indexed(filters) and (order_by.value in facet.FacetIndex.SORT_KEYS or order_by == RestaurantOrderBy.distance):
+        ids = _get_ids_from_index(filters)
+        if order_by == RestaurantOrderBy.distance:
+            page_ids = _nearest_page(ids, filters.latitude, filters.longitude, skip, limit)
+        else:
+            page_ids = facet.facet_index.page(ids, order_by.value, sort == Sort.desc, skip, limit)
+        restaurants = _with_relations(db.query(Restaurant)).filter(Restaurant.id.in_(page_ids)).all()
+        restaurants_by_id = {r.id: r for r in restaurants}
+        return _with_distances([restaurants_by_id[id] for id in page_ids if id in restaurants_by_id], filters)
 
-    # Filter by tag
-    if tags:
-        tag_list = tags.split(',')
-        tags = db.query(tag_model.Tag).filter(tag_model.Tag.name.in_(tag_list)).all()
-        for t in tags:
-            for r in t.restaurants:
-                include_ids_by_tags.append(r.restaurant_id)
-        include_ids_by_tags = list(dict.fromkeys(include_ids_by_tags))
+    # Otherwise query restaurants using filters and sorting in a single statement
+    # 그렇지 않으면 필터와 정렬 조건을 하나의 쿼리로 묶어 식당 데이터를 조회합니다.
+    query = _with_relations(db.query(Restaurant))
+    condition = _get_sql_condition(filters)
+    if condition is not None:
+        query = query.filter(condition)
 
-    include_ids_by_cuisine_type_categories = []
+    if order_by == RestaurantOrderBy.distance:
+        query = query.order_by(Restaurant.latitude.is_(None),
+                               _distance_expression(filters.longitude, filters.latitude),
+                               Restaurant.id)
+    elif order_by in (RestaurantOrderBy.rating, RestaurantOrderBy.review_count):
+        RestaurantRating = restaurant_rating_model.RestaurantRating
+        column = RestaurantRating.avg_rating if order_by == RestaurantOrderBy.rating else RestaurantRating.review_count
+        query = query.outerjoin(RestaurantRating, RestaurantRating.restaurant_id == Restaurant.id)\
+            .order_by(column.is_(None), column.desc() if sort == Sort.desc else column.asc(), Restaurant.id)
+    else:
+        query = query.order_by(text(f"{order_by.value} {sort.value}"))
 
-    # Filter by cuisine type category
-    if cuisine_type_categories:
-        category_list = cuisine_type_categories.split(',')
-        cuisine_type_categories = db.query(cuisine_type_model.CuisineTypeCategory).filter(
-            cuisine_type_model.CuisineTypeCategory.name.in_(category_list)).all()
+    restaurants = query\
+        .offset(skip)\
+        .limit(limit)\
+        .all()
 
-        for cc in cuisine_type_categories:
-            for c in cc.cuisine_types:
-                for r in c.restaurants:
-                    include_ids_by_cuisine_type_categories.append(r.restaurant_id)
-        include_ids_by_cuisine_type_categories = list(dict.fromkeys(include_ids_by_cuisine_type_categories))
+    return _with_distances(restaurants, filters)
 
-    include_ids_by_cuisine_types = []
+# IDs of the page nearest to the given point, selecting only the first skip + limit matches
+# A partial sort (np.partition) finds the cut-off distance; only matches within it are fully sorted,
+# with ties broken by id so pages stay stable.
+# 주어진 지점에서 가장 가까운 페이지의 ID를 반환하며, 앞쪽 skip + limit 개만 선택합니다
+# 부분 정렬(np.partition)로 기준 거리를 구한 뒤 그 이내의 결과만 정렬하며,
+# 페이지가 안정적이도록 거리가 같으면 id 순으로 정렬합니다
+def _nearest_page(ids, latitude: float, longitude: float, skip: int, limit: int):
+    if ids is None:
+        ids = facet.facet_index.all_ids()
+    k = min(skip + limit, len(ids))
+    if k <= skip:
+        return []
 
-    # Filter by cuisine types
-    if cuisine_types:
-        cuisine_type_list = cuisine_types.split(',')
-        cuisine_types = db.query(cuisine_type_model.CuisineType).filter(
-            cuisine_type_model.CuisineType.name.in_(cuisine_type_list)).all()
+    distances = restaurant_geo_index.distances(latitude, longitude, ids)
+    if k < len(ids):
+        cutoff = np.partition(distances, k - 1)[k - 1]
+        candidates = np.flatnonzero(distances <= cutoff)
+    else:
+        candidates = np.arange(len(ids))
 
-        for c in cuisine_types:
-            for r in c.restaurants:
-                include_ids_by_cuisine_types.append(r.restaurant_id)
-        include_ids_by_cuisine_types = list(dict.fromkeys(include_ids_by_cuisine_types))
+    order = candidates[np.lexsort((ids[candidates], distances[candidates]))]
+    return ids[order[skip:k]].tolist()
 
-    include_ids_by_area = []
+# Attach distance_km (from the searched point) to each restaurant when searching by coordinates
+# 좌표 검색이면 각 식당에 검색 지점으로부터의 거리 distance_km를 추가합니다
+def _with_distances(restaurants, filters: SearchFilters):
+    if filters.distance is None:
+        return restaurants
+    for r in restaurants:
+        if r.latitude is not None and r.longitude is not None:
+            r.distance_km = float(haversine_km(filters.latitude, filters.longitude, r.latitude, r.longitude))
+        else:
+            r.distance_km = None
+    return restaurants
 
-    # Filter by area string in address
-    if area:
-        restaurants = db.query(restaurant_model.Restaurant).filter(
-            restaurant_model.Restaurant.address.ilike(f'%{area}%')).all()
-
-        for r in restaurants:
-            include_ids_by_area.append(r.id)
-        include_ids_by_area = list(dict.fromkeys(include_ids_by_area))
-
-    # Merge all matching restaurant IDs from filters
-    include_ids = (
-        include_ids_by_tags +
-        include_ids_by_cuisine_type_categories +
-        include_ids_by_area +
-        include_ids_by_coordinate +
-        include_ids_by_cuisine_types
+# Count matching restaurants per tag, cuisine type and cuisine type category in one pass
+# 검색 결과에 대해 태그, 음식 유형, 음식 유형 카테고리별 식당 수를 한 번에 집계합니다
+def get_restaurant_facets(tags: str | None=None, 
+                          cuisine_type_categories: str | None=None, 
+                          cuisine_types: str | None=None, 
+                          area: str | None=None, 
+                          longitude: float | None=None, 
+                          latitude: float | None=None, 
+                          distance: float | None=None,
+                          match: FilterMatch = FilterMatch.any,
+                          min_rating: float | None = None,
+                          db: Session = Depends(get_db)):
+
+    filters = _parse_filters(tags, cuisine_type_categories, cuisine_types, area,
+                             longitude, latitude, distance, match, min_rating, db)
+
+    if _is_indexed(filters):
+        return facet.facet_index.count(_get_ids_from_index(filters))
+
+    return _count_facets_sql(_get_sql_condition(filters), db)
+
+# Facet counts from one grouped SQL statement (fallback while the facet index is not ready)
+# 그룹 집계 SQL 한 번으로 패싯 수를 계산합니다 (패싯 인덱스 준비 전 대체 경로)
+def _count_facets_sql(condition, db: Session):
+    Restaurant = restaurant_model.Restaurant
+    RestaurantTag = restaurant_tag_model.RestaurantTag
+    RestaurantCuisineType = restaurant_cuisine_type_model.RestaurantCuisineType
+    CuisineType = cuisine_type_model.CuisineType
+    CuisineTypeCategory = cuisine_type_model.CuisineTypeCategory
+
+    matched = select(Restaurant.id)
+    if condition is not None:
+        matched = matched.where(condition)
+    matched = matched.subquery()
+
+    by_tags = select(literal("tags").label("facet"), tag_model.Tag.name, func.count(distinct(RestaurantTag.restaurant_id)))\
+        .join(tag_model.Tag, tag_model.Tag.id == RestaurantTag.tag_id)\
+        .where(RestaurantTag.restaurant_id.in_(select(matched.c.id)))\
+        .group_by(tag_model.Tag.name)
+    by_cuisine_types = select(literal("cuisine_types").label("facet"), CuisineType.name, func.count(distinct(RestaurantCuisineType.restaurant_id)))\
+        .join(CuisineType, CuisineType.id == RestaurantCuisineType.cuisine_type_id)\
+        .where(RestaurantCuisineType.restaurant_id.in_(select(matched.c.id)))\
+        .group_by(CuisineType.name)
+    by_categories = select(literal("cuisine_type_categories").label("facet"), CuisineTypeCategory.name, func.count(distinct(RestaurantCuisineType.restaurant_id)))\
+        .join(CuisineType, CuisineType.id == RestaurantCuisineType.cuisine_type_id)\
+        .join(CuisineTypeCategory, CuisineTypeCategory.id == CuisineType.cuisine_type_category_id)\
+        .where(RestaurantCuisineType.restaurant_id.in_(select(matched.c.id)))\
+        .group_by(CuisineTypeCategory.name)
+    total = select(literal("total").label("facet"), null(), func.count()).select_from(matched)
+
+    result = {"total": 0, "tags": [], "cuisine_types": [], "cuisine_type_categories": []}
+    for facet_name, name, count in db.execute(union_all(by_tags, by_cuisine_types, by_categories, total)):
+        if facet_name == "total":
+            result["total"] = count
+        else:
+            result[facet_name].append({"name": name, "count": count})
+
+    for facet_name in ("tags", "cuisine_types", "cuisine_type_categories"):
+        result[facet_name].sort(key=lambda c: (-c["count"], c["name"]))
+    return result
+
+# Cache of serialized GET /restaurants responses, cleared whenever listed data changes
+# 직렬화된 GET /restaurants 응답 캐시로, 목록 데이터가 변경되면 비워집니다
+restaurant_cache = TTLCache("restaurants", maxsize=RESTAURANT_CACHE_MAXSIZE, ttl=RESTAURANT_CACHE_TTL_SECONDS)
+
+entity_events.subscribe(
+    [
+        restaurant_model.Restaurant,
+        tag_model.Tag,
+        cuisine_type_model.CuisineType,
+        cuisine_type_model.CuisineTypeCategory,
+        keyword_model.Keyword,
+        restaurant_tag_model.RestaurantTag,
+        restaurant_cuisine_type_model.RestaurantCuisineType,
+        restaurant_keyword_model.RestaurantKeyword,
+        restaurant_rating_model.RestaurantRating,
+    ],
+    lambda changes: restaurant_cache.clear(),
+)
+
+# Get restaurants through the response cache
+# Filter lists are sorted and coordinates quantized so equivalent queries share one entry;
+# coordinate searches are also keyed by hour because the weather prediction changes hourly.
+# 응답 캐시를 거쳐 식당을 조회합니다
+# 동일한 검색이 하나의 항목을 공유하도록 필터 목록은 정렬하고 좌표는 양자화하며,
+# 날씨 예측은 매시간 바뀌므로 좌표 검색은 시간 단위로도 구분합니다
+def get_cached_restaurants(tags: str | None=None, 
+                           cuisine_type_categories: str | None=None, 
+                           cuisine_types: str | None=None, 
+                           area: str | None=None, 
+                           longitude: float | None=None, 
+                           latitude: float | None=None, 
+                           distance: float | None=None,
+                           match: FilterMatch = FilterMatch.any,
+                           min_rating: float | None = None,
+                           skip: int = 0, 
+                           limit: int = 100, 
+                           order_by: RestaurantOrderBy = RestaurantOrderBy.updated_at, 
+                           sort: Sort = Sort.desc, 
+                           db: Session = Depends(get_db)):
+
+    # The key and the query use the same normalized area, so one entry never serves two different queries
+    # 키와 쿼리에 같은 정규화된 지역을 사용하므로, 하나의 항목이 서로 다른 쿼리의 결과를 제공하지 않습니다
+    area = (area or "").strip() or None
+
+    hour = None
+    if longitude and latitude and distance:
+        longitude = round(longitude, RESTAURANT_CACHE_COORDINATE_DECIMALS)
+        latitude = round(latitude, RESTAURANT_CACHE_COORDINATE_DECIMALS)
+        distance = round(distance, 3)
+        hour = datetime.now().strftime("%Y%m%d%H")
+
+    key = (
+        tuple(sorted(set(_split(tags) or []))),
+        tuple(sorted(set(_split(cuisine_type_categories) or []))),
+        tuple(sorted(set(_split(cuisine_types) or []))),
+        area,
+        longitude, latitude, distance, hour,
+        FilterMatch(match).value, min_rating, skip, limit, RestaurantOrderBy(order_by).value, Sort(sort).value,
     )
-    include_ids = list(dict.fromkeys(include_ids))
-
-    # Query restaurants using filters and sorting
-    # 필터와 정렬 조건에 맞게 식당 데이터를 조회합니다.
-    if include_ids:
-        restaurants = db.query(restaurant_model.Restaurant)\
-            .filter(restaurant_model.Restaurant.id.in_(include_ids))\
-            .order_by(text(f"{order_by.value} {sort.value}"))\
-            .offset(skip)\
-            .limit(limit)\
-            .all()
-    else:
-        restaurants = db.query(restaurant_model.Restaurant)\
-            .order_by(text(f"{order_by.value} {sort.value}"))\
-            .offset(skip)\
-            .limit(limit)\
-            .all()
+
+    restaurants = restaurant_cache.get(key)
+    if restaurants is None:
+        generation = restaurant_cache.generation
+        restaurants = [
+            restaurant_schema.RestaurantSearchResult.model_validate(r)
+            for r in get_restaurants(tags, cuisine_type_categories, cuisine_types, area,
+                                     longitude, latitude, distance, match, min_rating,
+                                     skip, limit, order_by, sort, db)
+        ]
+        restaurant_cache.set(key, restaurants, generation=generation)
 
     return restaurants
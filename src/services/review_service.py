@@ -2,10 +2,14 @@ from datetime import datetime
 from enum import Enum
 from fastapi import Depends, HTTPException, status
 
+from sqlalchemy import case, or_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import text
-from src.models import review_model
+from src.models import review_model, restaurant_rating_model
 from src.schemas import review_schema
+from src.dependencies import entity_events
 from src.dependencies.database import get_db
 
 
@@ -67,7 +71,57 @@ def add_review(review: review_schema.ReviewCreate, db: Session = Depends(get_db)
     )
 
     db.add(db_review)
+    _record_rating(db, db_review)
     db.commit()
     db.refresh(db_review)
 
     return db_review
+
+# Add a new review to its restaurant's rating summary (in the review's transaction)
+# A single upsert creates or increments the row, so concurrent reviews of one restaurant, including
+# its first ones, are counted one after another by the database. Assignments only read the old
+# column values (avg_rating comes first because MySQL applies them left to right).
+# 새 리뷰를 해당 식당의 평점 요약에 반영합니다 (리뷰와 같은 트랜잭션)
+# 하나의 upsert로 행을 만들거나 증가시키므로, 첫 리뷰를 포함한 같은 식당의 동시 리뷰는 데이터베이스가
+# The upsert bypasses the ORM, so the change is published to entity_events by hand for cache subscribers.
+# 순서대로 집계합니다. 갱신식은 이전 컬럼 값만 읽습니다 (MySQL은 왼쪽부터 적용하므로 avg_rating이 먼저 옵니다)
+# upsert는 ORM을 거치지 않으므로, 캐시 구독자를 위해 변경을 entity_events에 직접 알립니다
+def _record_rating(db: Session, review: review_model.Review):
+    RestaurantRating = restaurant_rating_model.RestaurantRating
+    rated = review.rating is not None
+    rating = review.rating if rated else 0
+    now = datetime.now()
+
+    values = dict(
+        restaurant_id=review.restaurant_id,
+        review_count=1,
+        rating_count=1 if rated else 0,
+        rating_sum=rating,
+        avg_rating=float(rating) if rated else None,
+        last_reviewed_at=review.created_at,
+        updated_at=now,
+    )
+    updates = [
+        ("review_count", RestaurantRating.review_count + 1),
+        ("last_reviewed_at", case(
+            (or_(RestaurantRating.last_reviewed_at.is_(None), RestaurantRating.last_reviewed_at < review.created_at),
+             review.created_at),
+            else_=RestaurantRating.last_reviewed_at,
+        )),
+        ("updated_at", now),
+    ]
+    if rated:
+        updates = [
+            ("avg_rating", (RestaurantRating.rating_sum + rating) * 1.0 / (RestaurantRating.rating_count + 1)),
+            ("rating_count", RestaurantRating.rating_count + 1),
+            ("rating_sum", RestaurantRating.rating_sum + rating),
+        ] + updates
+
+    if db.get_bind().dialect.name == "mysql":
+        statement = mysql_insert(RestaurantRating).values(**values).on_duplicate_key_update(updates)
+    else:
+        statement = sqlite_insert(RestaurantRating).values(**values).on_conflict_do_update(
+            index_elements=[RestaurantRating.restaurant_id], set_=dict(updates)
+        )
+    db.execute(statement)
+    entity_events.publish(db, entity_events.EntityChange("update", RestaurantRating, values))
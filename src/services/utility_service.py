@@ -0,0 +1,29 @@
+from src.dependencies.geo_index import restaurant_geo_index
+from src.dependencies import facet_index
+from src.dependencies.autocomplete_index import autocomplete_index
+from src.dependencies import naver_serach_keywords
+from src.dependencies.observation_stations import station_index
+from src.dependencies.http_client import http_client
+from src.dependencies import weather_observations, station_predictions
+from src.dependencies.geocode_cache import geocode_cache
+from src.dependencies.predict import model_registry, prediction_cache, inference_worker
+from src.dependencies.weather import observation_cache
+from src.services.restaurant_service import restaurant_cache
+
+# Report the state of in-memory indexes and caches
+# 메모리 인덱스와 캐시의 상태를 조회합니다
+def get_stats():
+    return {
+        "geo_index": restaurant_geo_index.stats(),
+        "facet_index": facet_index.facet_index.stats(),
+        "observation_stations": station_index.stats(),
+        "autocomplete_index": autocomplete_index.stats(),
+        "caches": [restaurant_cache.stats(), observation_cache.stats(), prediction_cache.stats()],
+        "upstreams": http_client.stats(),
+        "naver_search_keywords": naver_serach_keywords.stats(),
+        "weather_prefetch": weather_observations.stats(),
+        "station_predictions": station_predictions.stats(),
+        "geocode_cache": geocode_cache.stats(),
+        "model": model_registry.stats(),
+        "inference_worker": inference_worker.stats(),
+    }
@@ -0,0 +1,110 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.dependencies import autocomplete_index, naver_serach_keywords
+from src.dependencies.cache import TTLCache
+from src.dependencies.http_client import HttpClient
+
+from tests.restaurant_test import _seed
+
+"""
+PYTHONPATH=. pytest
+"""
+
+ROWS = [
+    ("cuisine_type", "국밥", 120),
+    ("cuisine_type", "국수", 80),
+    ("keyword", "국물 맛집", 40),
+    ("restaurant", "강남 국밥집", 15),
+    ("restaurant", "구기동 칼국수", 30),
+    ("restaurant", "광화문 국밥", 5),
+    ("tag", "주차", 300),
+    ("restaurant", "Burger King", 10),
+]
+
+
+@pytest.fixture
+def index():
+    index = autocomplete_index.AutocompleteIndex()
+    index.load(ROWS)
+    return index
+
+
+def _names(suggestions):
+    return [s["name"] for s in suggestions]
+
+
+# Complete and half-typed syllables match by jamo prefix ("국" may still become "구기"), most popular first
+# 완성된 음절과 입력 중인 음절은 자모 접두사로 일치하며 ("국"은 "구기"가 될 수 있음), 인기도 순으로 정렬됩니다
+@pytest.mark.parametrize("query, expected", [
+    ("국", ["국밥", "국수", "국물 맛집", "구기동 칼국수", "강남 국밥집", "광화문 국밥"]),
+    ("국ㅂ", ["국밥", "강남 국밥집", "광화문 국밥"]),
+    ("구", ["국밥", "국수", "국물 맛집", "구기동 칼국수", "강남 국밥집", "광화문 국밥"]),
+    ("국바", ["국밥", "강남 국밥집", "광화문 국밥"]),
+    ("강남 국", ["강남 국밥집"]),
+    ("bur", ["Burger King"]),
+    ("king", ["Burger King"]),
+    ("냉면", []),
+])
+def test_prefix_match(index, query, expected):
+    assert _names(index.suggest(query, 10)) == expected
+
+
+# Initial-consonant queries match the consonants of each syllable
+# 초성 검색어는 음절별 초성과 일치해야 합니다
+def test_choseong_match(index):
+    assert _names(index.suggest("ㄱㅂ", 10)) == ["국밥", "강남 국밥집", "광화문 국밥"]
+    assert _names(index.suggest("ㄱ", 3)) == ["국밥", "국수", "국물 맛집"]
+
+
+# Popularity of repeated names is summed and entries appear once even when several words match
+# 같은 이름의 인기도는 합산되며, 여러 단어가 일치해도 항목은 한 번만 나타납니다
+def test_duplicates(index):
+    index.load(ROWS + [("restaurant", "광화문 국밥", 200), ("restaurant", "국밥 국밥 국밥", 1)])
+
+    assert index.suggest("광화", 1) == [{"name": "광화문 국밥", "type": "restaurant", "score": 205}]
+    assert _names(index.suggest("국밥", 10)).count("국밥 국밥 국밥") == 1
+
+
+# Names and popularity are loaded from the database
+# 이름과 인기도는 데이터베이스에서 적재되어야 합니다
+def test_load_from_database(sqlite_db, monkeypatch):
+    _seed(sqlite_db)
+    index = autocomplete_index.AutocompleteIndex()
+    monkeypatch.setattr(autocomplete_index, "autocomplete_index", index)
+    autocomplete_index.load_autocomplete_index(sqlite_db)
+
+    assert index.suggest("주", 1) == [{"name": "주차", "type": "tag", "score": 15}]
+    assert index.suggest("ㄱㅂ", 1) == [{"name": "국밥", "type": "cuisine_type", "score": 10}]
+    assert index.suggest("맛", 1) == [{"name": "맛집", "type": "keyword", "score": 30}]
+    assert len(index.suggest("식당", 50)) == 30
+
+
+# Naver suggestions top up the local ones and are cached; a failing Naver leaves the local ones
+# 네이버 추천어는 로컬 추천어의 부족분을 채우고 캐시되며, 네이버 오류 시 로컬 추천어만 반환합니다
+def test_naver_secondary_source(index, monkeypatch):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.params["q"] == "오류":
+            return httpx.Response(500)
+        return httpx.Response(200, json={"items": [[["국밥"], ["국밥 맛집"], ["국밥 레시피"]]]})
+
+    client = HttpClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(naver_serach_keywords, "http_client", client)
+    monkeypatch.setattr(autocomplete_index, "autocomplete_index", index)
+    monkeypatch.setattr(naver_serach_keywords, "naver_cache", TTLCache("test", ttl=None))
+    monkeypatch.setattr(autocomplete_index, "AUTOCOMPLETE_NAVER_TIMEOUT_SECONDS", 5)
+    try:
+        for _ in range(2):
+            response = asyncio.run(autocomplete_index.get_autocomplete_suggestions("국ㅂ", limit=5, naver=True))
+            assert _names(response["suggestions"]) == ["국밥", "강남 국밥집", "광화문 국밥", "국밥 맛집", "국밥 레시피"]
+        assert len(requests) == 1
+
+        response = asyncio.run(autocomplete_index.get_autocomplete_suggestions("오류", limit=5, naver=True))
+        assert response["suggestions"] == []
+    finally:
+        client.close()
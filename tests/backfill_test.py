@@ -0,0 +1,97 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from src.commands import backfill_restaurant_coordinates as backfill
+from src.models import restaurant_model
+
+from tests.restaurant_test import _seed
+
+"""
+PYTHONPATH=. pytest
+"""
+
+# Seeded restaurants ("서울 강남구 {i}") whose coordinates are all missing
+# 좌표가 모두 비어 있는 시드 식당 ("서울 강남구 {i}")
+@pytest.fixture
+def restaurants(sqlite_db):
+    _seed(sqlite_db)
+    for r in sqlite_db.query(restaurant_model.Restaurant):
+        r.latitude = r.longitude = None
+    sqlite_db.commit()
+
+
+def _coordinates(db):
+    return {
+        r.id: (r.latitude, r.longitude)
+        for r in db.query(restaurant_model.Restaurant).populate_existing()
+    }
+
+
+# Every resolvable address gets its coordinates; unresolved ones stay empty
+# 변환 가능한 모든 주소에 좌표가 채워지고, 변환하지 못한 주소는 비어 있어야 합니다
+def test_backfill(sqlite_db, restaurants, vworld, tmp_path):
+    checkpoint = str(tmp_path / "checkpoint")
+    result = asyncio.run(backfill.backfill_restaurant_coordinates(sqlite_db, checkpoint, batch_size=7, rate=1000))
+
+    assert result == {"processed": 30, "updated": 27, "unresolved": 3, "failed": 0}
+    assert len(vworld) == 30
+
+    coordinates = _coordinates(sqlite_db)
+    assert coordinates[12] == pytest.approx((37.012, 127.012))
+    assert coordinates[20] == (None, None)
+
+
+# A run resumes after the checkpoint instead of starting over
+# 실행은 처음부터가 아니라 체크포인트 이후부터 재개되어야 합니다
+def test_backfill_resumes_from_checkpoint(sqlite_db, restaurants, vworld, tmp_path):
+    checkpoint = tmp_path / "checkpoint"
+    checkpoint.write_text("15")
+
+    result = asyncio.run(backfill.backfill_restaurant_coordinates(sqlite_db, str(checkpoint), rate=1000))
+
+    assert result["processed"] == 15
+    assert sorted(int(r.url.params["address"].rsplit(" ", 1)[1]) for r in vworld) == list(range(16, 31))
+    assert _coordinates(sqlite_db)[15] == (None, None)
+    assert checkpoint.read_text() == "30"
+
+
+# Transient failures are counted apart from unresolved addresses, and the checkpoint stays below
+# the first failed restaurant so the next run retries the failed ones
+# 일시적인 실패는 찾지 못한 주소와 따로 집계되며, 체크포인트는 실패한 첫 식당보다 앞에 머물러
+# 다음 실행에서 실패한 식당을 다시 시도해야 합니다
+def test_backfill_retries_failures(sqlite_db, restaurants, vworld, tmp_path, monkeypatch):
+    checkpoint = tmp_path / "checkpoint"
+    get_coordinate_by_address = backfill.map_api.get_coordinate_by_address
+
+    async def flaky(address):
+        if address.endswith((" 12", " 17")):
+            raise httpx.ReadTimeout("timed out")
+        return await get_coordinate_by_address(address)
+
+    with monkeypatch.context() as m:
+        m.setattr(backfill.map_api, "get_coordinate_by_address", flaky)
+        result = asyncio.run(backfill.backfill_restaurant_coordinates(sqlite_db, str(checkpoint), batch_size=7, rate=1000))
+
+    assert result == {"processed": 30, "updated": 25, "unresolved": 3, "failed": 2}
+    assert checkpoint.read_text() == "11"
+    assert _coordinates(sqlite_db)[12] == (None, None)
+
+    result = asyncio.run(backfill.backfill_restaurant_coordinates(sqlite_db, str(checkpoint), rate=1000))
+
+    assert result == {"processed": 4, "updated": 2, "unresolved": 2, "failed": 0}
+    assert checkpoint.read_text() == "30"
+    assert _coordinates(sqlite_db)[17] == pytest.approx((37.017, 127.017))
+
+
+# Requests are spread out by the rate limit
+# 요청은 속도 제한에 따라 분산되어야 합니다
+def test_backfill_rate_limit(sqlite_db, restaurants, vworld):
+    started = time.perf_counter()
+    asyncio.run(backfill.backfill_restaurant_coordinates(sqlite_db, None, concurrency=2, rate=100))
+
+    # 2 requests of burst, then 28 at 100 per second
+    # 처음 2개 요청은 한 번에, 나머지 28개는 초당 100개
+    assert time.perf_counter() - started >= 0.27
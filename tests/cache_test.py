@@ -0,0 +1,118 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.dependencies.cache import TTLCache
+from src.models import tag_model
+from src.services import restaurant_service
+
+from tests.restaurant_test import _seed, _StatementCounter
+
+"""
+PYTHONPATH=. pytest
+"""
+
+# Entries expire, the least recently used entry is evicted first and counters are kept
+# 항목은 만료되고, 가장 오래 사용하지 않은 항목이 먼저 제거되며, 카운터가 기록되어야 합니다
+def test_ttl_and_lru():
+    cache = TTLCache("test", maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+    cache.set("d", 4, expires_at=time.time() - 1)
+    assert cache.get("d") is None
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (3, 2, 2)
+
+
+# A value computed before clear() is not stored
+# clear() 이전에 계산된 값은 저장되지 않아야 합니다
+def test_generation_guard():
+    cache = TTLCache("test")
+    generation = cache.generation
+    cache.clear()
+    cache.set("a", 1, generation=generation)
+
+    assert cache.get("a") is None
+
+
+# Concurrent misses on one key share a single load
+# 같은 키에 대한 동시 미스는 하나의 로드를 공유해야 합니다
+def test_get_or_load_single_flight():
+    cache = TTLCache("test")
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        release.wait(5)
+        return "value"
+
+    with ThreadPoolExecutor(8) as pool:
+        futures = [pool.submit(cache.get_or_load, "key", loader) for _ in range(8)]
+        while cache.stats()["waits"] < 7:
+            time.sleep(0.01)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert results == ["value"] * 8
+    assert len(calls) == 1
+    assert cache.get("key") == "value"
+
+
+# Failed or uncacheable loads are not stored
+# 실패했거나 캐시할 수 없는 로드 결과는 저장되지 않아야 합니다
+def test_get_or_load_does_not_store_failures():
+    cache = TTLCache("test")
+
+    def failing():
+        raise RuntimeError("upstream error")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load("key", failing)
+    assert cache.get_or_load("key", lambda: {"error": True}, cacheable=lambda v: "error" not in v) == {"error": True}
+    assert cache.get("key") is None
+
+
+# Equivalent queries share an entry, and a commit to a listed entity invalidates it
+# 동일한 검색은 항목을 공유하며, 목록에 포함되는 엔티티가 커밋되면 무효화되어야 합니다
+def test_restaurant_cache_invalidation(sqlite_db, monkeypatch):
+    _seed(sqlite_db)
+    monkeypatch.setattr(restaurant_service, "restaurant_cache", TTLCache("restaurants"))
+
+    first = restaurant_service.get_cached_restaurants(tags="주차, 포장", limit=5, db=sqlite_db)
+    with _StatementCounter(sqlite_db) as counter:
+        second = restaurant_service.get_cached_restaurants(tags="포장,주차", limit=5, db=sqlite_db)
+
+    assert counter.statements == []
+    assert second is first
+    assert first[0].tags[0].tag.name == "주차"
+
+    tag = sqlite_db.get(tag_model.Tag, 1)
+    tag.name = "주차가능"
+    sqlite_db.commit()
+
+    third = restaurant_service.get_cached_restaurants(tags="포장,주차가능", limit=5, db=sqlite_db)
+    assert third[0].tags[0].tag.name == "주차가능"
+    assert restaurant_service.restaurant_cache.stats()["invalidations"] == 1
+
+
+# Areas differing only by surrounding spaces share an entry and run the same (trimmed) query
+# 앞뒤 공백만 다른 지역은 항목을 공유하며 같은 (공백을 제거한) 쿼리를 실행해야 합니다
+def test_restaurant_cache_normalizes_area(sqlite_db, monkeypatch):
+    _seed(sqlite_db)
+    monkeypatch.setattr(restaurant_service, "restaurant_cache", TTLCache("restaurants"))
+
+    padded = restaurant_service.get_cached_restaurants(area=" 강남구 2 ", limit=100, db=sqlite_db)
+    trimmed = restaurant_service.get_cached_restaurants(area="강남구 2", limit=100, db=sqlite_db)
+
+    assert trimmed is padded
+    assert {r.id for r in padded} == {2, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29}
@@ -0,0 +1,155 @@
+import httpx
+import pytest
+
+from sqlalchemy import BigInteger, create_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.core.database import Base
+# restaurant_model must be imported first to resolve the models' circular imports
+# 모델 간 순환 import를 풀기 위해 restaurant_model을 먼저 import합니다
+from src.models import restaurant_model
+from src.models import (
+    access_token_model,
+    article_model,
+    blog_review_model,
+    cuisine_type_model,
+    keyword_model,
+    observation_station_model,
+    restaurant_cuisine_type_model,
+    restaurant_keyword_model,
+    restaurant_rating_model,
+    restaurant_tag_model,
+    review_model,
+    tag_model,
+    user_follow_model,
+    user_like_model,
+    user_model,
+)
+from src.commands.train_cuisine_model import train_cuisine_model
+from src.dependencies import geocode_cache, map, observation_stations, predict
+from src.dependencies.geo_index import GeoIndex
+from src.dependencies.http_client import HttpClient
+
+"""
+Shared fixtures for tests that need a throwaway database instead of the MySQL server.
+MySQL 서버 대신 임시 데이터베이스가 필요한 테스트용 공통 픽스처입니다.
+"""
+
+# SQLite only autoincrements INTEGER PRIMARY KEY columns
+# SQLite는 INTEGER PRIMARY KEY 컬럼만 자동 증가시킵니다
+@compiles(BigInteger, "sqlite")
+def _compile_big_integer_sqlite(type_, compiler, **kw):
+    return "INTEGER"
+
+
+# SQLite cannot autoincrement part of a composite primary key (restaurant_has_tags.id)
+# SQLite는 복합 기본 키의 일부를 자동 증가시킬 수 없습니다 (restaurant_has_tags.id)
+def _disable_composite_autoincrement():
+    for table in Base.metadata.tables.values():
+        if len(table.primary_key.columns) > 1:
+            for column in table.primary_key.columns:
+                column.autoincrement = False
+
+
+# In-memory SQLite session with every model table created
+# 모든 모델 테이블이 생성된 메모리 SQLite 세션
+@pytest.fixture
+def sqlite_db():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    _disable_composite_autoincrement()
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+# Seoul, Incheon, Suwon (not usable), Daejeon
+# 서울, 인천, 수원(사용 불가), 대전
+STATIONS = [
+    (1, 108, 37.5714, 126.9658, True),
+    (2, 112, 37.4777, 126.6249, True),
+    (3, 119, 37.2723, 126.9853, False),
+    (4, 133, 36.3720, 127.3721, True),
+]
+
+
+# Fresh station index loaded from SQLite
+# SQLite에서 적재한 새 관측소 인덱스
+@pytest.fixture
+def stations(sqlite_db, monkeypatch):
+    for id, os_id, latitude, longitude, is_usable in STATIONS:
+        sqlite_db.add(observation_station_model.ObservationStation(
+            id=id, os_id=os_id, latitude=latitude, longitude=longitude, is_usable=is_usable
+        ))
+    sqlite_db.commit()
+
+    monkeypatch.setattr(observation_stations, "station_index", GeoIndex("test"))
+    monkeypatch.setattr(observation_stations, "_stations", {})
+    observation_stations.load_observation_stations(sqlite_db)
+    return observation_stations
+
+
+# VWorld API stand-in: an address ending in a number i resolves to (37 + i / 1000, 127 + i / 1000),
+# unless i is a multiple of 10; other addresses are not found, and reverse geocodes always succeed
+# VWorld API 대체: 숫자 i로 끝나는 주소는 (37 + i / 1000, 127 + i / 1000)로 변환되며 (i가 10의 배수이면 제외),
+# 그 밖의 주소는 찾을 수 없고, 역지오코딩은 항상 성공합니다
+def _vworld(requests):
+    def handler(request):
+        requests.append(request)
+        address = request.url.params.get("address")
+        if address is None:
+            i = 0
+        else:
+            number = address.rsplit(" ", 1)[-1]
+            if not number.isdigit() or int(number) % 10 == 0:
+                return httpx.Response(200, json={"response": {"status": "NOT_FOUND"}})
+            i = int(number)
+        return httpx.Response(200, json={
+            "response": {"status": "OK", "result": {"point": {"x": str(127 + i / 1000), "y": str(37 + i / 1000)}}}
+        })
+    return handler
+
+
+# Mocked VWorld client and an empty geocode cache in a temporary file; yields the requests sent
+# 모의 VWorld 클라이언트와 임시 파일의 빈 지오코딩 캐시로, 보낸 요청 목록을 반환합니다
+@pytest.fixture
+def vworld(tmp_path, monkeypatch):
+    requests = []
+    client = HttpClient(transport=httpx.MockTransport(_vworld(requests)))
+    cache = geocode_cache.GeocodeCache(str(tmp_path / "geocode.sqlite3"), ttl=60)
+    monkeypatch.setattr(map, "http_client", client)
+    monkeypatch.setattr(map, "VWORLD_API_URL", "https://example.com/vworld")
+    monkeypatch.setattr(geocode_cache, "geocode_cache", cache)
+    yield requests
+    client.close()
+    cache.close()
+
+
+# Tiny cuisine type model trained from the bundled CSV, served by the app's model registry for the
+# whole session, so prediction tests do not depend on artifacts under ML_MODEL_DIR
+# 포함된 CSV로 학습한 작은 음식 유형 모델로, 세션 동안 앱의 모델 레지스트리가 제공하므로
+# 예측 테스트는 ML_MODEL_DIR 아래의 아티팩트에 의존하지 않습니다
+@pytest.fixture(scope="session", autouse=True)
+def cuisine_model(tmp_path_factory):
+    model_dir = tmp_path_factory.mktemp("models")
+    train_cuisine_model(model_dir=str(model_dir), version="test", nthread=1, n_estimators=2,
+                        benchmark_rounds=1, benchmark_batch_rows=10)
+
+    registry = predict.model_registry
+    saved = registry.model_dir, registry.version
+    registry.model_dir = str(model_dir)
+    registry.reload("test")
+    yield registry.get()
+
+    registry.model_dir, registry.version = saved
+    registry._active = None
@@ -0,0 +1,194 @@
+import datetime
+import time
+
+import pytest
+
+from fastapi import HTTPException
+
+from src.dependencies import entity_events, facet_index
+from src.dependencies.geo_index import GeoIndex
+from src.models import restaurant_model, restaurant_tag_model
+from src.services import restaurant_service
+
+from tests.restaurant_test import _seed
+
+"""
+PYTHONPATH=. pytest
+"""
+
+# Fresh facet index loaded from the seeded SQLite session
+# 시드 데이터가 들어간 SQLite 세션으로 적재한 새 패싯 인덱스
+@pytest.fixture
+def index(sqlite_db, monkeypatch):
+    _seed(sqlite_db)
+    index = facet_index.FacetIndex()
+    monkeypatch.setattr(facet_index, "facet_index", index)
+    facet_index.load_facet_index(sqlite_db)
+    return index
+
+
+# Spread the seeded restaurants north of Gangnam station, load a geo index and
+# replace the weather lookup with a fixed observation that predicts nothing
+# 시드 식당들을 강남역 북쪽으로 흩어 놓고 위치 인덱스를 적재하며,
+# 날씨 조회는 아무것도 예측하지 않는 고정 관측값으로 대체합니다
+@pytest.fixture
+def geo(sqlite_db, index, monkeypatch):
+    for r in sqlite_db.query(restaurant_model.Restaurant):
+        r.latitude = 37.4984 + (r.id * 7 % 30) * 0.001
+    sqlite_db.commit()
+
+    geo = GeoIndex("test")
+    geo.load((r.id, r.latitude, r.longitude) for r in sqlite_db.query(restaurant_model.Restaurant))
+    monkeypatch.setattr(restaurant_service, "restaurant_geo_index", geo)
+    monkeypatch.setattr(restaurant_service, "get_observation_by_coordinate",
+                        lambda *args: {"ta": 0.0, "dsnw": 0.0, "dc10Tca": 0.0, "pa": 0.0})
+    monkeypatch.setattr(restaurant_service, "predict_cuisine_type_by_weather", lambda *args: {})
+    return geo
+
+
+# Search through the index returns the same page as the SQL path
+# 인덱스를 통한 검색은 SQL 경로와 같은 페이지를 반환해야 합니다
+@pytest.mark.parametrize("match", ["any", "all"])
+@pytest.mark.parametrize("sort", ["asc", "desc"])
+def test_index_matches_sql(sqlite_db, index, match, sort):
+    params = dict(tags="주차", cuisine_type_categories="한식", match=match, skip=1, limit=3,
+                  order_by=restaurant_service.RestaurantOrderBy.updated_at,
+                  sort=restaurant_service.Sort(sort))
+
+    from_index = [r.id for r in restaurant_service.get_restaurants(**params, db=sqlite_db)]
+
+    index._ready = False
+    from_sql = [r.id for r in restaurant_service.get_restaurants(**params, db=sqlite_db)]
+
+    assert from_index == from_sql
+    assert len(from_index) == 3
+
+
+# AND / OR set algebra across facets
+# 패싯 간 AND / OR 집합 연산
+def test_set_algebra(index):
+    by_tag = index.ids_by_tags(["주차"])
+    by_category = index.ids_by_cuisine_type_categories(["한식"])
+
+    assert by_tag.tolist() == list(range(1, 31, 2))
+    assert by_category.tolist() == list(range(3, 31, 3))
+    assert facet_index.intersection([by_tag, by_category]).tolist() == [3, 9, 15, 21, 27]
+    assert len(facet_index.union([by_tag, by_category])) == 20
+
+
+# Committed association changes are applied without a reload
+# 커밋된 연결 테이블 변경은 재적재 없이 반영되어야 합니다
+def test_incremental_association_changes(sqlite_db, index):
+    sqlite_db.add(restaurant_tag_model.RestaurantTag(id=100, restaurant_id=2, tag_id=2))
+    sqlite_db.commit()
+    assert index.ids_by_tags(["포장"]).tolist() == [2]
+
+    row = sqlite_db.query(restaurant_tag_model.RestaurantTag).filter_by(id=1).one()
+    sqlite_db.delete(row)
+    sqlite_db.commit()
+    assert 1 not in index.ids_by_tags(["주차"]).tolist()
+
+
+# An association update moves the restaurant from the old facet to the new one
+# 연결 테이블 수정은 식당을 이전 패싯에서 새 패싯으로 옮겨야 합니다
+def test_association_update(sqlite_db, index):
+    row = sqlite_db.query(restaurant_tag_model.RestaurantTag).filter_by(id=1).one()
+    row.tag_id = 2
+    sqlite_db.commit()
+
+    assert 1 not in index.ids_by_tags(["주차"]).tolist()
+    assert index.ids_by_tags(["포장"]).tolist() == [1]
+
+
+# Changes swap in new posting dicts, so a reader iterating the old one is unaffected
+# 변경은 새 포스팅 딕셔너리로 교체되므로, 이전 딕셔너리를 순회하는 쪽은 영향을 받지 않아야 합니다
+def test_apply_is_copy_on_write(index):
+    postings = index._tag_postings
+    before = dict(postings)
+    reader = iter(postings.items())
+    next(reader)
+
+    index.apply([entity_events.EntityChange("insert", restaurant_tag_model.RestaurantTag,
+                                            {"id": 100, "restaurant_id": 2, "tag_id": 99})])
+
+    list(reader)
+    assert postings == before
+    assert index._tag_postings[99].tolist() == [2]
+
+
+# Facet counts from the index equal the grouped SQL counts
+# 인덱스의 패싯 집계는 그룹 SQL 집계와 같아야 합니다
+@pytest.mark.parametrize("params", [
+    {},
+    {"tags": "주차"},
+    {"tags": "주차", "cuisine_types": "국밥", "match": "all"},
+])
+def test_facet_counts_match_sql(sqlite_db, index, params):
+    params = {"match": "any", **params}
+
+    from_index = restaurant_service.get_restaurant_facets(**params, db=sqlite_db)
+
+    index._ready = False
+    from_sql = restaurant_service.get_restaurant_facets(**params, db=sqlite_db)
+
+    assert from_index == from_sql
+
+
+# Counts cover only the current result set
+# 집계는 현재 검색 결과에 대해서만 계산됩니다
+def test_facet_counts(index):
+    counts = index.count(index.ids_by_tags(["주차"]))
+
+    assert counts["total"] == 15
+    assert counts["tags"] == [{"name": "주차", "count": 15}]
+    assert counts["cuisine_types"] == [{"name": "국밥", "count": 5}]
+    assert counts["cuisine_type_categories"] == [{"name": "한식", "count": 5}]
+
+
+# Nearest-first pages from the index equal the SQL ordering and carry distance_km
+# 인덱스의 가까운 순 페이지는 SQL 정렬 결과와 같고 distance_km를 포함해야 합니다
+@pytest.mark.parametrize("params", [
+    {},
+    {"tags": "주차", "match": "any"},
+    {"tags": "주차", "match": "all"},
+])
+def test_order_by_distance_matches_sql(sqlite_db, index, geo, params):
+    params = dict(longitude=127.0322, latitude=37.4984, distance=2.0, skip=2, limit=5,
+                  order_by=restaurant_service.RestaurantOrderBy.distance, **params)
+
+    from_index = [(r.id, r.distance_km) for r in restaurant_service.get_restaurants(**params, db=sqlite_db)]
+
+    index._ready = False
+    from_sql = [(r.id, r.distance_km) for r in restaurant_service.get_restaurants(**params, db=sqlite_db)]
+
+    assert from_index == from_sql
+    assert len(from_index) == 5
+    assert [d for _, d in from_index] == sorted(d for _, d in from_index)
+
+
+# Distance ordering without coordinates is rejected
+# 좌표 없이 거리 정렬을 요청하면 거부되어야 합니다
+def test_order_by_distance_requires_coordinates(sqlite_db, index):
+    with pytest.raises(HTTPException) as error:
+        restaurant_service.get_restaurants(order_by=restaurant_service.RestaurantOrderBy.distance, db=sqlite_db)
+    assert error.value.status_code == 400
+
+
+# An index older than max_age is not used, so searches see other workers' writes through SQL
+# max_age보다 오래된 인덱스는 사용하지 않으므로, 검색은 SQL로 다른 워커의 변경을 보게 됩니다
+def test_stale_index_falls_back_to_sql(sqlite_db, index, monkeypatch):
+    index.max_age = 60
+    assert index.ready
+
+    # Another worker adds a restaurant: no commit event reaches this process
+    # 다른 워커가 식당을 추가한 경우: 이 프로세스에는 커밋 이벤트가 전달되지 않습니다
+    monkeypatch.setattr(entity_events, "_subscribers", [])
+    now = datetime.datetime(2030, 1, 1)
+    sqlite_db.add(restaurant_model.Restaurant(id=31, name="식당 31", address="서울", phone="02-000-0000",
+                                              created_at=now, updated_at=now))
+    sqlite_db.commit()
+    assert restaurant_service.get_restaurants(limit=1, db=sqlite_db)[0].id == 30
+
+    index._loaded_at = time.time() - 61
+    assert not index.ready
+    assert restaurant_service.get_restaurants(limit=1, db=sqlite_db)[0].id == 31
@@ -0,0 +1,152 @@
+import datetime
+
+import numpy as np
+from sqlalchemy import update
+
+from src.dependencies import geo_index
+from src.dependencies.geo_index import GeoIndex, haversine_km
+from src.models import restaurant_model
+
+"""
+PYTHONPATH=. pytest
+"""
+
+# Random points scattered around Gangnam station
+# 강남역 주변에 흩어진 임의의 지점들
+def _random_points(n, seed=0):
+    rng = np.random.default_rng(seed)
+    lat = 37.4984 + rng.uniform(-0.2, 0.2, n)
+    lon = 127.0322 + rng.uniform(-0.2, 0.2, n)
+    return list(zip(range(1, n + 1), lat.tolist(), lon.tolist()))
+
+
+# Brute-force reference answer for a radius query
+# 반경 검색의 전수 비교용 기준 결과
+def _brute_force(points, latitude, longitude, distance):
+    result = [(i, float(haversine_km(latitude, longitude, lat, lon))) for i, lat, lon in points]
+    return sorted([r for r in result if r[1] < distance], key=lambda r: r[1])
+
+
+# The index must return exactly the brute-force haversine result, nearest first
+# 인덱스 결과는 전수 하버사인 계산 결과와 정확히 일치하고 가까운 순이어야 합니다
+def test_query_radius_matches_brute_force():
+    points = _random_points(5000)
+    index = GeoIndex("test")
+    index.load(points)
+
+    for distance in (0.5, 2, 10):
+        expected = _brute_force(points, 37.4984, 127.0322, distance)
+        result = index.query_radius(37.4984, 127.0322, distance)
+        assert [r[0] for r in result] == [e[0] for e in expected]
+        assert np.allclose([r[1] for r in result], [e[1] for e in expected])
+
+
+# Nearest lookups agree with brute force and respect the distance limit and pending changes
+# 최근접 조회는 전수 계산과 일치하며, 거리 제한과 대기 중인 변경을 반영해야 합니다
+def test_nearest_matches_brute_force():
+    points = _random_points(2000)
+    index = GeoIndex("test")
+    index.load(points)
+
+    for latitude, longitude in ((37.4984, 127.0322), (37.6, 126.9), (37.3, 127.2)):
+        expected = _brute_force(points, latitude, longitude, 100)[0]
+        assert index.nearest(latitude, longitude, 100)[0] == expected[0]
+        assert index.nearest(latitude, longitude, expected[1] * 0.999) is None
+
+    nearest_id = index.nearest(37.4984, 127.0322, 100)[0]
+    index.remove(nearest_id)
+    assert index.nearest(37.4984, 127.0322, 100)[0] == _brute_force(points, 37.4984, 127.0322, 100)[1][0]
+    index.upsert(9999, 37.4984, 127.0322)
+    assert index.nearest(37.4984, 127.0322, 100) == (9999, 0.0)
+
+
+# Per-ID distances follow the stored points and pending changes (inf for unknown IDs)
+# ID별 거리는 저장된 지점과 대기 중인 변경을 반영하며, 없는 ID는 inf입니다
+def test_distances_by_id():
+    points = _random_points(100)
+    index = GeoIndex("test")
+    index.load(points[::-1])
+    index.upsert(101, 37.4984, 127.0322)
+    index.remove(5)
+
+    ids = [7, 101, 5, 500, 1]
+    expected = [haversine_km(37.5, 127.0, lat, lon) for _, lat, lon in (points[6], (101, 37.4984, 127.0322))]
+    distances = index.distances(37.5, 127.0, ids)
+
+    assert np.allclose(distances[:2], expected)
+    assert np.isinf(distances[2]) and np.isinf(distances[3])
+    assert np.isclose(distances[4], haversine_km(37.5, 127.0, points[0][1], points[0][2]))
+
+
+# Upserts and removals are visible before and after compaction
+# 추가/삭제 내역은 병합 전후 모두 검색 결과에 반영되어야 합니다
+def test_incremental_updates():
+    index = GeoIndex("test")
+    index.load([(1, 37.4984, 127.0322), (2, 37.4990, 127.0330), (3, None, None)])
+
+    index.upsert(3, 37.4985, 127.0323)
+    index.remove(2)
+    index.upsert(1, 35.1796, 129.0756)
+
+    assert [i for i, _ in index.query_radius(37.4984, 127.0322, 1)] == [3]
+
+    index.compact()
+    assert index.stats()["pending_changes"] == 0
+    assert [i for i, _ in index.query_radius(37.4984, 127.0322, 1)] == [3]
+    assert [i for i, _ in index.query_radius(35.1796, 129.0756, 1)] == [1]
+
+
+# Committed restaurant writes reach the shared index without a reload
+# 커밋된 식당 변경은 재적재 없이 공유 인덱스에 반영되어야 합니다
+def test_restaurant_commits_update_index(sqlite_db, monkeypatch):
+    index = GeoIndex("restaurants")
+    index.load([])
+    monkeypatch.setattr(geo_index, "restaurant_geo_index", index)
+
+    restaurant = restaurant_model.Restaurant(
+        id=1, name="test", address="서울 강남구", phone="02-000-0000",
+        latitude=37.4984, longitude=127.0322, created_at=datetime.datetime.now()
+    )
+    sqlite_db.add(restaurant)
+    sqlite_db.commit()
+    assert [i for i, _ in index.query_radius(37.4984, 127.0322, 1)] == [1]
+
+    sqlite_db.delete(restaurant)
+    sqlite_db.commit()
+    assert index.query_radius(37.4984, 127.0322, 1) == []
+
+
+# Refreshes read the overlap window behind the (updated_at, id) watermark again, so rows committed late
+# with an older updated_at are picked up, and an idle refresh adds nothing
+# 갱신은 (updated_at, id) 워터마크 앞의 겹침 구간을 다시 읽으므로, 이전 updated_at으로 늦게 커밋된 행도
+# 반영되며, 변경이 없으면 아무것도 추가하지 않아야 합니다
+def test_refresh_rescans_overlap(sqlite_db, monkeypatch):
+    monkeypatch.setattr(geo_index, "restaurant_geo_index", GeoIndex("restaurants"))
+    now = datetime.datetime(2024, 1, 1)
+    for i in (1, 2, 3):
+        sqlite_db.add(restaurant_model.Restaurant(
+            id=i, name="test", address="서울 강남구", phone="02-000-0000",
+            latitude=37.4984, longitude=127.0322, created_at=now, updated_at=now
+        ))
+    sqlite_db.commit()
+
+    geo_index.load_restaurant_geo_index(sqlite_db)
+    geo_index.refresh_restaurant_geo_index(sqlite_db, overlap_seconds=10)
+    assert geo_index.restaurant_geo_index.stats()["pending_changes"] == 0
+
+    # Written by another process: no commit event, only the database row changes. Row 1 commits late
+    # with an updated_at before the watermark; row 3 is older than the overlap window.
+    # 다른 프로세스가 수정한 경우: 커밋 이벤트 없이 데이터베이스 행만 바뀝니다. 행 1은 워터마크보다
+    # 이전의 updated_at으로 늦게 커밋되고, 행 3은 겹침 구간보다 오래되었습니다
+    Restaurant = restaurant_model.Restaurant
+    for id, updated_at in ((1, now - datetime.timedelta(seconds=5)), (2, now + datetime.timedelta(seconds=1)),
+                           (3, now - datetime.timedelta(seconds=30))):
+        sqlite_db.execute(update(Restaurant).where(Restaurant.id == id)
+                          .values(latitude=35.1796, longitude=129.0756, updated_at=updated_at))
+    geo_index.refresh_restaurant_geo_index(sqlite_db, overlap_seconds=10)
+    assert sorted(i for i, _ in geo_index.restaurant_geo_index.query_radius(35.1796, 129.0756, 1)) == [1, 2]
+
+    geo_index.restaurant_geo_index.compact()
+    geo_index.refresh_restaurant_geo_index(sqlite_db, overlap_seconds=10)
+    assert geo_index.restaurant_geo_index.stats()["pending_changes"] == 0
+    assert geo_index.restaurant_geo_index.position(2) == (35.1796, 129.0756)
@@ -0,0 +1,67 @@
+import asyncio
+import threading
+import time
+
+from src.dependencies import geocode_cache, map
+
+"""
+PYTHONPATH=. pytest
+"""
+
+# Repeat forward geocodes of the same (normalized) address are served from the cache
+# 같은(정규화된) 주소를 다시 지오코딩하면 캐시에서 응답해야 합니다
+def test_forward_geocode_cached(vworld):
+    first = asyncio.run(map.get_coordinate_by_address("서울 강남구 강남대로 396"))
+    again = asyncio.run(map.get_coordinate_by_address("  서울  강남구 강남대로　396 "))
+
+    assert first == again
+    assert len(vworld) == 1
+    assert geocode_cache.geocode_cache.stats()["address"]["hit_rate"] == 0.5
+
+
+# Reverse geocodes within about 10 m share an entry; failed lookups are not cached
+# 약 10 m 이내의 역지오코딩은 같은 항목을 공유하며, 실패한 조회는 캐시하지 않습니다
+def test_reverse_geocode_cached(vworld):
+    asyncio.run(map.get_address_by_coordinate(127.03221, 37.49841))
+    asyncio.run(map.get_address_by_coordinate(127.03219, 37.49839))
+    asyncio.run(map.get_address_by_coordinate(127.0335, 37.4984))
+    assert len(vworld) == 2
+
+    asyncio.run(map.get_coordinate_by_address("없는 주소"))
+    asyncio.run(map.get_coordinate_by_address("없는 주소"))
+    assert len(vworld) == 4
+
+
+# Cache reads and writes run off the event loop thread
+# 캐시 읽기와 쓰기는 이벤트 루프 스레드 밖에서 실행되어야 합니다
+def test_cache_calls_off_event_loop(vworld, monkeypatch):
+    cache = geocode_cache.geocode_cache
+    threads = []
+    for name in ("get", "set"):
+        def record(*args, method=getattr(cache, name)):
+            threads.append(threading.current_thread())
+            return method(*args)
+        monkeypatch.setattr(cache, name, record)
+
+    asyncio.run(map.get_coordinate_by_address("서울 강남구 강남대로 396"))
+
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
+
+
+# Entries survive reopening the file and expire after the ttl
+# 항목은 파일을 다시 열어도 유지되며 ttl 이후 만료됩니다
+def test_persistence_and_expiry(tmp_path, monkeypatch):
+    path = str(tmp_path / "geocode.sqlite3")
+    cache = geocode_cache.GeocodeCache(path, ttl=60)
+    cache.set("address", "json:a", {"x": 1})
+    cache.close()
+
+    cache = geocode_cache.GeocodeCache(path, ttl=60)
+    assert cache.get("address", "json:a") == {"x": 1}
+
+    now = time.time()
+    monkeypatch.setattr(geocode_cache.time, "time", lambda: now + 61)
+    assert cache.get("address", "json:a") is None
+    assert cache.purge_expired() == 1
+    cache.close()
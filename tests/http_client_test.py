@@ -0,0 +1,76 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from src.core.http import HTTP_MAX_CONCURRENCY, HTTP_RETRIES
+from src.dependencies.http_client import HttpClient
+
+"""
+PYTHONPATH=. pytest
+"""
+
+# Transient 503 responses are retried until the upstream answers
+# 일시적인 503 응답은 외부 서비스가 응답할 때까지 재시도해야 합니다
+def test_retries_transient_errors():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        return httpx.Response(503 if len(attempts) <= HTTP_RETRIES else 200, json={"ok": True})
+
+    client = HttpClient(transport=httpx.MockTransport(handler))
+    try:
+        response = client.run(client.get("test", "https://example.com/api", params={"q": "1"}))
+    finally:
+        client.close()
+
+    assert response.status_code == 200
+    assert len(attempts) == HTTP_RETRIES + 1
+
+
+# Connection errors are retried and then raised
+# 연결 오류는 재시도 후 예외로 전달되어야 합니다
+def test_raises_after_retries():
+    def handler(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    client = HttpClient(transport=httpx.MockTransport(handler))
+    try:
+        with pytest.raises(httpx.ConnectError):
+            client.run(client.get("test", "https://example.com/api"))
+        stats = client.stats()[0]
+    finally:
+        client.close()
+
+    assert (stats["requests"], stats["retries"], stats["failures"]) == (HTTP_RETRIES + 1, HTTP_RETRIES, 1)
+
+
+# Requests from an async caller are limited to HTTP_MAX_CONCURRENCY at a time per upstream
+# 비동기 호출자의 요청은 외부 서비스별로 HTTP_MAX_CONCURRENCY 개까지만 동시에 실행되어야 합니다
+def test_bounded_concurrency():
+    lock = threading.Lock()
+    active = [0, 0]
+
+    async def handler(request):
+        with lock:
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+        await asyncio.sleep(0.01)
+        with lock:
+            active[0] -= 1
+        return httpx.Response(200)
+
+    client = HttpClient(transport=httpx.MockTransport(handler))
+
+    async def main():
+        return await asyncio.gather(*(client.get("test", "https://example.com/api") for _ in range(HTTP_MAX_CONCURRENCY * 3)))
+
+    try:
+        responses = asyncio.run(main())
+    finally:
+        client.close()
+
+    assert all(r.status_code == 200 for r in responses)
+    assert active[1] == HTTP_MAX_CONCURRENCY
@@ -0,0 +1,125 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from src.dependencies import predict
+from src.dependencies.inference_worker import InferenceWorker
+
+"""
+PYTHONPATH=. pytest
+"""
+
+# Stand-in model: the result of a row is (row * 10, count); batch sizes are recorded
+# 대체 모델: 행의 결과는 (행 * 10, count)이며, 배치 크기를 기록합니다
+class _Model:
+    def __init__(self, delay=0.0):
+        self.batches = []
+        self.delay = delay
+
+    def __call__(self, rows, counts):
+        self.batches.append(len(rows))
+        time.sleep(self.delay)
+        return [(row * 10, count) for row, count in zip(rows, counts)]
+
+
+@pytest.fixture
+def model():
+    return _Model(delay=0.01)
+
+
+# Concurrent requests are scored together and every caller gets its own result
+# 동시 요청은 함께 예측되며, 각 호출자는 자신의 결과를 받아야 합니다
+def test_concurrent_requests_are_batched(model):
+    worker = InferenceWorker("test", model, max_batch_size=16, max_wait_seconds=0.02)
+    try:
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            results = list(pool.map(lambda i: worker.predict(i, i % 3), range(64)))
+    finally:
+        worker.close()
+
+    assert results == [(i * 10, i % 3) for i in range(64)]
+    assert sum(model.batches) == 64
+    assert max(model.batches) <= 16 and len(model.batches) < 64
+
+    stats = worker.stats()
+    assert stats["rows"] == 64 and stats["batches"] == len(model.batches)
+    assert sum(stats["batch_size_histogram"].values()) == len(model.batches)
+
+
+# A lone request is scored after at most the wait time
+# 단독 요청은 최대 대기 시간 이후에 예측되어야 합니다
+def test_single_request_waits_briefly():
+    worker = InferenceWorker("test", _Model(), max_batch_size=16, max_wait_seconds=0.005)
+    try:
+        started = time.perf_counter()
+        assert worker.predict(1, 2) == (10, 2)
+        assert time.perf_counter() - started < 0.5
+    finally:
+        worker.close()
+
+
+# A failing batch raises the error to every caller in it and the worker keeps running
+# 실패한 배치의 오류는 해당 배치의 모든 호출자에게 전달되고, 워커는 계속 동작해야 합니다
+def test_errors_reach_every_caller():
+    failing = threading.Event()
+    failing.set()
+
+    def predict_rows(rows, counts):
+        if failing.is_set():
+            raise ValueError("model failed")
+        return rows
+
+    worker = InferenceWorker("test", predict_rows, max_batch_size=8, max_wait_seconds=0.02)
+    try:
+        futures = [worker.submit(i, 1) for i in range(4)]
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result(5)
+
+        failing.clear()
+        assert worker.predict(7, 1, timeout=5) == 7
+        assert worker.stats()["errors"] >= 1
+    finally:
+        worker.close()
+
+
+# Rows pinned to different artifacts are scored in separate calls, each with its own artifacts
+# 서로 다른 아티팩트에 고정된 행은 각자의 아티팩트로 따로 호출하여 예측해야 합니다
+def test_pinned_artifacts():
+    calls = []
+
+    def predict_rows(rows, counts, artifacts="active"):
+        calls.append((artifacts, len(rows)))
+        return [(row, artifacts) for row in rows]
+
+    worker = InferenceWorker("test", predict_rows, max_batch_size=16, max_wait_seconds=0.05)
+    try:
+        futures = [worker.submit(i, 1, ("v1", "v2", None)[i % 3]) for i in range(9)]
+        results = [f.result(5) for f in futures]
+    finally:
+        worker.close()
+
+    assert results == [(i, ("v1", "v2", "active")[i % 3]) for i in range(9)]
+    assert sorted(calls) == [("active", 3), ("v1", 3), ("v2", 3)]
+
+
+# Batched results with mixed counts equal the single-row predictions of the loaded model
+# count가 섞인 배치 결과는 로드된 모델의 단일 행 예측과 같아야 합니다
+def test_matches_direct_predictions():
+    rng = np.random.default_rng(0)
+    rows = [tuple(r) for r in np.round(rng.uniform([-10, 0, 0, 0, 990], [30, 20, 10, 5, 1030], (40, 5)), 1)]
+    worker = InferenceWorker("test", predict.predict_cuisine_types_by_weather_rows,
+                             max_batch_size=64, max_wait_seconds=0.02)
+    try:
+        futures = [worker.submit(row, 1 + i % 3) for i, row in enumerate(rows)]
+        results = [f.result(5) for f in futures]
+    finally:
+        worker.close()
+
+    for i, (row, result) in enumerate(zip(rows, results)):
+        expected = predict.predict_cuisine_types_by_weather_rows([row], 1 + i % 3)[0]
+        assert list(result) == list(expected)
+        assert all(abs(result[c]["probability"] - expected[c]["probability"]) < 1e-12 for c in expected)
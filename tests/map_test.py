@@ -0,0 +1,52 @@
+import numpy as np
+
+from src.dependencies import map
+
+"""
+PYTHONPATH=. pytest
+"""
+
+# Random points covering the KMA grid area (Korean peninsula and surrounding sea)
+# 기상청 격자 영역(한반도와 주변 해역)을 덮는 임의의 지점들
+def _random_coordinates(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(32.0, 44.0, n), rng.uniform(123.0, 132.0, n)
+
+
+# The array projection equals the exact scalar projection point by point
+# 배열 변환 결과는 스칼라 변환 결과와 지점마다 같아야 합니다
+def test_grids_match_scalar():
+    lat, lon = _random_coordinates(200_000)
+    x, y = map.get_grids_by_coordinates(lat, lon)
+
+    expected = [map._grid_by_coordinate(a, o) for a, o in zip(lat.tolist(), lon.tolist())]
+    assert x.tolist() == [e[0] for e in expected]
+    assert y.tolist() == [e[1] for e in expected]
+
+    # Known grid of Seoul (Jongno-gu) / 서울 종로구의 알려진 격자
+    assert map.get_grid_by_coordinate(37.5714, 126.9658) == (60, 127)
+
+
+# The inverse array projection equals the scalar one, including the axis special cases
+# 역변환 배열 결과는 축 위의 특수한 경우를 포함해 스칼라 결과와 같아야 합니다
+def test_coordinates_match_scalar():
+    xs, ys = np.meshgrid(np.arange(1, map.NX + 1), np.arange(1, map.NY + 1))
+    xs = np.append(xs.ravel(), [map.xo + 1, 10])
+    ys = np.append(ys.ravel(), [10, map.ro + map.yo + 1])
+
+    lat, lon = map.get_coordinates_by_grids(xs, ys)
+    expected = [map.get_coordinate_by_grid(x, y) for x, y in zip(xs.tolist(), ys.tolist())]
+
+    assert np.allclose(lat, [e[0] for e in expected], rtol=0, atol=1e-12)
+    assert np.allclose(lon, [e[1] for e in expected], rtol=0, atol=1e-12)
+
+
+# Memoized lookups return the projection of the rounded coordinates
+# 메모이즈된 조회는 반올림한 좌표의 변환 결과를 반환해야 합니다
+def test_scalar_fast_path():
+    lat, lon = 37.49841234567, 127.03224567891
+    assert map.get_grid_by_coordinate(lat, lon) == map._grid_by_coordinate(round(lat, 6), round(lon, 6))
+
+    hits = map._cached_grid_by_coordinate.cache_info().hits
+    map.get_grid_by_coordinate(lat, lon)
+    assert map._cached_grid_by_coordinate.cache_info().hits == hits + 1
@@ -1,6 +1,17 @@
+import os
+
+import joblib
 from fastapi.testclient import TestClient
+from sklearn.compose import ColumnTransformer
+from sklearn.preprocessing import StandardScaler
+from xgboost import XGBClassifier
 
 from src.app import app
+from src.dependencies import predict
+from src.dependencies.auth import create_access_token
+from src.dependencies.model_registry import LabeledClassifier, ModelRegistry
+
+from tests.predict_test import _train
 
 """
 PYTHONPATH=. pytest
@@ -46,3 +57,61 @@ def test_ml_in_restaurants():
     # Ensure the response is successful (HTTP 200)
     # 응답이 성공적으로 반환되었는지 확인합니다 (HTTP 200)
     assert response.status_code == 200
+
+# Batch predictions equal the single-row predictions and report their throughput
+# 일괄 예측 결과는 단일 행 예측과 같아야 하며 처리량을 함께 반환해야 합니다
+def test_batch_prediction_on_utilities():
+    rows = [
+        {'temperature': t, 'precipitation': p, 'cloudiness': 5.0, 'snowfall': 0.0, 'pressure': 1010.0}
+        for t in (-10.0, 0.0, 15.0, 30.0) for p in (0.0, 10.0)
+    ]
+
+    response = client.post("/utilities/predict_cuisine_type_by_weather/batch", json={'rows': rows, 'count': 3})
+    assert response.status_code == 200
+
+    body = response.json()
+    assert body['rows'] == len(rows) and body['rows_per_second'] > 0
+    for row, prediction in zip(rows, body['predictions']):
+        single = client.get("/utilities/predict_cuisine_type_by_weather", params={**row, 'count': 3}).json()
+        assert list(prediction) == list(single)
+        assert all(abs(prediction[c]['probability'] - single[c]['probability']) < 1e-12 for c in single)
+
+# Reloading an unknown model version is rejected and the active version keeps serving
+# 없는 모델 버전으로 다시 로드하면 거부되고 현재 버전이 계속 사용되어야 합니다
+def test_reload_unknown_model_version():
+    headers = {'Authorization': f"Bearer {create_access_token({'sub': 'admin'})}"}
+    response = client.post("/utilities/models/reload", params={'version': 'does-not-exist'}, headers=headers)
+    assert response.status_code == 404
+
+    response = client.get("/utilities/predict_cuisine_type_by_weather")
+    assert response.status_code == 200
+
+# Reloading requires a valid access token
+# 모델을 다시 로드하려면 유효한 액세스 토큰이 필요합니다
+def test_reload_requires_authentication():
+    response = client.post("/utilities/models/reload")
+    assert response.status_code == 401
+
+    response = client.post("/utilities/models/reload", headers={'Authorization': 'Bearer invalid'})
+    assert response.status_code == 401
+
+# An XGBoost model (float32 probabilities) is served by both prediction routes
+# XGBoost 모델(float32 확률)도 두 예측 라우트에서 정상적으로 응답해야 합니다
+def test_routes_with_xgboost_model(tmp_path, monkeypatch):
+    model, preprocessor = _train(XGBClassifier(n_estimators=5, max_depth=2),
+                                 ColumnTransformer([("num", StandardScaler(), predict.FEATURE_COLUMNS)]), 4)
+    os.makedirs(tmp_path / "xgb")
+    joblib.dump(LabeledClassifier(model, ["국밥", "냉면", "전", "찌개"]), tmp_path / "xgb" / "model.pkl")
+    joblib.dump(preprocessor, tmp_path / "xgb" / "preprocessor.pkl")
+    monkeypatch.setattr(predict, "model_registry",
+                        ModelRegistry(str(tmp_path), "xgb", prepare=predict.FastPredictor.from_artifacts))
+
+    response = client.get("/utilities/predict_cuisine_type_by_weather", params={'temperature': 30.0, 'count': 3})
+    assert response.status_code == 200
+    single = response.json()
+    assert len(single) == 3 and all(isinstance(p['probability'], float) for p in single.values())
+
+    response = client.post("/utilities/predict_cuisine_type_by_weather/batch",
+                           json={'rows': [{'temperature': 30.0}], 'count': 3})
+    assert response.status_code == 200
+    assert response.json()['predictions'] == [single]
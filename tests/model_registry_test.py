@@ -0,0 +1,133 @@
+import os
+import threading
+
+import joblib
+import pytest
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+
+from src.core import ml
+from src.dependencies import predict
+from src.dependencies.model_registry import ModelRegistry
+
+from tests.predict_test import _train
+
+"""
+PYTHONPATH=. pytest
+"""
+
+# Model directory with versions v1 (2 classes) and v2 (4 classes)
+# 버전 v1(클래스 2개)과 v2(클래스 4개)가 있는 모델 디렉터리
+@pytest.fixture
+def model_dir(tmp_path):
+    for version, n_classes in (("v1", 2), ("v2", 4)):
+        model, preprocessor = _train(
+            LogisticRegression(max_iter=500),
+            ColumnTransformer([("num", StandardScaler(), predict.FEATURE_COLUMNS)]),
+            n_classes,
+        )
+        os.makedirs(tmp_path / version)
+        joblib.dump(model, tmp_path / version / "model.pkl")
+        joblib.dump(preprocessor, tmp_path / version / "preprocessor.pkl")
+    return tmp_path
+
+
+# Nothing is loaded until the first use
+# 처음 사용하기 전에는 아무것도 로드하지 않아야 합니다
+def test_lazy_load(model_dir):
+    registry = ModelRegistry(str(model_dir), "v1", prepare=predict.FastPredictor.from_artifacts)
+    assert registry.stats()["active_version"] is None
+
+    artifacts = registry.get()
+    assert artifacts.version == "v1" and len(artifacts.model.classes_) == 2
+    assert registry.get() is artifacts
+    assert registry.stats()["prepared"] and registry.stats()["available_versions"] == ["v1", "v2"]
+
+
+# Reload swaps in the new version; readers holding the old artifacts keep a consistent set
+# 다시 로드하면 새 버전으로 교체되며, 이전 아티팩트를 가진 쪽은 일관된 묶음을 계속 사용합니다
+def test_hot_reload(model_dir):
+    registry = ModelRegistry(str(model_dir), "v1")
+    old = registry.get()
+
+    registry.reload("v2")
+    assert registry.get().version == "v2" and len(registry.get().model.classes_) == 4
+    assert old.version == "v1" and len(old.model.classes_) == 2
+
+
+# An unknown or broken version leaves the active one serving
+# 없거나 손상된 버전은 현재 버전을 그대로 유지해야 합니다
+def test_failed_reload_keeps_active(model_dir):
+    registry = ModelRegistry(str(model_dir), "v1")
+    registry.get()
+
+    with pytest.raises(FileNotFoundError):
+        registry.reload("v3")
+    with pytest.raises(FileNotFoundError):
+        registry.reload("../v1")
+
+    os.makedirs(model_dir / "broken")
+    (model_dir / "broken" / "model.pkl").write_text("not a pickle")
+    with pytest.raises(Exception):
+        registry.reload("broken")
+
+    assert registry.get().version == "v1"
+    assert registry.stats()["failures"] == 3
+
+
+# Every worker follows the version named in the CURRENT file
+# 모든 워커는 CURRENT 파일에 적힌 버전을 따라야 합니다
+def test_refresh_from_current_file(model_dir):
+    registry = ModelRegistry(str(model_dir))
+    with pytest.raises(RuntimeError):
+        registry.get()
+
+    (model_dir / "CURRENT").write_text("v1\n")
+    assert registry.get().version == "v1"
+
+    (model_dir / "CURRENT").write_text("v2")
+    registry.refresh()
+    assert registry.get().version == "v2"
+
+
+# A version activated by hand is written to the CURRENT file, so a refresh does not revert it
+# 직접 활성화한 버전은 CURRENT 파일에 기록되므로, 확인 주기에 되돌려지지 않아야 합니다
+def test_activate_survives_refresh(model_dir):
+    (model_dir / "CURRENT").write_text("v1\n")
+    registry = ModelRegistry(str(model_dir))
+    assert registry.get().version == "v1"
+
+    registry.activate("v2")
+    registry.refresh()
+    assert registry.get().version == "v2"
+    assert registry.current_version() == "v2"
+
+    with pytest.raises(FileNotFoundError):
+        registry.activate("v3")
+    assert registry.current_version() == "v2"
+
+
+# Artifact paths resolve for an explicit version, and are None (not an error) without any version
+# 아티팩트 경로는 지정한 버전으로 만들어지며, 버전이 없으면 오류 대신 None이어야 합니다
+def test_artifact_paths(model_dir, monkeypatch):
+    monkeypatch.setattr(ml, "ML_MODEL_VERSION", None)
+    assert ml.get_model_path() is None and ml.get_preprocessor_path() is None
+
+    assert ml.get_model_path("v1", str(model_dir)) == os.path.join(str(model_dir), "v1", "model.pkl")
+    assert ml.get_preprocessor_path("v1", str(model_dir)) == os.path.join(str(model_dir), "v1", "preprocessor.pkl")
+
+
+# Concurrent first calls load the model once
+# 동시에 처음 호출해도 모델은 한 번만 로드해야 합니다
+def test_concurrent_first_use(model_dir):
+    registry = ModelRegistry(str(model_dir), "v1")
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len({id(r) for r in results}) == 1
+    assert registry.stats()["loads"] == 1
@@ -0,0 +1,87 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from src.dependencies import naver_serach_keywords
+from src.dependencies.cache import TTLCache
+from src.dependencies.http_client import HttpClient
+
+"""
+PYTHONPATH=. pytest
+"""
+
+# Naver autocomplete stand-in answering after a short delay; "오류" fails
+# 잠시 후 응답하는 네이버 자동완성 대체 서비스이며, "오류"는 실패합니다
+@pytest.fixture
+def naver(monkeypatch):
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.05)
+        query = request.url.params["q"]
+        if query == "오류":
+            return httpx.Response(200, json={"error": "bad request"})
+        return httpx.Response(200, json={"query": [query], "items": [[[query + " 맛집"]]]})
+
+    client = HttpClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(naver_serach_keywords, "http_client", client)
+    monkeypatch.setattr(naver_serach_keywords, "naver_cache", TTLCache("test", ttl=None))
+    yield requests
+    client.close()
+
+
+def _gather(*queries):
+    async def run():
+        return await asyncio.gather(
+            *(naver_serach_keywords.get_naver_search_keywords(q) for q in queries), return_exceptions=True
+        )
+    return asyncio.run(run())
+
+
+# Concurrent and repeated requests for the same normalized query share one upstream call
+# 같은 정규화 검색어에 대한 동시 요청과 반복 요청은 외부 호출 하나를 공유해야 합니다
+def test_coalesced_and_cached(naver):
+    responses = _gather("국밥", " 국밥", "국밥  ", "국밥")
+    responses += _gather("국밥")
+
+    assert len(naver) == 1
+    assert all(r == {"query": ["국밥"], "items": [[["국밥 맛집"]]]} for r in responses)
+    assert naver_serach_keywords.naver_cache.stats()["waits"] == 3
+
+
+# Naver receives the query as typed; the normalized form is only the cache key
+# 네이버에는 입력한 검색어 그대로 보내며, 정규화한 검색어는 캐시 키로만 사용해야 합니다
+def test_original_query_sent(naver):
+    first = _gather("KFC  치킨")
+    second = _gather("kfc 치킨")
+
+    assert [r.url.params["q"] for r in naver] == ["KFC  치킨"]
+    assert second == first
+
+
+# Unexpected responses are returned but not cached
+# 예상하지 못한 응답은 반환하되 캐시하지 않아야 합니다
+def test_invalid_response_not_cached(naver):
+    _gather("오류")
+    _gather("오류")
+
+    assert len(naver) == 2
+
+
+# Distinct queries beyond the pending cap are rejected instead of queued
+# 진행 중인 요청 수 제한을 넘는 새로운 검색어는 대기하지 않고 거부되어야 합니다
+def test_pending_cap(naver, monkeypatch):
+    monkeypatch.setattr(naver_serach_keywords, "NAVER_MAX_PENDING_REQUESTS", 2)
+
+    responses = _gather("가", "나", "다", "라", "가")
+
+    rejected = [r for r in responses if isinstance(r, HTTPException)]
+    assert len(naver) == 2
+    assert rejected == responses[2:4] and all(r.status_code == 503 for r in rejected)
+    # The repeated query joins the call in flight instead of counting against the cap
+    # 반복된 검색어는 제한에 포함되지 않고 진행 중인 호출에 합류합니다
+    assert responses[4] == responses[0]
+    assert naver_serach_keywords.stats()["pending"] == 0
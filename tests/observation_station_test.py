@@ -0,0 +1,38 @@
+from src.dependencies.geo_index import haversine_km
+from src.dependencies.map import get_grid_by_coordinate
+from src.models import observation_station_model
+
+"""
+PYTHONPATH=. pytest
+"""
+
+# The nearest usable station within 25 km, with its precomputed grid
+# 25 km 이내에서 가장 가까운 사용 가능 관측소와 미리 계산된 격자 좌표
+def test_nearest_station(stations):
+    gangnam = (37.4984, 127.0322)
+    station = stations.get_nearest_observation_station(*gangnam)
+
+    assert station.os_id == 108
+    assert (station.nx, station.ny) == get_grid_by_coordinate(37.5714, 126.9658)
+
+    # Suwon is not usable, so a point next to it falls back to Seoul (~33 km) and finds nothing
+    # 수원은 사용 불가이므로 바로 옆 지점은 서울(약 33 km)까지 멀어져 결과가 없습니다
+    assert haversine_km(37.27, 126.99, 37.5714, 126.9658) > 25
+    assert stations.get_nearest_observation_station(37.27, 126.99) is None
+
+
+# Committed station changes are applied without a reload
+# 커밋된 관측소 변경은 재적재 없이 반영되어야 합니다
+def test_station_changes(sqlite_db, stations):
+    suwon = sqlite_db.get(observation_station_model.ObservationStation, 3)
+    suwon.is_usable = True
+    sqlite_db.commit()
+    assert stations.get_nearest_observation_station(37.27, 126.99).os_id == 119
+
+    # Between Seoul (~11 km) and Incheon (~20 km)
+    # 서울(약 11 km)과 인천(약 20 km) 사이
+    assert stations.get_nearest_observation_station(37.52, 126.85).os_id == 108
+    seoul = sqlite_db.get(observation_station_model.ObservationStation, 1)
+    sqlite_db.delete(seoul)
+    sqlite_db.commit()
+    assert stations.get_nearest_observation_station(37.52, 126.85).os_id == 112
@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+from xgboost import XGBClassifier
+
+from src.dependencies import predict
+from src.dependencies.cache import TTLCache
+from src.dependencies.inference_worker import InferenceWorker
+from src.dependencies.model_registry import ModelArtifacts
+
+"""
+PYTHONPATH=. pytest
+"""
+
+# Random weather rows in FEATURE_COLUMNS order
+# FEATURE_COLUMNS 순서의 임의 날씨 행
+def _weather(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.column_stack([rng.uniform(-15, 35, n), rng.exponential(3, n), rng.uniform(0, 10, n),
+                            rng.exponential(0.5, n), rng.uniform(990, 1030, n)])
+
+
+# Tiny preprocessor + model trained on synthetic labels (cold -> class 0, rainy -> class 1, ...)
+# 합성 레이블로 학습한 작은 전처리기와 모델 (추우면 클래스 0, 비가 오면 클래스 1, ...)
+def _train(model, preprocessor, n_classes):
+    X = _weather(2000, seed=1)
+    y = (X[:, 0] < 5) + 2 * (X[:, 1] > 3) if n_classes > 2 else (X[:, 0] < 5)
+    frame = pd.DataFrame(X, columns=predict.FEATURE_COLUMNS)
+    model.fit(preprocessor.fit_transform(frame), y.astype(int))
+    return model, preprocessor
+
+
+def _reference(model, preprocessor, features):
+    return model.predict_proba(preprocessor.transform(pd.DataFrame(features, columns=predict.FEATURE_COLUMNS)))
+
+
+PREPROCESSORS = {
+    "scaler": lambda: ColumnTransformer([("num", StandardScaler(), predict.FEATURE_COLUMNS)]),
+    "reordered": lambda: ColumnTransformer([
+        ("a", StandardScaler(with_mean=False), ["Pressure", "Temperature"]),
+        ("b", StandardScaler(), ["Cloudiness"]),
+    ], remainder="passthrough"),
+    "plain": lambda: StandardScaler(),
+}
+
+MODELS = {
+    "xgboost": lambda: XGBClassifier(n_estimators=20, max_depth=3, nthread=1),
+    "logistic": lambda: LogisticRegression(max_iter=500),
+}
+
+
+# The NumPy path gives exactly the probabilities of the DataFrame + ColumnTransformer path
+# NumPy 경로는 DataFrame + ColumnTransformer 경로와 정확히 같은 확률을 반환해야 합니다
+@pytest.mark.parametrize("preprocessor", PREPROCESSORS)
+@pytest.mark.parametrize("model", MODELS)
+@pytest.mark.parametrize("n_classes", [2, 4])
+def test_fast_path_parity(model, preprocessor, n_classes):
+    model, preprocessor = _train(MODELS[model](), PREPROCESSORS[preprocessor](), n_classes)
+    fast = predict.FastPredictor.from_artifacts(model, preprocessor)
+    features = _weather(500)
+
+    expected = _reference(model, preprocessor, features)
+    probs = fast.predict_proba(features)
+
+    assert np.array_equal(probs, expected)
+    assert np.array_equal(fast.predict_proba(features[:1]), _reference(model, preprocessor, features[:1]))
+
+
+# Preprocessors with other steps are not taken over by the fast path
+# 다른 단계가 있는 전처리기는 빠른 경로에서 처리하지 않습니다
+def test_unsupported_preprocessor():
+    from sklearn.preprocessing import MinMaxScaler
+    model, preprocessor = _train(LogisticRegression(), ColumnTransformer([("num", MinMaxScaler(), predict.FEATURE_COLUMNS)]), 2)
+    assert predict.FastPredictor.from_artifacts(model, preprocessor) is None
+
+
+# argpartition top-k equals a full stable argsort, ties included
+# argpartition 상위 k개는 동점을 포함해 전체 안정 정렬 결과와 같아야 합니다
+def test_top_k_matches_argsort():
+    rng = np.random.default_rng(0)
+    probs = np.round(rng.dirichlet(np.ones(12), 1000), 2)
+    for k in (1, 2, 5, 12, 20):
+        expected = np.argsort(-probs, axis=1, kind="stable")[:, :min(k, 12)]
+        assert np.array_equal(predict.top_k(probs, k), expected)
+
+
+# The loaded artifacts give the same ranking through both paths
+# 로드된 아티팩트는 두 경로에서 같은 순위를 반환해야 합니다
+def test_loaded_model_parity():
+    artifacts = predict.model_registry.get()
+    features = _weather(200)
+    expected = predict._predict_proba_with_preprocessor(artifacts, features)
+    assert np.array_equal(artifacts.prepared.predict_proba(features), expected)
+
+
+# Inputs equal at the sensor resolution share one prediction; count and model version are part of the key
+# 센서 분해능에서 같은 입력은 예측 하나를 공유하며, count와 모델 버전도 키에 포함됩니다
+def test_prediction_cache(monkeypatch):
+    cache = TTLCache("test", ttl=None)
+    monkeypatch.setattr(predict, "prediction_cache", cache)
+    calls = []
+    rows = predict.predict_cuisine_types_by_weather_rows
+    worker = InferenceWorker("test", lambda features, counts, **kwargs: calls.append(features) or rows(features, counts, **kwargs))
+    monkeypatch.setattr(predict, "inference_worker", worker)
+
+    first = predict.predict_cuisine_type_by_weather(12.34, 0.0, 3.0, 0.0, 1013.26)
+    again = predict.predict_cuisine_type_by_weather(12.3, 0.04, 3.0, 0.0, 1013.29)
+    assert again is first
+    assert calls == [[(12.3, 0.0, 3.0, 0.0, 1013.3)]]
+
+    predict.predict_cuisine_type_by_weather(12.3, 0.0, 3.0, 0.0, 1013.3, count=3)
+    predict.predict_cuisine_type_by_weather(12.4, 0.0, 3.0, 0.0, 1013.3)
+    assert len(calls) == 3
+    assert cache.stats()["hits"] == 1 and cache.stats()["hit_rate"] == 0.25
+
+    # The prediction equals the uncached one of the rounded inputs
+    # 예측 결과는 반올림한 입력의 캐시되지 않은 예측과 같아야 합니다
+    assert first == rows([[12.3, 0.0, 3.0, 0.0, 1013.3]], 2)[0]
+    worker.close()
+
+
+# The cache entry is scored with the artifacts whose version keys it, even when a reload lands in between
+# 그 사이에 모델이 다시 로드되더라도, 캐시 항목은 키의 버전과 같은 아티팩트로 예측되어야 합니다
+def test_prediction_cache_pins_artifacts(monkeypatch):
+    monkeypatch.setattr(predict, "prediction_cache", TTLCache("test", ttl=None))
+    registry = predict.model_registry
+    pinned = registry.get()
+    scored_with = []
+
+    def reload_before_scoring(features, counts, artifacts=None):
+        monkeypatch.setattr(registry, "_active", ModelArtifacts("reloaded", pinned.model, pinned.preprocessor,
+                                                                pinned.prepared, 0.0))
+        scored_with.append((artifacts or registry.get()).version)
+        return predict.predict_cuisine_types_by_weather_rows(features, counts, artifacts=artifacts)
+
+    worker = InferenceWorker("test", reload_before_scoring)
+    monkeypatch.setattr(predict, "inference_worker", worker)
+    try:
+        predict.predict_cuisine_type_by_weather(12.3, 0.0, 3.0, 0.0, 1013.3)
+    finally:
+        worker.close()
+
+    assert scored_with == [pinned.version]
+    assert [key[0] for key in predict.prediction_cache._entries] == [pinned.version]
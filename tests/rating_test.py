@@ -0,0 +1,100 @@
+import datetime
+
+from src.commands.rebuild_restaurant_ratings import rebuild_restaurant_ratings
+from src.dependencies.cache import TTLCache
+from src.models import restaurant_rating_model
+from src.schemas import review_schema
+from src.services import restaurant_service, review_service
+
+from tests.restaurant_test import _seed
+
+"""
+PYTHONPATH=. pytest
+"""
+
+# Reviews for restaurant 1 (ratings 5, 3), 2 (ratings 4, none) and 3 (rating 1)
+# 식당 1(평점 5, 3), 2(평점 4, 없음), 3(평점 1)에 대한 리뷰
+REVIEWS = [(1, 5), (1, 3), (2, 4), (2, None), (3, 1)]
+
+
+def _add_reviews(db):
+    for restaurant_id, rating in REVIEWS:
+        review = review_schema.ReviewCreate.model_construct(
+            title="리뷰", rating=rating, content="내용", author="작성자", restaurant_id=restaurant_id
+        )
+        review_service.add_review(review, db=db)
+
+
+def _summaries(db):
+    RestaurantRating = restaurant_rating_model.RestaurantRating
+    return {
+        r.restaurant_id: (r.review_count, r.rating_count, r.rating_sum, r.avg_rating)
+        for r in db.query(RestaurantRating).populate_existing()
+    }
+
+
+# Adding reviews updates the summary incrementally, and a rebuild gives the same numbers
+# 리뷰 추가 시 요약이 증분 갱신되며, 재계산 결과도 같아야 합니다
+def test_incremental_summary_matches_rebuild(sqlite_db):
+    _seed(sqlite_db)
+    _add_reviews(sqlite_db)
+
+    incremental = _summaries(sqlite_db)
+    assert incremental == {1: (2, 2, 8, 4.0), 2: (2, 1, 4, 4.0), 3: (1, 1, 1, 1.0)}
+
+    assert rebuild_restaurant_ratings(sqlite_db) == 3
+    assert _summaries(sqlite_db) == incremental
+
+    latest = sqlite_db.query(restaurant_rating_model.RestaurantRating).filter_by(restaurant_id=1).one()
+    assert latest.last_reviewed_at <= datetime.datetime.now()
+
+
+# Listings sort and filter by the summary; restaurants without reviews come last
+# 목록은 요약으로 정렬/필터링되며, 리뷰가 없는 식당은 마지막에 옵니다
+def test_order_and_filter_by_rating(sqlite_db):
+    _seed(sqlite_db)
+    _add_reviews(sqlite_db)
+
+    by_rating = restaurant_service.get_restaurants(order_by=restaurant_service.RestaurantOrderBy.rating,
+                                                   sort=restaurant_service.Sort.desc, limit=4, db=sqlite_db)
+    assert [r.id for r in by_rating] == [1, 2, 3, 4]
+    assert by_rating[0].rating.avg_rating == 4.0 and by_rating[3].rating is None
+
+    ascending = restaurant_service.get_restaurants(order_by=restaurant_service.RestaurantOrderBy.rating,
+                                                   sort=restaurant_service.Sort.asc, limit=3, db=sqlite_db)
+    assert [r.id for r in ascending] == [3, 1, 2]
+
+    rated = restaurant_service.get_restaurants(tags="주차", min_rating=3.5, db=sqlite_db)
+    assert [r.id for r in rated] == [1]
+
+
+# A new review invalidates cached listings, although its rating upsert bypasses the ORM
+# 평점 upsert는 ORM을 거치지 않지만, 새 리뷰는 캐시된 목록을 무효화해야 합니다
+def test_review_invalidates_restaurant_cache(sqlite_db, monkeypatch):
+    _seed(sqlite_db)
+    monkeypatch.setattr(restaurant_service, "restaurant_cache", TTLCache("restaurants"))
+
+    assert restaurant_service.get_cached_restaurants(min_rating=3.5, db=sqlite_db) == []
+
+    _add_reviews(sqlite_db)
+
+    rated = restaurant_service.get_cached_restaurants(min_rating=3.5, db=sqlite_db)
+    assert sorted(r.id for r in rated) == [1, 2]
+    assert restaurant_service.restaurant_cache.stats()["invalidations"] == len(REVIEWS)
+
+
+# A review whose summary row was written by another transaction (e.g. a concurrent first review)
+# increments that row instead of inserting a duplicate
+# 다른 트랜잭션(예: 동시에 들어온 첫 리뷰)이 만든 요약 행이 있으면 중복 삽입 대신 그 행을 증가시켜야 합니다
+def test_summary_upsert_after_concurrent_insert(sqlite_db):
+    _seed(sqlite_db)
+    sqlite_db.execute(restaurant_rating_model.RestaurantRating.__table__.insert().values(
+        restaurant_id=1, review_count=1, rating_count=1, rating_sum=5, avg_rating=5.0,
+        last_reviewed_at=datetime.datetime(2024, 1, 1), updated_at=datetime.datetime(2024, 1, 1)
+    ))
+    sqlite_db.commit()
+
+    _add_reviews(sqlite_db)
+
+    assert _summaries(sqlite_db)[1] == (3, 3, 13, 13 / 3)
+    assert _summaries(sqlite_db)[2] == (2, 1, 4, 4.0)
@@ -0,0 +1,143 @@
+import datetime
+
+from sqlalchemy import event
+
+from src.models import (
+    restaurant_model,
+    tag_model,
+    restaurant_tag_model,
+    cuisine_type_model,
+    restaurant_cuisine_type_model,
+    keyword_model,
+    restaurant_keyword_model
+)
+from src.schemas import restaurant_schema
+from src.services import restaurant_service
+
+"""
+PYTHONPATH=. pytest
+"""
+
+# Seed restaurants 1..n; odd IDs are tagged "주차", every third one serves "국밥" (category "한식"),
+# and every restaurant has the keyword "맛집"
+# 식당 1..n을 생성합니다. 홀수 ID는 "주차" 태그, 3의 배수 ID는 "국밥"(카테고리 "한식")을 가지며,
+# 모든 식당은 "맛집" 키워드를 가집니다
+def _seed(db, n=30):
+    now = datetime.datetime(2024, 1, 1)
+    db.add(tag_model.TagCategory(id=1, name="편의", created_at=now, updated_at=now))
+    db.add(tag_model.Tag(id=1, name="주차", tag_category_id=1, created_at=now, updated_at=now))
+    db.add(tag_model.Tag(id=2, name="포장", tag_category_id=1, created_at=now, updated_at=now))
+    db.add(cuisine_type_model.CuisineTypeCategory(id=1, name="한식", created_at=now, updated_at=now))
+    db.add(cuisine_type_model.CuisineType(id=1, name="국밥", cuisine_type_category_id=1, created_at=now, updated_at=now))
+    db.add(keyword_model.Keyword(id=1, name="맛집", created_at=now, updated_at=now))
+
+    for i in range(1, n + 1):
+        db.add(restaurant_model.Restaurant(
+            id=i, name=f"식당 {i}", address=f"서울 강남구 {i}", phone="02-000-0000",
+            latitude=37.4984, longitude=127.0322,
+            created_at=now, updated_at=now + datetime.timedelta(minutes=i)
+        ))
+        db.add(restaurant_keyword_model.RestaurantKeyword(restaurant_id=i, keyword_id=1))
+        if i % 2:
+            db.add(restaurant_tag_model.RestaurantTag(id=i, restaurant_id=i, tag_id=1))
+        if i % 3 == 0:
+            db.add(restaurant_cuisine_type_model.RestaurantCuisineType(restaurant_id=i, cuisine_type_id=1))
+    db.commit()
+
+
+# Collect SQL statements executed on the session's connection
+# 세션 연결에서 실행된 SQL 문을 수집합니다
+class _StatementCounter:
+    def __init__(self, db):
+        self.engine = db.get_bind()
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+
+# Statements issued for a page: the restaurants query, two per eager-loaded association
+# and one for the rating summary
+# 페이지당 실행되는 쿼리 수: 식당 조회 한 번, 즉시 로딩 연결 관계마다 두 번, 평점 요약 한 번
+PAGE_STATEMENTS = 1 + 2 * 3 + 1
+
+
+# Combined tag / category / type / area filters are resolved by the restaurants query itself
+# 태그/카테고리/유형/지역 필터를 함께 사용해도 식당 조회 쿼리 하나에서 처리되어야 합니다
+def test_filters_in_single_statement(sqlite_db):
+    _seed(sqlite_db)
+
+    with _StatementCounter(sqlite_db) as counter:
+        restaurants = restaurant_service.get_restaurants(
+            tags="주차,포장", cuisine_type_categories="한식", cuisine_types="국밥", area="강남구 2",
+            limit=100, db=sqlite_db
+        )
+
+    assert len(counter.statements) == PAGE_STATEMENTS
+    assert sum("FROM restaurants" in statement for statement in counter.statements) == 1
+
+    expected = {i for i in range(1, 31) if i % 2 or i % 3 == 0 or str(i).startswith("2")}
+    assert {r.id for r in restaurants} == expected
+
+
+# Filters that match nothing return an empty page
+# 일치하는 식당이 없는 필터는 빈 결과를 반환해야 합니다
+def test_filters_without_match(sqlite_db):
+    _seed(sqlite_db)
+
+    assert restaurant_service.get_restaurants(tags="없는태그", db=sqlite_db) == []
+
+
+# A page costs the same number of statements whatever its size, including serialization
+# 페이지 크기와 관계없이 직렬화까지 포함해 동일한 수의 쿼리만 실행되어야 합니다
+def test_restaurant_page_query_count(sqlite_db):
+    _seed(sqlite_db)
+
+    for limit in (2, 10, 30):
+        sqlite_db.expunge_all()
+
+        with _StatementCounter(sqlite_db) as counter:
+            restaurants = restaurant_service.get_restaurants(limit=limit, db=sqlite_db)
+            results = [restaurant_schema.RestaurantSearchResult.model_validate(r) for r in restaurants]
+
+        assert len(results) == limit
+        assert len(counter.statements) == PAGE_STATEMENTS
+        assert all(r.keywords[0].keyword.name == "맛집" for r in results)
+
+
+# Restaurant detail loads its relations in bulk as well
+# 식당 상세 조회도 관계를 일괄 로드해야 합니다
+def test_restaurant_detail_query_count(sqlite_db):
+    _seed(sqlite_db)
+    sqlite_db.expunge_all()
+
+    with _StatementCounter(sqlite_db) as counter:
+        restaurant = restaurant_service.get_restaurant_by_id(3, db=sqlite_db)
+        result = restaurant_schema.Restaurant.model_validate(restaurant)
+
+    assert len(counter.statements) == PAGE_STATEMENTS
+    assert [t.tag.name for t in result.tags] == ["주차"]
+    assert [c.cuisine_type.name for c in result.cuisine_types] == ["국밥"]
+
+
+# Batch lookup keeps the requested order, reports missing IDs and loads relations in bulk
+# 일괄 조회는 요청 순서를 유지하고, 없는 ID를 알려주며, 관계를 일괄 로드해야 합니다
+def test_restaurants_by_ids(sqlite_db):
+    _seed(sqlite_db)
+    sqlite_db.expunge_all()
+
+    with _StatementCounter(sqlite_db) as counter:
+        batch = restaurant_service.get_restaurants_by_ids("9,999,3,1,3", db=sqlite_db)
+        result = restaurant_schema.RestaurantBatch.model_validate(batch)
+
+    assert len(counter.statements) == PAGE_STATEMENTS
+    assert [r.id for r in result.restaurants] == [9, 3, 1]
+    assert result.missing_ids == [999]
+    assert [c.cuisine_type.name for c in result.restaurants[0].cuisine_types] == ["국밥"]
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from src.dependencies import predict, station_predictions, weather_observations
+from src.dependencies.model_registry import ModelArtifacts
+from src.services import restaurant_service
+
+from tests.weather_test import asos
+
+"""
+PYTHONPATH=. pytest
+"""
+
+SEOUL = (37.4984, 127.0322)
+
+
+# Prefetch every station once; the prefetch builds the prediction table
+# 모든 관측소를 한 번 사전 조회하며, 사전 조회가 예측 테이블을 구축합니다
+@pytest.fixture
+def table(asos):
+    asyncio.run(weather_observations.prefetch_observations())
+    return station_predictions._predictions
+
+
+# Every prefetched station gets the same prediction as the per-request path
+# 사전 조회한 모든 관측소는 요청별 경로와 같은 예측 결과를 가져야 합니다
+def test_table_matches_single_row_predictions(table, asos):
+    assert sorted(table) == [108, 112, 133]
+    assert station_predictions.stats()["stations"] == 3
+
+    observation = weather_observations.get_observation_by_coordinate(*SEOUL)
+    expected = predict.predict_cuisine_type_by_weather(*weather_observations.observation_features(observation))
+    prediction = station_predictions.get_predicted_cuisine_types(*SEOUL)
+
+    assert list(prediction) == list(expected)
+    assert [p["probability"] for p in prediction.values()] == pytest.approx([p["probability"] for p in expected.values()])
+    assert len(asos) == 3
+
+
+# Coordinate searches read the table without touching the observations or the model
+# 좌표 검색은 관측값이나 모델을 거치지 않고 테이블을 읽어야 합니다
+def test_search_reads_table(table, sqlite_db, monkeypatch):
+    def unexpected(*args):
+        raise AssertionError("per-request prediction path used")
+
+    monkeypatch.setattr(restaurant_service, "get_observation_by_coordinate", unexpected)
+    monkeypatch.setattr(restaurant_service, "predict_cuisine_type_by_weather", unexpected)
+
+    filters = restaurant_service._parse_filters(None, None, None, None, SEOUL[1], SEOUL[0], 1.0,
+                                                restaurant_service.FilterMatch.any, None, sqlite_db)
+    assert filters.cuisine_type_list == list(table[108][2])
+
+
+# Entries of another hour or model version are ignored and the search predicts per request
+# 다른 시간이나 다른 모델 버전의 항목은 무시되고, 검색은 요청별로 예측해야 합니다
+@pytest.mark.parametrize("stale", [
+    lambda hour, version, prediction: (("19700101", "00"), version, prediction),
+    lambda hour, version, prediction: (hour, "old", prediction),
+])
+def test_stale_entries_fall_back(table, sqlite_db, monkeypatch, stale):
+    table[108] = stale(*table[108])
+    monkeypatch.setattr(restaurant_service, "predict_cuisine_type_by_weather", lambda *args: {"국밥": {}})
+
+    assert station_predictions.get_predicted_cuisine_types(*SEOUL) is None
+    filters = restaurant_service._parse_filters(None, None, None, None, SEOUL[1], SEOUL[0], 1.0,
+                                                restaurant_service.FilterMatch.any, None, sqlite_db)
+    assert filters.cuisine_type_list == ["국밥"]
+
+
+# A reload while the table is built does not tag the old model's output with the new version
+# 테이블 구축 중에 모델이 다시 로드되어도, 이전 모델의 결과에 새 버전이 기록되지 않아야 합니다
+def test_build_uses_one_model_snapshot(table, monkeypatch):
+    registry = predict.model_registry
+    built_with = registry.get()
+    rows_function = station_predictions.predict_cuisine_types_by_weather_rows
+
+    def reload_during_build(*args, **kwargs):
+        monkeypatch.setattr(registry, "_active", ModelArtifacts("reloaded", built_with.model, built_with.preprocessor,
+                                                                built_with.prepared, 0.0))
+        return rows_function(*args, **kwargs)
+
+    monkeypatch.setattr(station_predictions, "predict_cuisine_types_by_weather_rows", reload_during_build)
+    station_predictions.build_station_predictions()
+
+    assert {version for _, version, _ in station_predictions._predictions.values()} == {built_with.version}
+    assert station_predictions.get_predicted_cuisine_types(*SEOUL) is None
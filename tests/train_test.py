@@ -0,0 +1,88 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.commands import train_cuisine_model
+from src.dependencies import predict
+from src.dependencies.model_registry import ModelRegistry
+
+from tests.predict_test import _weather
+
+"""
+PYTHONPATH=. pytest
+"""
+
+# Small CSV in the layout of weather_data_updated.csv, with a few incomplete rows
+# weather_data_updated.csv 형식의 작은 CSV로, 불완전한 행이 몇 개 포함됩니다
+@pytest.fixture
+def data_path(tmp_path):
+    X = _weather(600, seed=3)
+    labels = np.where(X[:, 0] < 5, "국밥", np.where(X[:, 1] > 3, "전", "냉면"))
+    frame = pd.DataFrame(X, columns=predict.FEATURE_COLUMNS)
+    frame["Category"] = labels
+    frame.loc[[1, 7], "Precipitation"] = np.nan
+    path = tmp_path / "weather.csv"
+    frame.to_csv(path, index=False)
+    return str(path)
+
+
+def _train(data_path, model_dir, **kwargs):
+    return train_cuisine_model.train_cuisine_model(
+        data_path=data_path, model_dir=str(model_dir), nthread=1, chunk_rows=100, n_estimators=20,
+        benchmark_rounds=20, benchmark_batch_rows=500, **kwargs
+    )
+
+
+# Streaming read keeps compact dtypes and drops incomplete rows
+# 스트리밍 읽기는 작은 dtype을 유지하고 불완전한 행을 제외해야 합니다
+def test_read_training_data(data_path):
+    frame = train_cuisine_model.read_training_data(data_path, chunk_rows=64)
+
+    assert len(frame) == 598
+    assert all(frame[c].dtype == np.float32 for c in predict.FEATURE_COLUMNS)
+    assert frame["Category"].dtype == "category"
+
+
+# A trained version is served by the registry through the fast path with string classes
+# 학습한 버전은 레지스트리에서 문자열 클래스와 함께 빠른 경로로 제공되어야 합니다
+def test_trained_version_is_servable(data_path, tmp_path):
+    model_dir = tmp_path / "models"
+    report = _train(data_path, model_dir, version="v2", activate=True)
+
+    assert sorted(os.listdir(model_dir)) == ["CURRENT", "v2"]
+    with open(model_dir / "v2" / "report.json") as f:
+        assert json.load(f) == report
+    assert report["data"]["rows"] == 598 and report["params"]["nthread"] == 1
+    assert report["accuracy"]["top2"] >= report["accuracy"]["top1"] > 0.8
+    assert report["fast_path"] and report["model_bytes"] > 0
+    assert report["single_row_ms"]["p50"] > 0 and report["batch"]["rows"] == 500
+
+    registry = ModelRegistry(str(model_dir), None, prepare=predict.FastPredictor.from_artifacts)
+    artifacts = registry.get()
+    assert artifacts.version == "v2"
+    assert artifacts.prepared is not None and artifacts.prepared.booster is not None
+    assert sorted(artifacts.model.classes_) == ["국밥", "냉면", "전"]
+
+    features = _weather(50, seed=4)
+    np.testing.assert_allclose(artifacts.prepared.predict_proba(features),
+                               predict._predict_proba_with_preprocessor(artifacts, features), rtol=1e-6)
+
+
+# Training is reproducible and never overwrites an existing version
+# 학습은 재현 가능해야 하며 기존 버전을 덮어쓰지 않아야 합니다
+def test_reproducible_and_no_overwrite(data_path, tmp_path):
+    first = _train(data_path, tmp_path, version="a")
+    second = _train(data_path, tmp_path, version="b")
+    assert first["accuracy"] == second["accuracy"]
+
+    registry = ModelRegistry(str(tmp_path), None)
+    features = _weather(20, seed=5)
+    np.testing.assert_array_equal(registry.reload("a").model.predict_proba(features),
+                                  registry.reload("b").model.predict_proba(features))
+
+    with pytest.raises(FileExistsError):
+        _train(data_path, tmp_path, version="a")
+    assert registry.versions() == ["a", "b"]
@@ -0,0 +1,129 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from src.dependencies import weather, weather_observations, station_predictions
+from src.dependencies.cache import TTLCache
+from src.dependencies.circuit_breaker import CircuitBreaker
+from src.dependencies.http_client import HttpClient
+from src.services import restaurant_service
+
+"""
+PYTHONPATH=. pytest
+"""
+
+# ASOS API stand-in: the temperature of each station is its number / 10
+# ASOS API 대체: 각 관측소의 기온은 관측소 번호 / 10
+def _asos(requests):
+    def handler(request):
+        requests.append(request)
+        os_id = int(request.url.params["stnIds"])
+        return httpx.Response(200, json={
+            "response": {
+                "header": {"resultCode": "00"},
+                "body": {"items": {"item": [{"ta": str(os_id / 10), "dsnw": "", "dc10Tca": "3", "pa": "1010.5"}]}},
+            }
+        })
+    return handler
+
+
+# Mocked HTTP client and empty caches for the weather modules
+# 날씨 모듈용 모의 HTTP 클라이언트와 빈 캐시
+@pytest.fixture
+def asos(stations, monkeypatch):
+    requests = []
+    client = HttpClient(transport=httpx.MockTransport(_asos(requests)))
+    monkeypatch.setattr(weather, "http_client", client)
+    monkeypatch.setattr(weather_observations, "http_client", client)
+    monkeypatch.setattr(weather, "DATA_GO_KR_API_URL_WDL", "https://example.com/asos")
+    monkeypatch.setattr(weather, "observation_cache", TTLCache("test", ttl=None))
+    monkeypatch.setattr(weather_observations, "_observations", {})
+    monkeypatch.setattr(station_predictions, "_predictions", {})
+    yield requests
+    client.close()
+
+
+# After the prefetch, searches read the weather without any request
+# 사전 조회 이후 검색은 요청 없이 날씨를 읽어야 합니다
+def test_prefetch_serves_searches_locally(asos):
+    asyncio.run(weather_observations.prefetch_observations())
+
+    assert sorted(int(r.url.params["stnIds"]) for r in asos) == [108, 112, 133]
+    assert weather_observations.stats()["succeeded"] == 3
+
+    observation = weather_observations.get_observation_by_coordinate(37.4984, 127.0322)
+    assert observation == {"ta": 10.8, "dsnw": 0.0, "dc10Tca": 3.0, "pa": 1010.5}
+    assert len(asos) == 3
+
+
+# Without a prefetch the nearest station is fetched once and then kept
+# 사전 조회가 없으면 가장 가까운 관측소를 한 번 조회한 뒤 보관해야 합니다
+def test_fetches_on_demand(asos):
+    for _ in range(3):
+        assert weather_observations.get_observation_by_coordinate(37.4777, 126.6249)["ta"] == 11.2
+    assert len(asos) == 1
+
+
+# During an outage searches get the last good observation, then nothing; a probe closes the circuit
+# 장애 중 검색은 마지막 정상 관측값을, 그다음에는 None을 받으며, 점검이 성공하면 회로가 닫혀야 합니다
+def test_circuit_breaker(asos, monkeypatch):
+    breaker = CircuitBreaker("test", failure_threshold=2)
+    monkeypatch.setattr(weather_observations, "weather_breaker", breaker)
+    seoul = (37.4984, 127.0322)
+
+    weather_observations.get_observation_by_coordinate(*seoul)
+    weather_observations._observations[108] = (("19700101", "00"), {"ta": 1.0, "dsnw": 0.0, "dc10Tca": 0.0, "pa": 0.0})
+    weather.observation_cache.clear()
+
+    outage = HttpClient(transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, json={"response": {"header": {"resultCode": "03"}, "body": {"items": ""}}})
+    ))
+    monkeypatch.setattr(weather, "http_client", outage)
+    try:
+        for _ in range(3):
+            assert weather_observations.get_observation_by_coordinate(*seoul)["ta"] == 1.0
+        assert weather_observations.get_observation_by_coordinate(37.4777, 126.6249) is None
+        stats = breaker.stats()
+        assert (stats["state"], stats["failures"], stats["short_circuits"]) == ("open", 2, 2)
+
+        weather_observations.probe_weather_upstream()
+        assert breaker.is_open
+    finally:
+        outage.close()
+
+    monkeypatch.setattr(weather, "http_client", weather_observations.http_client)
+    weather_observations.probe_weather_upstream()
+    assert not breaker.is_open
+    assert weather_observations.get_observation_by_coordinate(*seoul)["ta"] == 10.8
+
+
+# A search without any observation uses the configured default cuisine types
+# 관측값이 전혀 없는 검색은 설정된 기본 음식 유형을 사용해야 합니다
+def test_default_prediction(sqlite_db, monkeypatch):
+    monkeypatch.setattr(restaurant_service, "get_observation_by_coordinate", lambda *args: None)
+    monkeypatch.setattr(restaurant_service, "WEATHER_DEFAULT_CUISINE_TYPES", "국밥")
+
+    filters = restaurant_service._parse_filters(None, None, None, None, 127.0322, 37.4984, 1.0,
+                                                restaurant_service.FilterMatch.any, None, sqlite_db)
+    assert filters.cuisine_type_list == ["국밥"]
+
+
+# A slow API does not hold the search longer than WEATHER_REQUEST_TIMEOUT_SECONDS
+# 느린 API 때문에 검색이 WEATHER_REQUEST_TIMEOUT_SECONDS 이상 지연되지 않아야 합니다
+def test_slow_upstream_is_bounded(asos, monkeypatch):
+    async def slow(request):
+        await asyncio.sleep(2)
+        return httpx.Response(200)
+
+    slow_client = HttpClient(transport=httpx.MockTransport(slow))
+    monkeypatch.setattr(weather, "http_client", slow_client)
+    monkeypatch.setattr(weather_observations, "weather_breaker", CircuitBreaker("test"))
+    monkeypatch.setattr(weather_observations, "WEATHER_REQUEST_TIMEOUT_SECONDS", 0.1)
+    try:
+        started = time.perf_counter()
+        assert weather_observations.get_observation_by_coordinate(37.4984, 127.0322) is None
+        assert time.perf_counter() - started < 1
+    finally:
+        slow_client.close()